@@ -61,6 +61,9 @@ class SessionManager:
         # Conversation history
         self.messages = []
         
+        # Guards messages/stats against the auto-save thread
+        self._lock = threading.Lock()
+        
         # Session metadata
         self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
         self.start_time = datetime.now()
@@ -86,22 +89,23 @@ class SessionManager:
     
     def add_message(self, message):
         """Add a message to the conversation history"""
-        self.messages.append(message)
-        
-        # Update statistics
-        self.stats["total_messages"] += 1
-        if message.is_outgoing:
-            self.stats["outgoing_messages"] += 1
-        else:
-            self.stats["incoming_messages"] += 1
-        
-        # Update language statistics
-        if message.language not in self.stats["languages"]:
-            self.stats["languages"][message.language] = 0
-        self.stats["languages"][message.language] += 1
-        
-        # Update word count
-        self.stats["word_count"] += len(message.text.split())
+        with self._lock:
+            self.messages.append(message)
+            
+            # Update statistics
+            self.stats["total_messages"] += 1
+            if message.is_outgoing:
+                self.stats["outgoing_messages"] += 1
+            else:
+                self.stats["incoming_messages"] += 1
+            
+            # Update language statistics
+            if message.language not in self.stats["languages"]:
+                self.stats["languages"][message.language] = 0
+            self.stats["languages"][message.language] += 1
+            
+            # Update word count
+            self.stats["word_count"] += len(message.text.split())
         
         # Log message
         self.logger.debug(f"Added message: {message.text[:30]}...")
@@ -155,19 +159,8 @@ class SessionManager:
                 sessions_dir.mkdir(exist_ok=True, parents=True)
                 path = sessions_dir / f"session_{self.session_id}.json"
             
-            # Prepare data
-            session_data = {
-                "session_id": self.session_id,
-                "start_time": self.start_time.isoformat(),
-                "end_time": datetime.now().isoformat(),
-                "stats": self.stats,
-                "user_languages": self.user_languages,
-                "messages": [msg.to_dict() for msg in self.messages]
-            }
-            
             # Save to file
-            with open(path, 'w', encoding='utf-8') as f:
-                json.dump(session_data, f, indent=2, ensure_ascii=False)
+            self._write_session_json(path)
             
             self.logger.info(f"Session saved to {path}")
             return True
@@ -176,30 +169,59 @@ class SessionManager:
             self.logger.error(f"Error saving session: {e}")
             return False
     
+    def _write_session_json(self, path):
+        """Write the session as JSON, streaming messages one at a time"""
+        # Snapshot under the lock, the file write happens outside it
+        with self._lock:
+            header = {
+                "session_id": self.session_id,
+                "start_time": self.start_time.isoformat(),
+                "end_time": datetime.now().isoformat(),
+                "stats": dict(self.stats, languages=dict(self.stats["languages"])),
+                "user_languages": dict(self.user_languages)
+            }
+            messages = list(self.messages)
+        
+        # Header without its closing brace, messages are appended after it
+        header_json = json.dumps(header, indent=2, ensure_ascii=False)
+        
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(header_json[:-2])
+            f.write(',\n  "messages": [')
+            
+            separator = "\n    "
+            for msg in messages:
+                f.write(separator)
+                json.dump(msg.to_dict(), f, ensure_ascii=False)
+                separator = ",\n    "
+            
+            f.write("\n  ]\n}\n")
+    
     def load_session(self, path):
         """Load session from file"""
         try:
             with open(path, 'r', encoding='utf-8') as f:
                 session_data = json.load(f)
             
-            # Clear current session
-            self.messages = []
-            
-            # Load metadata
-            self.session_id = session_data.get("session_id", self.session_id)
-            
-            try:
-                self.start_time = datetime.fromisoformat(session_data.get("start_time", 
-                                                                        self.start_time.isoformat()))
-            except ValueError:
-                pass
-            
-            self.user_languages = session_data.get("user_languages", {})
-            self.stats = session_data.get("stats", self.stats)
+            # Parse messages before touching the current session
+            messages = [VoiceMessage.from_dict(msg_data)
+                        for msg_data in session_data.get("messages", [])]
             
-            # Load messages
-            for msg_data in session_data.get("messages", []):
-                self.messages.append(VoiceMessage.from_dict(msg_data))
+            with self._lock:
+                # Replace current session
+                self.messages = messages
+                
+                # Load metadata
+                self.session_id = session_data.get("session_id", self.session_id)
+                
+                try:
+                    self.start_time = datetime.fromisoformat(session_data.get("start_time",
+                                                                            self.start_time.isoformat()))
+                except ValueError:
+                    pass
+                
+                self.user_languages = session_data.get("user_languages", {})
+                self.stats = session_data.get("stats", self.stats)
             
             self.logger.info(f"Session loaded from {path} with {len(self.messages)} messages")
             return True
@@ -286,7 +308,7 @@ class SessionManager:
     def _export_html(self, path):
         """Export session as HTML document"""
         try:
-            from gaming_translator.utils.constants import GAMING_LANGUAGES, UI_COLORS
+            from gaming_translator.utils.constants import UI_COLORS, get_language_info
             
             with open(path, 'w', encoding='utf-8') as f:
                 # HTML header
@@ -396,8 +418,9 @@ class SessionManager:
                     speaker = "You" if msg.is_outgoing else "Teammate"
                     msg_class = "outgoing" if msg.is_outgoing else "incoming"
                     lang_code = msg.language
-                    lang_name = GAMING_LANGUAGES.get(lang_code, {}).get('name', lang_code)
-                    lang_flag = GAMING_LANGUAGES.get(lang_code, {}).get('flag', '🌐')
+                    lang_info = get_language_info(lang_code) or {}
+                    lang_name = lang_info.get('name', lang_code)
+                    lang_flag = lang_info.get('flag', '🌐')
                     
                     f.write(f"""
             <div class="message {msg_class}">
@@ -432,17 +455,7 @@ class SessionManager:
     def _export_json(self, path):
         """Export session as JSON file"""
         try:
-            session_data = {
-                "session_id": self.session_id,
-                "start_time": self.start_time.isoformat(),
-                "end_time": datetime.now().isoformat(),
-                "stats": self.stats,
-                "user_languages": self.user_languages,
-                "messages": [msg.to_dict() for msg in self.messages]
-            }
-            
-            with open(path, 'w', encoding='utf-8') as f:
-                json.dump(session_data, f, indent=2, ensure_ascii=False)
+            self._write_session_json(path)
             
             self.logger.info(f"Session exported as JSON to {path}")
             return True
@@ -464,7 +477,7 @@ class SessionManager:
                 self.logger.error("reportlab not installed, cannot export as PDF")
                 return False
             
-            from gaming_translator.utils.constants import GAMING_LANGUAGES
+            from gaming_translator.utils.constants import get_language_info
             
             # Create PDF document
             doc = SimpleDocTemplate(path, pagesize=letter)
@@ -532,7 +545,7 @@ class SessionManager:
                 speaker = "You" if msg.is_outgoing else "Teammate"
                 style = styles['MessageOutgoing'] if msg.is_outgoing else styles['MessageIncoming']
                 lang_code = msg.language
-                lang_name = GAMING_LANGUAGES.get(lang_code, {}).get('name', lang_code)
+                lang_name = (get_language_info(lang_code) or {}).get('name', lang_code)
                 
                 # Message paragraph
                 message_text = f"[{timestamp}] <b>{speaker}</b> ({lang_name}): {msg.text}"
@@ -626,17 +639,18 @@ class SessionManager:
     
     def clear(self):
         """Clear the session"""
-        self.messages = []
-        self.stats = {
-            "total_messages": 0,
-            "outgoing_messages": 0,
-            "incoming_messages": 0,
-            "languages": {},
-            "word_count": 0
-        }
-        
-        # Reset session ID and start time
-        self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
-        self.start_time = datetime.now()
+        with self._lock:
+            self.messages = []
+            self.stats = {
+                "total_messages": 0,
+                "outgoing_messages": 0,
+                "incoming_messages": 0,
+                "languages": {},
+                "word_count": 0
+            }
+            
+            # Reset session ID and start time
+            self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+            self.start_time = datetime.now()
         
         self.logger.info(f"Session cleared, new session ID: {self.session_id}")
\ No newline at end of file
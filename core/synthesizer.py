@@ -4,11 +4,28 @@ Voice synthesis module for text-to-speech capabilities
 
 import os
 import time
+import atexit
+import shutil
 import logging
 import threading
 import tempfile
+from collections import OrderedDict
 from abc import ABC, abstractmethod
 
+# Synthesized audio for this process, removed again at exit
+_audio_dir = None
+_audio_dir_lock = threading.Lock()
+
+
+def _get_audio_dir():
+    """Return the per-process directory that holds synthesized audio files"""
+    global _audio_dir
+    with _audio_dir_lock:
+        if _audio_dir is None:
+            _audio_dir = tempfile.mkdtemp(prefix="gvct_tts_")
+            atexit.register(shutil.rmtree, _audio_dir, ignore_errors=True)
+        return _audio_dir
+
 class VoiceSynthesizer(ABC):
     """Base voice synthesizer interface"""
     
@@ -22,6 +39,16 @@ class VoiceSynthesizer(ABC):
         """Speak the given text in the specified language"""
         pass
     
+    def speak_blocking(self, text, language="en"):
+        """Speak text and return once playback has finished"""
+        # Default implementation for backends without a synchronous path
+        self.speak_text(text, language)
+    
+    def stop(self):
+        """Stop any speech that is currently playing"""
+        # Default implementation - can be overridden by subclasses
+        pass
+    
     @staticmethod
     def create_synthesizer(config):
         """Factory method to create the appropriate synthesizer"""
@@ -90,6 +117,11 @@ class PyttsxSynthesizer(VoiceSynthesizer):
             daemon=True
         ).start()
     
+    def speak_blocking(self, text, language="en"):
+        """Speak text using pyttsx3 on the calling thread"""
+        if text:
+            self._speak_worker(text)
+    
     def _speak_worker(self, text):
         """Background thread for speaking"""
         try:
@@ -97,6 +129,13 @@ class PyttsxSynthesizer(VoiceSynthesizer):
             self.engine.runAndWait()
         except Exception as e:
             self.logger.error(f"pyttsx3 error: {e}")
+    
+    def stop(self):
+        """Interrupt the current utterance"""
+        try:
+            self.engine.stop()
+        except Exception as e:
+            self.logger.error(f"pyttsx3 stop error: {e}")
 
 
 class GTTSSynthesizer(VoiceSynthesizer):
@@ -110,6 +149,16 @@ class GTTSSynthesizer(VoiceSynthesizer):
             from gtts import gTTS
             import pygame
             
+            # Larger mixer buffers trade a little latency for no underruns
+            # while the UI thread is busy
+            self.buffer_size = config.get_int("tts", "buffer_size", 4096)
+            
+            # Synthesized audio files for recently spoken phrases
+            self._audio_cache = OrderedDict()
+            self._audio_cache_size = config.get_int("tts", "audio_cache_size", 32)
+            self._cache_lock = threading.Lock()
+            self._playing = set()
+            
             # Just ensure the imports work, actual initialization happens in speak_text
             pygame.mixer.init()
             pygame.mixer.quit()
@@ -130,41 +179,90 @@ class GTTSSynthesizer(VoiceSynthesizer):
             daemon=True
         ).start()
     
+    def speak_blocking(self, text, language="en"):
+        """Speak text using Google TTS on the calling thread"""
+        if text:
+            self._speak_worker(text, language)
+    
     def _speak_worker(self, text, language):
         """Background thread for speaking with Google TTS"""
+        cached = False
         try:
             from gtts import gTTS
             import pygame
             
-            # Create temporary file for audio
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.mp3') as temp_file:
-                temp_filename = temp_file.name
+            # Reuse audio for phrases spoken recently
+            cache_key = (text, language)
+            with self._cache_lock:
+                temp_filename = self._audio_cache.get(cache_key)
+                if temp_filename is not None:
+                    self._audio_cache.move_to_end(cache_key)
             
-            # Generate audio with gTTS
-            tts = gTTS(text=text, lang=language, slow=False)
-            tts.save(temp_filename)
+            cached = temp_filename is not None and os.path.exists(temp_filename)
+            if not cached:
+                # Create temporary file for audio
+                with tempfile.NamedTemporaryFile(delete=False, suffix='.mp3', dir=_get_audio_dir()) as temp_file:
+                    temp_filename = temp_file.name
+                
+                # Generate audio with gTTS
+                tts = gTTS(text=text, lang=language, slow=False)
+                tts.save(temp_filename)
+                
+                self._remember_audio(cache_key, temp_filename)
+                cached = True
             
-            # Play audio with pygame
-            pygame.mixer.init()
-            pygame.mixer.music.load(temp_filename)
-            pygame.mixer.music.play()
-            
-            # Wait for playback to finish
-            while pygame.mixer.music.get_busy():
-                time.sleep(0.1)
-            
-            # Clean up
-            pygame.mixer.quit()
-            os.unlink(temp_filename)
+            # Play audio with pygame, eviction leaves this file alone meanwhile
+            with self._cache_lock:
+                self._playing.add(temp_filename)
+            try:
+                pygame.mixer.init(buffer=self.buffer_size)
+                pygame.mixer.music.load(temp_filename)
+                pygame.mixer.music.play()
+                
+                # Wait for playback to finish
+                while pygame.mixer.music.get_busy():
+                    time.sleep(0.1)
+                
+                # Clean up, the audio file stays cached
+                pygame.mixer.quit()
+            finally:
+                with self._cache_lock:
+                    self._playing.discard(temp_filename)
             
         except Exception as e:
             self.logger.error(f"Google TTS error: {e}")
             
             # Clean up on error
-            try:
-                os.unlink(temp_filename)
-            except:
-                pass
+            if not cached:
+                try:
+                    os.unlink(temp_filename)
+                except:
+                    pass
+    
+    def _remember_audio(self, cache_key, filename):
+        """Cache a synthesized file, deleting the least recently used one when full"""
+        with self._cache_lock:
+            self._audio_cache[cache_key] = filename
+            self._audio_cache.move_to_end(cache_key)
+            
+            while len(self._audio_cache) > self._audio_cache_size:
+                _, old_filename = self._audio_cache.popitem(last=False)
+                if old_filename in self._playing:
+                    # Still playing, the exit cleanup removes it
+                    continue
+                try:
+                    os.unlink(old_filename)
+                except OSError:
+                    pass
+    
+    def stop(self):
+        """Stop playback, the speak worker then cleans up"""
+        try:
+            import pygame
+            if pygame.mixer.get_init():
+                pygame.mixer.music.stop()
+        except Exception as e:
+            self.logger.error(f"Google TTS stop error: {e}")
 
 
 class MultiLanguageVoiceSynthesizer(VoiceSynthesizer):
@@ -216,6 +314,20 @@ class MultiLanguageVoiceSynthesizer(VoiceSynthesizer):
         
         # Speak the text with the selected synthesizer
         synthesizer.speak_text(text, language)
+    
+    def speak_blocking(self, text, language="en"):
+        """Speak text with the synthesizer for the language, waiting for playback"""
+        if not text:
+            return
+        
+        synthesizer = self.language_synthesizers.get(language, self.default_synthesizer)
+        synthesizer.speak_blocking(text, language)
+    
+    def stop(self):
+        """Stop speech on every backend"""
+        synthesizers = {self.default_synthesizer, *self.language_synthesizers.values()}
+        for synthesizer in synthesizers:
+            synthesizer.stop()
 
 
 # Audio utilities
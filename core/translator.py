@@ -5,6 +5,7 @@ Supports multiple translation services including Google Translate and LibreTrans
 
 import logging
 import time
+from collections import OrderedDict
 from typing import Optional, Dict, Any
 from abc import ABC, abstractmethod
 
@@ -132,7 +133,7 @@ class CachedTranslator(BaseTranslator):
             base_translator = Translator.create_translator(config)
         
         self.base_translator = base_translator
-        self.cache = {}
+        self.cache = OrderedDict()
         self.cache_size = config.get_int("translation", "cache_size", 1000)
         
         self.logger.info("Cached translator initialized")
@@ -148,14 +149,17 @@ class CachedTranslator(BaseTranslator):
         # Check cache
         if cache_key in self.cache:
             self.logger.debug("Cache hit for translation")
+            self.cache.move_to_end(cache_key)
             return self.cache[cache_key]
         
         # Translate
         result = self.base_translator.translate_text(text, target_language, source_language)
         
-        # Cache result
-        if result and len(self.cache) < self.cache_size:
+        # Cache result, evicting the least recently used entry when full
+        if result and self.cache_size > 0:
             self.cache[cache_key] = result
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
         
         return result
     
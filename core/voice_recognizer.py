@@ -87,10 +87,34 @@ class BaseVoiceRecognizer(ABC):
         pass
     
     @abstractmethod
-    def stop_listening(self):
-        """Stop listening for voice input"""
+    def stop_listening(self, on_stopped: Optional[Callable[[], None]] = None):
+        """Stop listening for voice input
+        
+        Args:
+            on_stopped: Optional function called from a background thread once
+                the recognition thread has exited. When given, this method
+                returns without waiting.
+        """
         pass
     
+    def _join_recognition_thread(self, thread: Optional[threading.Thread], timeout: float,
+                                 on_stopped: Optional[Callable[[], None]] = None):
+        """Wait for the recognition thread, in the background if on_stopped is set"""
+        if on_stopped is None:
+            if thread:
+                thread.join(timeout=timeout)
+            return
+        
+        def wait_and_notify():
+            if thread:
+                thread.join(timeout=timeout)
+            try:
+                on_stopped()
+            except Exception as e:
+                self.logger.error(f"Error in stop callback: {e}")
+        
+        threading.Thread(target=wait_and_notify, daemon=True).start()
+    
     def set_sensitivity(self, sensitivity: float):
         """Set microphone sensitivity
         
@@ -136,11 +160,10 @@ class WhisperRecognizer(BaseVoiceRecognizer):
         self.logger.info(f"Started Whisper recognition on device {device_index}")
         return True
     
-    def stop_listening(self):
+    def stop_listening(self, on_stopped: Optional[Callable[[], None]] = None):
         """Stop Whisper recognition"""
         self.is_listening = False
-        if self.recognition_thread:
-            self.recognition_thread.join(timeout=1.0)
+        self._join_recognition_thread(self.recognition_thread, 1.0, on_stopped)
         self.logger.info("Stopped Whisper recognition")
     
     def _recognition_loop(self):
@@ -209,11 +232,10 @@ class GoogleRecognizer(BaseVoiceRecognizer):
             self.logger.error(f"Error starting Google recognition: {e}")
             return False
     
-    def stop_listening(self):
+    def stop_listening(self, on_stopped: Optional[Callable[[], None]] = None):
         """Stop Google recognition"""
         self.is_listening = False
-        if self.recognition_thread:
-            self.recognition_thread.join(timeout=2.0)
+        self._join_recognition_thread(self.recognition_thread, 2.0, on_stopped)
         self.logger.info("Stopped Google recognition")
     
     def _recognition_loop(self):
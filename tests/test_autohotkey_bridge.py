@@ -0,0 +1,48 @@
+"""
+Tests for the AutoHotkey bridge helpers
+"""
+
+import pytest
+
+from gaming_translator.utils.autohotkey_bridge import (
+    _DEFAULT_GAME_SETTINGS, _GAME_SETTINGS, _lookup_game_settings,
+    _single_line, _text_inputs, _user32, _utf16_units
+)
+
+class TestGameSettingsLookup:
+    """Test matching game names to chat key settings"""
+    
+    def test_exact_name(self):
+        """Test looking up a game by its exact name"""
+        assert _lookup_game_settings("valorant") is _GAME_SETTINGS["valorant"]
+    
+    def test_name_inside_window_title(self):
+        """Test that a game name inside a longer title still matches"""
+        settings = _lookup_game_settings("counter-strike 2 - competitive")
+        assert settings is _GAME_SETTINGS["counter-strike"]
+    
+    def test_unknown_game(self):
+        """Test that unknown games get the default settings"""
+        assert _lookup_game_settings("some other game") is _DEFAULT_GAME_SETTINGS
+
+class TestTextInputs:
+    """Test turning chat text into unicode key events"""
+    
+    def test_newlines_become_spaces(self):
+        """Test that line breaks cannot submit the message early"""
+        assert _single_line("gg\r\nwell played\n") == "gg  well played "
+    
+    def test_bmp_characters(self):
+        """Test that BMP characters are one code unit each"""
+        assert _utf16_units("gg é") == [0x67, 0x67, 0x20, 0xE9]
+    
+    def test_surrogate_pair(self):
+        """Test that characters outside the BMP are sent as a surrogate pair"""
+        assert _utf16_units("\U0001F600") == [0xD83D, 0xDE00]
+    
+    @pytest.mark.skipif(_user32 is None, reason="SendInput is only available on Windows")
+    def test_key_event_pairs(self):
+        """Test one key down and key up per code unit"""
+        inputs = _text_inputs(_single_line("a\n\U0001F600"))
+        
+        assert [event.u.ki.wScan for event in inputs] == [0x61, 0x61, 0x20, 0x20, 0xD83D, 0xD83D, 0xDE00, 0xDE00]
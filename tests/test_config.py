@@ -0,0 +1,187 @@
+"""
+Tests for the configuration manager
+"""
+
+import os
+import time
+
+import pytest
+
+from gaming_translator.utils.config import Config
+
+@pytest.fixture
+def config_path(tmp_path):
+    """Path for a config file that does not exist yet"""
+    return tmp_path / "config.ini"
+
+@pytest.fixture
+def config(config_path):
+    """Fresh configuration backed by a temporary file"""
+    return Config(config_path)
+
+class TestConfigValues:
+    """Test reading and writing values"""
+    
+    def test_defaults_loaded(self, config):
+        """Test that default values are available without a file"""
+        assert config.get("ui", "theme") == "dark"
+        assert config.get_int("overlay", "width") == 400
+        assert config.get_bool("ui", "always_on_top", True) is False
+    
+    def test_missing_value_uses_fallback(self, config):
+        """Test fallbacks for unknown sections and keys"""
+        assert config.get("missing", "key", "fallback") == "fallback"
+        assert config.get_int("ui", "missing", 9) == 9
+        assert config.get_float("ui", "missing", 1.5) == 1.5
+    
+    def test_set_creates_section(self, config):
+        """Test setting a value in a section that does not exist yet"""
+        config.set("new_section", "count", 5)
+        
+        assert config.has_section("new_section")
+        assert config.get("new_section", "count") == "5"
+        assert config.get_int("new_section", "count") == 5
+    
+    def test_keys_are_case_insensitive(self, config):
+        """Test that keys match regardless of case"""
+        config.set("ui", "Theme", "light")
+        
+        assert config.get("ui", "theme") == "light"
+        assert config.get("ui", "THEME") == "light"
+        assert config.has_option("ui", "tHeMe")
+    
+    def test_typed_getters_follow_updates(self, config):
+        """Test that cached typed values are refreshed after a set"""
+        config.set("ui", "font_size", 10)
+        assert config.get_int("ui", "font_size") == 10
+        
+        config.set("ui", "font_size", 12)
+        assert config.get_int("ui", "font_size") == 12
+    
+    def test_invalid_values_use_fallback(self, config):
+        """Test that unparsable typed values return the fallback"""
+        config.set("ui", "font_size", "abc")
+        config.set("ui", "always_on_top", "maybe")
+        
+        assert config.get_int("ui", "font_size", 3) == 3
+        assert config.get_bool("ui", "always_on_top", None) is None
+    
+    def test_remove(self, config):
+        """Test removing a key and a whole section"""
+        config.set("extra", "a", 1)
+        config.set("extra", "b", 2)
+        
+        config.remove("extra", "a")
+        assert not config.has_option("extra", "a")
+        assert config.get("extra", "b") == "2"
+        
+        config.remove("extra")
+        assert not config.has_section("extra")
+    
+    def test_update_from_dict(self, config):
+        """Test bulk updates, including new sections"""
+        config.update_from_dict({"ui": {"theme": "light"}, "extra": {"Enabled": True}})
+        
+        assert config.get("ui", "theme") == "light"
+        assert config.get_bool("extra", "enabled") is True
+    
+    def test_reset_to_defaults(self, config):
+        """Test that a reset drops custom sections and values"""
+        config.set("ui", "theme", "light")
+        config.set("extra", "a", 1)
+        
+        config.reset_to_defaults()
+        
+        assert config.get("ui", "theme") == "dark"
+        assert not config.has_section("extra")
+    
+    def test_section_view_is_read_only(self, config):
+        """Test that get_section returns a read-only view"""
+        section = config.get_section("ui")
+        
+        with pytest.raises(TypeError):
+            section["theme"] = "light"
+        assert config.get_section_copy("ui")["theme"] == "dark"
+
+class TestConfigPersistence:
+    """Test saving and loading the config file"""
+    
+    def test_save_and_reload(self, config, config_path):
+        """Test that saved values survive a reload"""
+        config.set("ui", "theme", "light")
+        config.set("extra", "count", 3)
+        
+        assert config.save()
+        
+        reloaded = Config(config_path)
+        assert reloaded.get("ui", "theme") == "light"
+        assert reloaded.get_int("extra", "count") == 3
+    
+    def test_save_is_atomic(self, config, config_path):
+        """Test that saving leaves no temporary file behind"""
+        assert config.save()
+        
+        assert config_path.exists()
+        assert not os.path.exists(str(config_path) + ".tmp")
+    
+    def test_clean_save_skips_write(self, config, config_path):
+        """Test that saving without changes does not rewrite the file"""
+        assert config.save()
+        mtime = os.stat(config_path).st_mtime_ns
+        time.sleep(0.01)
+        
+        assert config.save()
+        assert os.stat(config_path).st_mtime_ns == mtime
+    
+    def test_unchanged_set_keeps_config_clean(self, config, config_path):
+        """Test that setting a value to its current value is not a change"""
+        assert config.save()
+        mtime = os.stat(config_path).st_mtime_ns
+        time.sleep(0.01)
+        
+        config.set("ui", "theme", "dark")
+        assert config.save()
+        assert os.stat(config_path).st_mtime_ns == mtime
+    
+    def test_changed_set_rewrites_file(self, config, config_path):
+        """Test that a real change is written on the next save"""
+        assert config.save()
+        mtime = os.stat(config_path).st_mtime_ns
+        time.sleep(0.01)
+        
+        config.set("ui", "theme", "light")
+        assert config.save()
+        assert os.stat(config_path).st_mtime_ns != mtime
+    
+    def test_load_skips_unchanged_file(self, config, config_path):
+        """Test that load() does not re-parse a file that has not changed"""
+        assert config.save()
+        
+        # Only the parser is touched, a re-parse would overwrite it
+        config.config.set("ui", "theme", "in-memory")
+        config.load()
+        assert config.config.get("ui", "theme") == "in-memory"
+    
+    def test_load_rereads_after_change(self, config, config_path):
+        """Test that load() discards unsaved changes once memory differs from the file"""
+        assert config.save()
+        
+        config.set("ui", "theme", "unsaved")
+        config.load()
+        assert config.get("ui", "theme") == "dark"
+    
+    def test_percent_values_round_trip(self, config, config_path):
+        """Test that values with a bare % are stored without interpolation"""
+        config.set("translation", "custom_endpoint", "http://localhost/a%20b")
+        assert config.save()
+        
+        reloaded = Config(config_path)
+        assert reloaded.get("translation", "custom_endpoint") == "http://localhost/a%20b"
+    
+    def test_first_run_marker_persists(self, config, config_path):
+        """Test that completing the first run is saved"""
+        assert config.is_first_run()
+        
+        config.mark_first_run_complete()
+        
+        assert not Config(config_path).is_first_run()
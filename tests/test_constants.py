@@ -0,0 +1,77 @@
+"""
+Tests for the shared constants and lookup helpers
+"""
+
+import pytest
+
+from gaming_translator.utils import constants
+from gaming_translator.utils.constants import GAMING_LANGUAGES, get_language_info, tts_supported
+
+class TestLazyServiceTables:
+    """Test the service tables that are built on first access"""
+    
+    def test_tables_import_by_name(self):
+        """Test that the public names still import and hold their entries"""
+        from gaming_translator.utils.constants import (
+            RECOGNITION_ENGINES, TRANSLATION_SERVICES, TTS_ENGINES
+        )
+        
+        assert "whisper" in RECOGNITION_ENGINES
+        assert "google" in TRANSLATION_SERVICES
+        assert TTS_ENGINES["gtts"]["quality"] == "high"
+    
+    def test_table_built_once(self):
+        """Test that repeated access returns the same table"""
+        assert constants.TTS_ENGINES is constants.TTS_ENGINES
+        assert "TTS_ENGINES" in vars(constants)
+    
+    def test_shared_language_codes(self):
+        """Test that services share the one tuple of language codes"""
+        assert constants.TRANSLATION_SERVICES["google"]["supported_languages"] == tuple(GAMING_LANGUAGES)
+    
+    def test_unknown_attribute(self):
+        """Test that other missing names still raise AttributeError"""
+        with pytest.raises(AttributeError):
+            constants.NOT_A_CONSTANT
+
+class TestGetLanguageInfo:
+    """Test language lookups with regional fallback"""
+    
+    def test_known_code(self):
+        """Test that a listed code returns its own entry"""
+        assert get_language_info("en") is GAMING_LANGUAGES["en"]
+    
+    def test_listed_regional_code(self):
+        """Test that listed regional variants are not collapsed to the base"""
+        assert get_language_info("pt-br")["name"] == "Portuguese (Brazil)"
+    
+    def test_regional_fallback(self):
+        """Test that an unlisted regional variant falls back to its base language"""
+        assert get_language_info("fr-ca") is GAMING_LANGUAGES["fr"]
+    
+    def test_unknown_code(self):
+        """Test that unknown and empty codes return None"""
+        assert get_language_info("xx") is None
+        assert get_language_info("xx-yy") is None
+        assert get_language_info("") is None
+
+class TestTtsSupported:
+    """Test the text-to-speech availability check"""
+    
+    def test_supported_language(self):
+        """Test a language with TTS available"""
+        assert tts_supported("en") is True
+    
+    def test_unsupported_language(self):
+        """Test a language without TTS"""
+        assert tts_supported("et") is False
+    
+    def test_regional_fallback(self):
+        """Test that regional variants use their base language"""
+        assert tts_supported("en-gb") is True
+        assert tts_supported("et-ee") is False
+    
+    def test_unknown_code(self):
+        """Test that unknown codes are not supported"""
+        assert tts_supported("xx") is False
+        assert tts_supported("") is False
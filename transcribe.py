@@ -8,9 +8,12 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import threading
 import queue
+from collections import namedtuple
 import time
 import json
 import os
+import shutil
+import tempfile
 from datetime import datetime
 import logging
 
@@ -65,33 +68,37 @@ WARNING_COLOR = "#ff9500"
 ERROR_COLOR = "#ff3333"
 
 # Gaming languages with flags
-GAMING_LANGUAGES = {
-    'en': {'name': 'English', 'flag': '🇺🇸'},
-    'es': {'name': 'Spanish', 'flag': '🇪🇸'},
-    'pt': {'name': 'Portuguese', 'flag': '🇧🇷'},
-    'fr': {'name': 'French', 'flag': '🇫🇷'},
-    'de': {'name': 'German', 'flag': '🇩🇪'},
-    'it': {'name': 'Italian', 'flag': '🇮🇹'},
-    'ru': {'name': 'Russian', 'flag': '🇷🇺'},
-    'pl': {'name': 'Polish', 'flag': '🇵🇱'},
-    'tr': {'name': 'Turkish', 'flag': '🇹🇷'},
-    'ar': {'name': 'Arabic', 'flag': '🇸🇦'},
-    'zh': {'name': 'Chinese', 'flag': '🇨🇳'},
-    'ja': {'name': 'Japanese', 'flag': '🇯🇵'},
-    'ko': {'name': 'Korean', 'flag': '🇰🇷'},
-    'hi': {'name': 'Hindi', 'flag': '🇮🇳'},
-    'th': {'name': 'Thai', 'flag': '🇹🇭'},
-    'vi': {'name': 'Vietnamese', 'flag': '🇻🇳'},
-    'sv': {'name': 'Swedish', 'flag': '🇸🇪'},
-    'da': {'name': 'Danish', 'flag': '🇩🇰'},
-    'no': {'name': 'Norwegian', 'flag': '🇳🇴'},
-    'fi': {'name': 'Finnish', 'flag': '🇫🇮'},
-    'nl': {'name': 'Dutch', 'flag': '🇳🇱'},
-    'cs': {'name': 'Czech', 'flag': '🇨🇿'},
-    'hu': {'name': 'Hungarian', 'flag': '🇭🇺'},
-    'ro': {'name': 'Romanian', 'flag': '🇷🇴'},
-    'uk': {'name': 'Ukrainian', 'flag': '🇺🇦'}
-}
+Lang = namedtuple("Lang", "code name flag")
+
+LANGUAGES = (
+    Lang('en', 'English', '🇺🇸'),
+    Lang('es', 'Spanish', '🇪🇸'),
+    Lang('pt', 'Portuguese', '🇧🇷'),
+    Lang('fr', 'French', '🇫🇷'),
+    Lang('de', 'German', '🇩🇪'),
+    Lang('it', 'Italian', '🇮🇹'),
+    Lang('ru', 'Russian', '🇷🇺'),
+    Lang('pl', 'Polish', '🇵🇱'),
+    Lang('tr', 'Turkish', '🇹🇷'),
+    Lang('ar', 'Arabic', '🇸🇦'),
+    Lang('zh', 'Chinese', '🇨🇳'),
+    Lang('ja', 'Japanese', '🇯🇵'),
+    Lang('ko', 'Korean', '🇰🇷'),
+    Lang('hi', 'Hindi', '🇮🇳'),
+    Lang('th', 'Thai', '🇹🇭'),
+    Lang('vi', 'Vietnamese', '🇻🇳'),
+    Lang('sv', 'Swedish', '🇸🇪'),
+    Lang('da', 'Danish', '🇩🇰'),
+    Lang('no', 'Norwegian', '🇳🇴'),
+    Lang('fi', 'Finnish', '🇫🇮'),
+    Lang('nl', 'Dutch', '🇳🇱'),
+    Lang('cs', 'Czech', '🇨🇿'),
+    Lang('hu', 'Hungarian', '🇭🇺'),
+    Lang('ro', 'Romanian', '🇷🇴'),
+    Lang('uk', 'Ukrainian', '🇺🇦')
+)
+
+CODE_TO_LANG = {lang.code: lang for lang in LANGUAGES}
 
 class VoiceMessage:
     def __init__(self, text, language, is_outgoing=False, translation=None):
@@ -161,9 +168,56 @@ class VoiceRecognizer:
         except sr.RequestError as e:
             logger.error(f"Speech recognition error: {e}")
 
+class RateLimiter:
+    """Token bucket limiting calls to `rate` per `per` seconds"""
+    def __init__(self, rate=5, per=1.0):
+        self.rate = rate
+        self.per = per
+        self._tokens = float(rate)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.rate, self._tokens + (now - self._last_refill) * self.rate / self.per)
+                self._last_refill = now
+                
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                
+                wait = (1 - self._tokens) * self.per / self.rate
+            time.sleep(wait)
+    
+    def __enter__(self):
+        self.acquire()
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+def _is_rate_limited_error(error):
+    """googletrans reports throttling as a 429 or as an unparseable (HTML) response"""
+    if isinstance(error, json.JSONDecodeError):
+        return True
+    message = str(error)
+    return "429" in message or "Too Many Requests" in message
+
 class VoiceTranslator:
+    MAX_BACKOFF = 30
+    
     def __init__(self):
         self.translator = Translator() if TRANSLATE_AVAILABLE else None
+        self._rl = RateLimiter(rate=5, per=1.0)
+        self._backoff_attempts = 0
+    
+    def _backoff(self):
+        delay = min(2 ** self._backoff_attempts, self.MAX_BACKOFF)
+        self._backoff_attempts += 1
+        logger.warning(f"Translation service throttled, backing off {delay}s")
+        time.sleep(delay)
     
     def translate_text(self, text, target_lang, source_lang=None):
         if not self.translator:
@@ -171,16 +225,23 @@ class VoiceTranslator:
         
         try:
             if not source_lang:
-                detection = self.translator.detect(text)
+                with self._rl:
+                    detection = self.translator.detect(text)
                 source_lang = detection.lang
             
             if source_lang == target_lang:
                 return text
             
-            result = self.translator.translate(text, src=source_lang, dest=target_lang)
+            with self._rl:
+                result = self.translator.translate(text, src=source_lang, dest=target_lang)
+            self._backoff_attempts = 0
             return result.text
-            
+        
         except Exception as e:
+            if _is_rate_limited_error(e):
+                self._backoff()
+                # Keep the overlay updating with the untranslated text
+                return text
             logger.error(f"Translation error: {e}")
             return None
     
@@ -189,9 +250,12 @@ class VoiceTranslator:
             return "en"
         
         try:
-            detection = self.translator.detect(text)
+            with self._rl:
+                detection = self.translator.detect(text)
             return detection.lang
         except Exception as e:
+            if _is_rate_limited_error(e):
+                self._backoff()
             logger.error(f"Language detection error: {e}")
             return "en"
 
@@ -345,6 +409,9 @@ class GamingOverlay:
             self.show_overlay()
     
     def add_message(self, message):
+        # Every message passes through here, log it even while the overlay is closed
+        self.parent_app.record_message(message)
+        
         if not self.overlay:
             return
         
@@ -415,7 +482,15 @@ class GamingVoiceTranslatorApp:
         self.target_language = "es"
         self.auto_detect = True
         self.selected_device = None
-        self.conversation_history = []
+        
+        # Messages are streamed to a rolling JSONL file instead of kept in memory,
+        # a fresh file per run so an earlier conversation never leaks in
+        self._jsonl = tempfile.NamedTemporaryFile(
+            "w", prefix="gvct_", suffix=".jsonl", delete=False,
+            buffering=1, encoding="utf-8"
+        )
+        self._jsonl_path = self._jsonl.name
+        self._recorded_count = 0
         
         # Setup UI and events
         self.setup_ui()
@@ -607,7 +682,7 @@ class GamingVoiceTranslatorApp:
         tk.Label(lang_grid, text="Your Language:", bg=CARD_BG, fg=TEXT_COLOR,
                 font=("Segoe UI", 11, "bold")).grid(row=0, column=0, sticky=tk.W, padx=(0, 10))
         
-        my_lang_options = [f"{info['flag']} {info['name']}" for code, info in GAMING_LANGUAGES.items()]
+        my_lang_options = [f"{lang.flag} {lang.name}" for lang in LANGUAGES]
         self.my_lang_var = tk.StringVar(value="🇺🇸 English")
         my_lang_combo = ttk.Combobox(lang_grid, textvariable=self.my_lang_var,
                                     values=my_lang_options, state="readonly", width=25)
@@ -719,6 +794,55 @@ class GamingVoiceTranslatorApp:
                                anchor=tk.W, padx=10, pady=5, relief=tk.SUNKEN)
         status_label.pack(fill=tk.X)
     
+    def record_message(self, message):
+        """Append a message to the rolling conversation log"""
+        try:
+            self._jsonl.write(json.dumps({
+                "t": message.timestamp.isoformat(),
+                "lang": message.language,
+                "text": message.text,
+                "tr": message.translation,
+                "out": message.is_outgoing
+            }, ensure_ascii=False) + "\n")
+            self._recorded_count += 1
+        except Exception as e:
+            logger.error(f"Failed to log message: {e}")
+    
+    def save_conversation(self):
+        """Save the conversation by copying the rolling JSONL log"""
+        if not self._recorded_count:
+            messagebox.showinfo("Save Conversation", "No messages have been recorded yet.")
+            return
+        
+        filename = filedialog.asksaveasfilename(
+            defaultextension=".jsonl",
+            filetypes=[("JSON Lines files", "*.jsonl"), ("All files", "*.*")],
+            title="Save Conversation"
+        )
+        if not filename:
+            return
+        
+        try:
+            self._jsonl.flush()
+            shutil.copy(self._jsonl_path, filename)
+            self.update_status(f"Conversation saved to {filename}")
+        except Exception as e:
+            logger.error(f"Failed to save conversation: {e}")
+            messagebox.showerror("Error", f"Failed to save conversation: {e}")
+    
+    def on_close(self):
+        """Stop listening, close the conversation log and exit"""
+        self.voice_recognizer.stop_listening()
+        self.overlay.hide_overlay()
+        
+        try:
+            self._jsonl.close()
+            os.unlink(self._jsonl_path)
+        except OSError:
+            pass
+        
+        self.root.destroy()
+    
     def setup_hotkeys(self):
         try:
             self.root.bind('<Control-l>', lambda e: self.toggle_listening())
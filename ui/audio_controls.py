@@ -5,15 +5,87 @@ Enhanced audio controls with device selection, volume controls, and level monito
 import tkinter as tk
 from tkinter import ttk
 import logging
+import threading
+import time
 from typing import Callable, Optional, List, Dict, Any
 
+from gaming_translator.utils.constants import UI_COLORS
+from gaming_translator.core.voice_recognizer import list_audio_devices
+
+
+# Process-wide cache of enumerated audio devices. Enumeration is slow, so the
+# list is only rebuilt after the cache is invalidated ("gen" counts invalidations).
+_DEVICE_CACHE = {"gen": 0, "list": None}
+_DEVICE_CACHE_LOCK = threading.Lock()
+
+
+def _get_audio_devices() -> List[Dict[str, Any]]:
+    """Return the cached audio device list, enumerating devices on a miss
+    
+    Safe to call from worker threads.
+    """
+    with _DEVICE_CACHE_LOCK:
+        devices = _DEVICE_CACHE["list"]
+        gen = _DEVICE_CACHE["gen"]
+    
+    if devices is not None:
+        return devices
+    
+    devices = list_audio_devices()
+    
+    # Don't publish a result that was invalidated while enumerating
+    with _DEVICE_CACHE_LOCK:
+        if _DEVICE_CACHE["gen"] == gen:
+            _DEVICE_CACHE["list"] = devices
+    
+    return devices
+
+
+_DEVICE_NAME_FORMAT = "{}: {}".format
+
+
+def _device_display_name(device: Dict[str, Any]) -> str:
+    """Combobox label for a device, formatted once and kept on the device dict"""
+    display = device.get('_display')
+    if display is None:
+        display = device['_display'] = _DEVICE_NAME_FORMAT(device['index'], device['name'])
+    return display
+
+
+# Level meter strings, precomputed for every bar count and status.
+# Index with bars * len(_LEVEL_STATUSES) + status.
+_METER_BARS = 10
+_LEVEL_STATUSES = ("No input", "Input detected", "Recording")
+_METER_STRINGS = tuple(
+    f"{'■' * bars}{'□' * (_METER_BARS - bars)} ({status})"
+    for bars in range(_METER_BARS + 1)
+    for status in _LEVEL_STATUSES
+)
+
+
+def invalidate_device_cache():
+    """Force the next device lookup to re-enumerate the audio devices"""
+    with _DEVICE_CACHE_LOCK:
+        _DEVICE_CACHE["gen"] += 1
+        _DEVICE_CACHE["list"] = None
+
 
 class EnhancedAudioSection(tk.Frame):
     """Enhanced audio section with device selection and volume controls"""
     
+    # Minimum interval between level meter redraws (~20 Hz)
+    LEVEL_REFRESH_MS = 50
+    
+    # Volume sliders snap to 1/VOLUME_STEPS increments
+    VOLUME_STEPS = 10
+    
+    # First-order IIR coefficient applied to incoming levels (0-1, higher reacts faster)
+    LEVEL_SMOOTHING = 0.3
+    
     def __init__(self, parent, device_change_callback: Callable = None,
                  input_volume_callback: Callable = None,
-                 output_volume_callback: Callable = None):
+                 output_volume_callback: Callable = None,
+                 debounce_ms: int = 120):
         """Initialize the enhanced audio section
         
         Args:
@@ -21,6 +93,7 @@ class EnhancedAudioSection(tk.Frame):
             device_change_callback: Callback for device changes
             input_volume_callback: Callback for input volume changes
             output_volume_callback: Callback for output volume changes
+            debounce_ms: Delay used to coalesce volume slider events
         """
         super().__init__(parent)
         
@@ -31,25 +104,67 @@ class EnhancedAudioSection(tk.Frame):
         
         # Audio devices
         self.audio_devices = []
+        self._device_by_index = {}
+        self._last_device_names = None
+        self._devices_sig = None
         self.selected_device_index = None
+        self._device_change_after_id = None
         
         # Volume values
         self.input_volume = 0.8
         self.output_volume = 0.7
         
-        # Setup UI
-        self._setup_ui()
+        # Pending debounced volume callbacks
+        self.debounce_ms = debounce_ms
+        self._input_after_id = None
+        self._output_after_id = None
+        self._pending_input = None
+        self._pending_output = None
         
-        # Load audio devices
-        self._load_audio_devices()
+        # Programmatic slider writes are applied once per idle pass
+        self._pending_set_input = None
+        self._pending_set_output = None
+        self._set_input_after_id = None
+        self._set_output_after_id = None
+        
+        # While a slider is held only the local value is updated
+        self._input_dragging = False
+        self._output_dragging = False
+        
+        # Raw values last reported by the sliders
+        self._last_input_str = None
+        self._last_output_str = None
+        
+        # Index into _METER_STRINGS of the meter currently displayed
+        self._last_meter_key = None
+        
+        # Level meter smoothing and redraw throttling
+        self._level_ema = 0.0
+        self._pending_level = None
+        self._last_level_ts = 0.0
+        self._level_after_id = None
+        
+        self.configure(bg=UI_COLORS["BG_COLOR"])
+        
+        # Widgets and device enumeration are deferred until first shown
+        self._ui_built = False
+        self.bind("<Map>", self._lazy_setup_once)
         
         self.logger.info("Enhanced audio section initialized")
     
+    def _lazy_setup_once(self, event=None):
+        """Build the UI and load devices the first time the section is mapped"""
+        if self._ui_built:
+            return
+        
+        self._ui_built = True
+        self.unbind("<Map>")
+        
+        self._setup_ui()
+        self._load_audio_devices()
+    
     def _setup_ui(self):
         """Setup the audio controls UI"""
-        from gaming_translator.utils.constants import UI_COLORS
-        
-        self.configure(bg=UI_COLORS["BG_COLOR"])
         
         # Main audio frame
         audio_frame = tk.LabelFrame(
@@ -99,6 +214,12 @@ class EnhancedAudioSection(tk.Frame):
         refresh_btn.pack(side=tk.RIGHT, padx=(5, 0))
         
         # Volume controls section
+        ttk.Style(self).configure(
+            "Audio.Horizontal.TScale",
+            background=UI_COLORS["CARD_BG"],
+            troughcolor=UI_COLORS["BG_COLOR"]
+        )
+        
         volume_section = tk.Frame(audio_frame, bg=UI_COLORS["CARD_BG"])
         volume_section.pack(fill=tk.X, padx=10, pady=5)
         
@@ -114,19 +235,20 @@ class EnhancedAudioSection(tk.Frame):
             font=("Segoe UI", 10, "bold")
         ).pack(anchor=tk.W)
         
-        self.input_scale = tk.Scale(
+        self._input_var = tk.DoubleVar(value=self.input_volume)
+        self.input_scale = ttk.Scale(
             input_frame,
             from_=0.0,
             to=1.0,
-            resolution=0.1,
             orient=tk.HORIZONTAL,
-            bg=UI_COLORS["CARD_BG"],
-            fg=UI_COLORS["TEXT_COLOR"],
-            highlightthickness=0,
+            variable=self._input_var,
+            style="Audio.Horizontal.TScale",
             command=self._on_input_volume_change
         )
         self.input_scale.pack(fill=tk.X)
         self.input_scale.set(self.input_volume)
+        self.input_scale.bind("<ButtonPress-1>", self._on_input_drag_start)
+        self.input_scale.bind("<ButtonRelease-1>", self._on_input_drag_end)
         
         # Output volume
         output_frame = tk.Frame(volume_section, bg=UI_COLORS["CARD_BG"])
@@ -140,19 +262,20 @@ class EnhancedAudioSection(tk.Frame):
             font=("Segoe UI", 10, "bold")
         ).pack(anchor=tk.W)
         
-        self.output_scale = tk.Scale(
+        self._output_var = tk.DoubleVar(value=self.output_volume)
+        self.output_scale = ttk.Scale(
             output_frame,
             from_=0.0,
             to=1.0,
-            resolution=0.1,
             orient=tk.HORIZONTAL,
-            bg=UI_COLORS["CARD_BG"],
-            fg=UI_COLORS["TEXT_COLOR"],
-            highlightthickness=0,
+            variable=self._output_var,
+            style="Audio.Horizontal.TScale",
             command=self._on_output_volume_change
         )
         self.output_scale.pack(fill=tk.X)
         self.output_scale.set(self.output_volume)
+        self.output_scale.bind("<ButtonPress-1>", self._on_output_drag_start)
+        self.output_scale.bind("<ButtonRelease-1>", self._on_output_drag_end)
         
         # Audio level display
         level_section = tk.Frame(audio_frame, bg=UI_COLORS["CARD_BG"])
@@ -179,32 +302,89 @@ class EnhancedAudioSection(tk.Frame):
         level_label.pack(side=tk.LEFT, padx=(10, 0))
     
     def _load_audio_devices(self):
-        """Load available audio devices"""
+        """Load available audio devices without blocking the Tk main loop"""
+        cached = _DEVICE_CACHE["list"]
+        if cached is not None:
+            self._apply_devices(cached)
+            return
+        
+        # Keep showing the current list while a refresh enumerates
+        if self._devices_sig is None:
+            self.device_var.set("Loading devices...")
+        threading.Thread(target=self._bg_load_devices, daemon=True).start()
+    
+    def _bg_load_devices(self):
+        """Enumerate audio devices on a worker thread"""
+        try:
+            devices = _get_audio_devices()
+        except Exception as e:
+            self.logger.error(f"Error listing audio devices: {e}")
+            devices = None
+        
+        # Tk is not thread-safe, hand the result back to the main loop
+        try:
+            self.after(0, self._apply_devices, devices)
+        except (RuntimeError, tk.TclError):
+            # Widget destroyed before enumeration finished
+            pass
+    
+    def _apply_devices(self, devices: Optional[List[Dict[str, Any]]]):
+        """Populate the device combobox (Tk thread only)"""
         try:
-            from gaming_translator.core.voice_recognizer import list_audio_devices
+            if devices is None:
+                raise RuntimeError("device enumeration failed")
+            
+            # Nothing changed on the system, leave the widgets alone
+            sig = tuple((dev['index'], dev['name']) for dev in devices)
+            if sig == self._devices_sig:
+                return
             
-            self.audio_devices = list_audio_devices()
+            previous_index = self.selected_device_index
+            
+            self.audio_devices = devices
+            self._device_by_index = {dev['index']: dev for dev in devices}
             
             # Update combobox
-            device_names = [f"{dev['index']}: {dev['name']}" for dev in self.audio_devices]
-            self.device_combo['values'] = device_names
+            device_names = [_device_display_name(dev) for dev in self.audio_devices]
+            self._set_device_names(device_names)
             
-            # Select first device by default
-            if self.audio_devices:
+            if previous_index in self._device_by_index:
+                # Keep the current device selected across refreshes
+                position = next(
+                    pos for pos, dev in enumerate(self.audio_devices)
+                    if dev['index'] == previous_index
+                )
+                self.device_combo.current(position)
+            elif self.audio_devices:
+                # Select first device by default
                 self.device_combo.current(0)
                 self.selected_device_index = self.audio_devices[0]['index']
+                
+                # Only notify when the previously selected device disappeared
+                if previous_index is not None:
+                    self._notify_device_change()
             
+            self._devices_sig = sig
             self.logger.info(f"Loaded {len(self.audio_devices)} audio devices")
             
         except Exception as e:
             self.logger.error(f"Error loading audio devices: {e}")
             # Provide fallback
-            self.device_combo['values'] = ["0: Default Microphone"]
+            self._devices_sig = None
+            self._set_device_names(["0: Default Microphone"])
             self.device_combo.current(0)
             self.selected_device_index = 0
     
+    def _set_device_names(self, device_names: List[str]):
+        """Update the combobox values, skipping no-op Tcl writes"""
+        device_names = tuple(device_names)
+        if device_names != self._last_device_names:
+            self.device_combo['values'] = device_names
+            self._last_device_names = device_names
+    
     def _refresh_devices(self):
         """Refresh the list of audio devices"""
+        invalidate_device_cache()
         self._load_audio_devices()
         self.logger.info("Audio devices refreshed")
     
@@ -214,46 +394,193 @@ class EnhancedAudioSection(tk.Frame):
             selection = self.device_combo.current()
             if selection >= 0 and selection < len(self.audio_devices):
                 self.selected_device_index = self.audio_devices[selection]['index']
-                
-                if self.device_change_callback:
-                    self.device_change_callback(self.selected_device_index)
+                self._notify_device_change()
                 
                 self.logger.debug(f"Device changed to index {self.selected_device_index}")
                 
         except Exception as e:
             self.logger.error(f"Error changing device: {e}")
     
+    def _notify_device_change(self):
+        """Run the device change callback once Tk is idle
+        
+        The callback may reopen audio streams, so it is deferred to let the
+        combobox close and repaint first. Rapid changes collapse into a
+        single callback with the latest device.
+        """
+        if not self.device_change_callback:
+            return
+        
+        if self._device_change_after_id is not None:
+            self.after_cancel(self._device_change_after_id)
+        self._device_change_after_id = self.after_idle(self._flush_device_change)
+    
+    def _flush_device_change(self):
+        """Deliver the selected device to the device change callback"""
+        self._device_change_after_id = None
+        
+        try:
+            self.device_change_callback(self.selected_device_index)
+        except Exception as e:
+            self.logger.error(f"Error changing device: {e}")
+    
+    def _snap_volume(self, value) -> float:
+        """Round a raw slider value to the nearest volume step"""
+        return round(float(value) * self.VOLUME_STEPS) / self.VOLUME_STEPS
+    
     def _on_input_volume_change(self, value):
         """Handle input volume change"""
+        # Tk repeats the same value on pointer jitter, skip the parse
+        if value == self._last_input_str:
+            return
+        self._last_input_str = value
+        
         try:
-            self.input_volume = float(value)
+            # ttk.Scale reports every pixel, only react to whole steps
+            volume = self._snap_volume(value)
+            if volume == self.input_volume:
+                return
+            
+            self.input_volume = volume
+            
+            # Preview only while dragging, commit on release
+            if self._input_dragging:
+                return
             
-            if self.input_volume_callback:
-                self.input_volume_callback(self.input_volume)
+            self._pending_input = self.input_volume
+            
+            # Coalesce drag events into a single callback
+            if self._input_after_id is not None:
+                self.after_cancel(self._input_after_id)
+            self._input_after_id = self.after(self.debounce_ms, self._flush_input_volume)
                 
         except Exception as e:
             self.logger.error(f"Error changing input volume: {e}")
     
+    def _flush_input_volume(self):
+        """Deliver the latest input volume to the callback"""
+        self._input_after_id = None
+        volume = self._pending_input
+        self._pending_input = None
+        
+        try:
+            if volume is not None and self.input_volume_callback:
+                self.input_volume_callback(volume)
+        except Exception as e:
+            self.logger.error(f"Error changing input volume: {e}")
+    
+    def _on_input_drag_start(self, event=None):
+        """Start previewing input volume changes"""
+        self._input_dragging = True
+    
+    def _on_input_drag_end(self, event=None):
+        """Commit the input volume once the slider is released"""
+        self._input_dragging = False
+        
+        if self._input_after_id is not None:
+            self.after_cancel(self._input_after_id)
+        
+        self.input_volume = self._snap_volume(self.input_scale.get())
+        self._pending_input = self.input_volume
+        self._flush_input_volume()
+    
     def _on_output_volume_change(self, value):
         """Handle output volume change"""
+        # Tk repeats the same value on pointer jitter, skip the parse
+        if value == self._last_output_str:
+            return
+        self._last_output_str = value
+        
         try:
-            self.output_volume = float(value)
+            # ttk.Scale reports every pixel, only react to whole steps
+            volume = self._snap_volume(value)
+            if volume == self.output_volume:
+                return
+            
+            self.output_volume = volume
+            
+            # Preview only while dragging, commit on release
+            if self._output_dragging:
+                return
+            
+            self._pending_output = self.output_volume
             
-            if self.output_volume_callback:
-                self.output_volume_callback(self.output_volume)
+            # Coalesce drag events into a single callback
+            if self._output_after_id is not None:
+                self.after_cancel(self._output_after_id)
+            self._output_after_id = self.after(self.debounce_ms, self._flush_output_volume)
                 
         except Exception as e:
             self.logger.error(f"Error changing output volume: {e}")
     
+    def _flush_output_volume(self):
+        """Deliver the latest output volume to the callback"""
+        self._output_after_id = None
+        volume = self._pending_output
+        self._pending_output = None
+        
+        try:
+            if volume is not None and self.output_volume_callback:
+                self.output_volume_callback(volume)
+        except Exception as e:
+            self.logger.error(f"Error changing output volume: {e}")
+    
+    def _on_output_drag_start(self, event=None):
+        """Start previewing output volume changes"""
+        self._output_dragging = True
+    
+    def _on_output_drag_end(self, event=None):
+        """Commit the output volume once the slider is released"""
+        self._output_dragging = False
+        
+        if self._output_after_id is not None:
+            self.after_cancel(self._output_after_id)
+        
+        self.output_volume = self._snap_volume(self.output_scale.get())
+        self._pending_output = self.output_volume
+        self._flush_output_volume()
+    
     def set_input_volume(self, volume: float):
         """Set input volume programmatically"""
-        self.input_volume = max(0.0, min(1.0, volume))
-        self.input_scale.set(self.input_volume)
+        # Snap like the slider does so the Scale command sees no change
+        self.input_volume = self._snap_volume(max(0.0, min(1.0, volume)))
+        if not self._ui_built:
+            return
+        
+        self._pending_set_input = self.input_volume
+        if self._set_input_after_id is None:
+            self._set_input_after_id = self.after_idle(self._apply_input_set)
+    
+    def _apply_input_set(self):
+        """Push the last programmatic input volume to the slider"""
+        self._set_input_after_id = None
+        volume = self._pending_set_input
+        self._pending_set_input = None
+        
+        if volume is not None:
+            self._last_input_str = str(volume)
+            self.input_scale.set(volume)
     
     def set_output_volume(self, volume: float):
         """Set output volume programmatically"""
-        self.output_volume = max(0.0, min(1.0, volume))
-        self.output_scale.set(self.output_volume)
+        # Snap like the slider does so the Scale command sees no change
+        self.output_volume = self._snap_volume(max(0.0, min(1.0, volume)))
+        if not self._ui_built:
+            return
+        
+        self._pending_set_output = self.output_volume
+        if self._set_output_after_id is None:
+            self._set_output_after_id = self.after_idle(self._apply_output_set)
+    
+    def _apply_output_set(self):
+        """Push the last programmatic output volume to the slider"""
+        self._set_output_after_id = None
+        volume = self._pending_set_output
+        self._pending_set_output = None
+        
+        if volume is not None:
+            self._last_output_str = str(volume)
+            self.output_scale.set(volume)
     
     def get_input_volume(self) -> float:
         """Get current input volume"""
@@ -272,34 +599,75 @@ class EnhancedAudioSection(tk.Frame):
         if self.selected_device_index is None:
             return None
         
-        for device in self.audio_devices:
-            if device['index'] == self.selected_device_index:
-                return device
-        
-        return None
+        return self._device_by_index.get(self.selected_device_index)
     
     def update_audio_level(self, level: float):
         """Update the audio level display
         
+        Levels are smoothed with a first-order low-pass filter so noise
+        around a bar boundary doesn't make the meter flicker. Redraws are
+        throttled to LEVEL_REFRESH_MS; levels arriving in between are
+        coalesced and only the latest one is shown.
+        
         Args:
             level: Audio level from 0.0 to 1.0
         """
+        self._level_ema += self.LEVEL_SMOOTHING * (level - self._level_ema)
+        self._pending_level = self._level_ema
+        
+        # A scheduled flush will pick up the latest level
+        if self._level_after_id is not None:
+            return
+        
+        elapsed_ms = (time.monotonic() - self._last_level_ts) * 1000
+        if elapsed_ms >= self.LEVEL_REFRESH_MS:
+            self._flush_level()
+        else:
+            self._level_after_id = self.after(
+                int(self.LEVEL_REFRESH_MS - elapsed_ms), self._flush_level
+            )
+    
+    def _flush_level(self):
+        """Render the most recent audio level"""
+        self._level_after_id = None
+        level = self._pending_level
+        self._pending_level = None
+        
+        if level is None or not self._ui_built:
+            return
+        
+        self._last_level_ts = time.monotonic()
+        
         # Convert level to visual meter
-        bars = int(level * 10)
-        filled = "■" * bars
-        empty = "□" * (10 - bars)
+        bars = min(max(int(level * _METER_BARS), 0), _METER_BARS)
         
         if level > 0.1:
-            status = "Recording"
+            status = 2  # Recording
         elif level > 0.05:
-            status = "Input detected"
+            status = 1  # Input detected
         else:
-            status = "No input"
+            status = 0  # No input
+        
+        key = bars * len(_LEVEL_STATUSES) + status
+        if key == self._last_meter_key:
+            return
         
-        meter = f"{filled}{empty} ({status})"
-        self.level_var.set(meter)
+        self._last_meter_key = key
+        self.level_var.set(_METER_STRINGS[key])
     
     def cleanup(self):
         """Clean up audio resources"""
         # Stop any ongoing operations
+        for after_id in (self._input_after_id, self._output_after_id,
+                         self._level_after_id, self._device_change_after_id,
+                         self._set_input_after_id, self._set_output_after_id):
+            if after_id is not None:
+                self.after_cancel(after_id)
+        self._input_after_id = None
+        self._output_after_id = None
+        self._level_after_id = None
+        self._device_change_after_id = None
+        self._set_input_after_id = None
+        self._set_output_after_id = None
+        
         self.logger.info("Audio controls cleaned up")
\ No newline at end of file
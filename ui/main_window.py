@@ -9,10 +9,23 @@ import logging
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import threading
+import queue
+import types
+import importlib.util
+from functools import lru_cache, partial
+from contextlib import contextmanager
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime
 
+# Only used for the output test fallback beep
+if sys.platform == "win32":
+    import winsound
+else:
+    winsound = None
+
 from gaming_translator.utils.constants import (
-    APP_NAME, APP_VERSION, UI_COLORS, GAMING_LANGUAGES, EXPORT_FORMATS
+    APP_NAME, APP_VERSION, UI_COLORS, GAMING_LANGUAGES, EXPORT_FORMATS, get_language_info
 )
 from gaming_translator.core.voice_recognizer import VoiceRecognizer, list_audio_devices
 from gaming_translator.core.translator import Translator, CachedTranslator
@@ -20,9 +33,167 @@ from gaming_translator.core.synthesizer import VoiceSynthesizer, MultiLanguageVo
 from gaming_translator.core.session_manager import SessionManager, VoiceMessage
 from gaming_translator.ui.overlay import GamingOverlay
 
+# Combobox entries for the language pickers and their language codes,
+# _LANG_CODES is indexed by Combobox.current()
+_LANG_CODES = tuple(GAMING_LANGUAGES.keys())
+_LANG_DISPLAY_OPTIONS = tuple(
+    f"{info['flag']} {info['name']}" for info in GAMING_LANGUAGES.values()
+)
+_LANG_DISPLAY_TO_CODE = {
+    display: code for display, code in zip(_LANG_DISPLAY_OPTIONS, GAMING_LANGUAGES.keys())
+}
+# Label -> code lookup, the table is already fully precomputed so a bound
+# dict.get beats wrapping it in functools.lru_cache
+_lookup_code = _LANG_DISPLAY_TO_CODE.get
+
+# File dialog options
+_SESSION_FILETYPES = (("JSON files", "*.json"), ("All files", "*.*"))
+
+
+def _export_dialog_options(info):
+    """Return (extension, filetypes, title) for an export format"""
+    ext = info.get("extension", ".txt")
+    name = info.get("name", "Text")
+    return ext, ((f"{name} files", f"*{ext}"), ("All files", "*.*")), f"Export as {name}"
+
+
+_EXPORT_DIALOG_OPTIONS = {
+    fmt: _export_dialog_options(info) for fmt, info in EXPORT_FORMATS.items()
+}
+_DEFAULT_EXPORT_DIALOG_OPTIONS = _export_dialog_options({})
+
+# Help dialog text
+_SHORTCUTS_TEXT = (
+    "Toggle Listening: Ctrl+L\n"
+    "Toggle Game Overlay: Ctrl+O\n"
+    "Translate and Speak: Ctrl+T\n"
+    "Save Conversation: Ctrl+S\n"
+    "Hide Overlay: Escape\n"
+    "New Session: Ctrl+N\n"
+    "Load Session: Ctrl+O\n"
+    "Enter: Send Text in Text Box"
+)
+_FIRST_RUN_TITLE = f"Welcome to {APP_NAME}"
+_FIRST_RUN_TEXT = (
+    f"Welcome to {APP_NAME} v{APP_VERSION}!\n\n"
+    "Quick Start Guide:\n"
+    "1. Select your microphone and test the audio levels\n"
+    "2. Adjust input/output volume as needed\n"
+    "3. Choose your language and your teammate's language\n"
+    "4. Click 'Start Listening' to begin voice recognition\n"
+    "5. Use the overlay during games with Ctrl+O\n\n"
+    "For more help, check the Help menu."
+)
+_ABOUT_TITLE = f"About {APP_NAME}"
+_ABOUT_TEXT = (
+    f"{APP_NAME} v{APP_VERSION}\n\n"
+    "A real-time voice translator for gaming.\n\n"
+    "Features:\n"
+    "- Real-time voice recognition with WhisperX\n"
+    "- Visual audio level monitoring\n"
+    "- Volume controls for input/output\n"
+    "- Automatic language detection\n"
+    "- Fast translation with LibreTranslate support\n"
+    "- In-game overlay\n"
+    "- Session export to multiple formats"
+)
+_INSTALL_HINT_TEXT = (
+    "\nInstallation commands:\n"
+    "pip install pyaudio speechrecognition googletrans==4.0.0-rc1 pyttsx3\n"
+    "pip install gtts pygame reportlab\n"
+    "pip install git+https://github.com/m-bain/whisperx.git"
+)
+
+# Shared widget styling, built once instead of per widget
+_TITLE_FONT = ("Segoe UI", 18, "bold")
+_BUTTON_FONT = ("Segoe UI", 14, "bold")
+_HEADER_FONT = ("Segoe UI", 12, "bold")
+_LABEL_FONT = ("Segoe UI", 11, "bold")
+_ENTRY_FONT = ("Segoe UI", 12)
+_BODY_FONT = ("Segoe UI", 10)
+_SPEAKER_FONT = ("Segoe UI", 10, "bold")
+_SMALL_FONT = ("Segoe UI", 8)
+_MONO_FONT = ("Consolas", 10)
+
+_CARD_LABEL_KW = {
+    "bg": UI_COLORS["CARD_BG"],
+    "fg": UI_COLORS["TEXT_COLOR"],
+    "font": _LABEL_FONT,
+}
+
+# Conversation speaker label and tag, keyed by VoiceMessage.is_outgoing
+_SPEAKER_TAG_YOU = "speaker_you"
+_SPEAKER_TAG_TEAM = "speaker_teammate"
+_SPEAKER_SEGMENTS = {
+    True: ("You: ", _SPEAKER_TAG_YOU),
+    False: ("Teammate: ", _SPEAKER_TAG_TEAM),
+}
+
+@dataclass
+class AppState:
+    """Read-mostly settings shared with worker threads
+    
+    Only the Tk main thread writes these fields, worker threads read them
+    instead of touching Tk variables or widgets.
+    """
+    my_lang_code: str = "en"
+    target_lang_code: str = "es"
+    auto_detect: bool = True
+    input_volume: float = 0.8
+    output_volume: float = 0.7
+    is_listening: bool = False
+
+
+def _has_module(name):
+    """Check whether a module is installed without importing it"""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+@lru_cache(maxsize=1)
+def _compute_missing_deps():
+    """Return descriptions of missing optional dependencies (computed once)"""
+    missing = []
+    
+    # Check for audio libraries
+    if not (_has_module("pyaudio") and _has_module("speech_recognition")):
+        missing.append("Audio libraries (pyaudio, speech_recognition)")
+    
+    # Check for translation library
+    if not _has_module("googletrans"):
+        missing.append("Translation library (googletrans==4.0.0-rc1)")
+    
+    # Check for TTS libraries
+    if not _has_module("pyttsx3") and not (_has_module("gtts") and _has_module("pygame")):
+        missing.append("Text-to-Speech libraries (pyttsx3 or gtts+pygame)")
+    
+    # Check for WhisperX
+    if not _has_module("whisperx"):
+        missing.append("WhisperX (optional for improved recognition)")
+    
+    # Check for reportlab (PDF export)
+    if not _has_module("reportlab"):
+        missing.append("reportlab (optional for PDF export)")
+    
+    return tuple(missing)
+
+
 class GamingTranslatorApp:
     """Main application class for the Gaming Voice Chat Translator"""
     
+    # Tcl interpreter whose ttk styles have already been configured
+    _themed_interp = None
+    
+    # Messages kept rendered in the conversation widget, older ones are
+    # re-inserted in chunks when the view is scrolled to the top
+    MAX_VISIBLE_MESSAGES = 500
+    REHYDRATE_CHUNK = 100
+    
+    # Quiet period before settings changes are written to disk
+    CONFIG_SAVE_DELAY_MS = 500
+    
     def __init__(self, config):
         """Initialize the application with configuration"""
         self.logger = logging.getLogger("gaming_translator.ui.main_window")
@@ -37,11 +208,53 @@ class GamingTranslatorApp:
         self.overlay = None
         self.audio_section = None
         
+        # Optional component methods, bound once in _init_components
+        self._set_sensitivity = None
+        self._set_tts_volume = None
+        
+        # Last volume pushed to the synthesizer, engines persist it expensively
+        self._last_tts_volume = None
+        
         # State
-        self.is_listening = False
+        self.state = AppState()
         self.selected_device = None
-        self.input_volume = 0.8
-        self.output_volume = 0.7
+        
+        # Recognized text is processed on a worker thread, UI updates are
+        # handed back to the Tk main loop through _ui_queue
+        self._voice_queue = queue.Queue()
+        self._ui_queue = queue.Queue()
+        self._voice_worker = None
+        self._ui_pump_after_id = None
+        
+        # Session file operations run in order on their own worker
+        self._file_jobs = queue.Queue()
+        self._file_worker = None
+        
+        # Bounded queue feeding the TTS worker, stale speech is dropped
+        self._tts_q = queue.Queue(maxsize=4)
+        self._tts_worker = None
+        
+        # Pending debounced config write
+        self._save_after_id = None
+        self._config_dirty = False
+        
+        # Conversation messages waiting for the next idle flush
+        self._pending_msgs = deque()
+        self._flush_scheduled = False
+        
+        # Every displayed message, and line counts for the rendered window
+        self._message_store = []
+        self._visible_start_idx = 0
+        self._visible_line_counts = deque()
+        self._rehydrate_pending = False
+        self._scroll_pending = False
+        
+        # Nesting depth of _editable blocks on the conversation widget
+        self._edit_depth = 0
+        
+        # Latest status message waiting for the next idle flush
+        self._pending_status = None
+        self._status_after_id = None
         
         self.logger.info("Application initialized")
     
@@ -76,6 +289,15 @@ class GamingTranslatorApp:
         self._setup_ui()
         self._setup_hotkeys()
         
+        # Start the voice processing worker and the UI queue pump
+        self._voice_worker = threading.Thread(target=self._worker_loop, daemon=True)
+        self._voice_worker.start()
+        self._tts_worker = threading.Thread(target=self._tts_worker_loop, daemon=True)
+        self._tts_worker.start()
+        self._file_worker = threading.Thread(target=self._file_worker_loop, daemon=True)
+        self._file_worker.start()
+        self._ui_pump_after_id = self.root.after(30, self._drain_ui_queue)
+        
         # Check for first run
         if self.config.is_first_run():
             self._show_first_run_help()
@@ -93,6 +315,16 @@ class GamingTranslatorApp:
     
     def _init_components(self):
         """Initialize core components"""
+        # Settings read once for building the UI
+        config = self.config
+        self.cfg = types.SimpleNamespace(
+            input_volume=config.get_float("audio", "input_volume", 0.8),
+            output_volume=config.get_float("audio", "output_volume", 0.7),
+            my_lang=config.get("translation", "my_language", "en"),
+            target_lang=config.get("translation", "target_language", "es"),
+            auto_detect=config.get_bool("translation", "auto_detect", True),
+        )
+        
         try:
             # Create session manager first
             self.session_manager = SessionManager(self.config)
@@ -108,6 +340,10 @@ class GamingTranslatorApp:
             base_synthesizer = VoiceSynthesizer.create_synthesizer(self.config)
             self.voice_synthesizer = MultiLanguageVoiceSynthesizer(self.config)
             
+            # Bind optional methods once instead of looking them up per slider tick
+            self._set_sensitivity = getattr(self.voice_recognizer, 'set_sensitivity', None)
+            self._set_tts_volume = getattr(self.voice_synthesizer, 'set_volume', None)
+            
             # Create overlay
             self.overlay = GamingOverlay(self, self.config)
             
@@ -124,6 +360,10 @@ class GamingTranslatorApp:
         # Configure root window
         self.root.configure(bg=UI_COLORS["BG_COLOR"])
         
+        # ttk styles live in the interpreter, only configure them once per root
+        if GamingTranslatorApp._themed_interp is self.root.tk:
+            return
+        
         # Configure ttk styles
         style = ttk.Style()
         style.theme_use('clam')
@@ -148,6 +388,8 @@ class GamingTranslatorApp:
         
         style.configure('TFrame',
                        background=UI_COLORS["BG_COLOR"])
+        
+        GamingTranslatorApp._themed_interp = self.root.tk
     
     def _setup_ui(self):
         """Setup the main application UI"""
@@ -164,7 +406,7 @@ class GamingTranslatorApp:
             text=f"🎮 {APP_NAME}",
             bg=UI_COLORS["BG_COLOR"], 
             fg=UI_COLORS["TEXT_COLOR"],
-            font=("Segoe UI", 18, "bold")
+            font=_TITLE_FONT
         )
         title_label.pack(pady=(0, 20))
         
@@ -187,47 +429,46 @@ class GamingTranslatorApp:
             
             # Save to config
             self.config.set("recognition", "device_index", str(device_index))
-            self.config.save()
+            self._schedule_config_save()
             
             self._update_status(f"Selected audio device: {device_index}")
             
-            # If currently listening, restart with new device
-            if self.is_listening:
-                self._stop_listening()
-                # Small delay to ensure cleanup
-                self.root.after(500, lambda: self._start_listening())
+            # If currently listening, restart once the old stream has shut down
+            if self.state.is_listening:
+                self._stop_listening(
+                    on_stopped=lambda: self._ui_queue.put(("restart_listening", None))
+                )
         
         def on_input_volume_change(volume):
             """Handle input volume change"""
-            self.input_volume = volume
+            self.state.input_volume = volume
             
             # Update voice recognizer sensitivity if it supports it
-            if hasattr(self.voice_recognizer, 'set_sensitivity'):
-                self.voice_recognizer.set_sensitivity(volume)
+            if self._set_sensitivity is not None:
+                self._set_sensitivity(volume)
             
             # Save to config
             self.config.set("audio", "input_volume", str(volume))
-            self.config.save()
+            self._schedule_config_save()
             
             self._update_status(f"Input sensitivity: {int(volume * 100)}%")
         
         def on_output_volume_change(volume):
             """Handle output volume change"""
-            self.output_volume = volume
+            self.state.output_volume = volume
             
             # Update TTS volume if it supports it
-            if hasattr(self.voice_synthesizer, 'set_volume'):
-                self.voice_synthesizer.set_volume(volume)
+            self._apply_tts_volume(volume)
             
             # Save to config
             self.config.set("audio", "output_volume", str(volume))
-            self.config.save()
+            self._schedule_config_save()
             
             self._update_status(f"Output volume: {int(volume * 100)}%")
         
         # Load initial volumes from config
-        initial_input_volume = self.config.get_float("audio", "input_volume", 0.8)
-        initial_output_volume = self.config.get_float("audio", "output_volume", 0.7)
+        initial_input_volume = self.cfg.input_volume
+        initial_output_volume = self.cfg.output_volume
         
         # Create enhanced audio section
         self.audio_section = EnhancedAudioSection(
@@ -242,6 +483,11 @@ class GamingTranslatorApp:
         self.audio_section.set_input_volume(initial_input_volume)
         self.audio_section.set_output_volume(initial_output_volume)
         
+        # The synthesizer volume is only touched again when the slider moves
+        self.state.input_volume = initial_input_volume
+        self.state.output_volume = initial_output_volume
+        self._apply_tts_volume(initial_output_volume)
+        
         # Get initial device selection
         initial_device = self.audio_section.get_selected_device_index()
         if initial_device is not None:
@@ -249,6 +495,20 @@ class GamingTranslatorApp:
         
         return self.audio_section
     
+    def _schedule_config_save(self):
+        """Write the config once things have been quiet for a short while"""
+        self._config_dirty = True
+        if self._save_after_id is not None:
+            self.root.after_cancel(self._save_after_id)
+        self._save_after_id = self.root.after(self.CONFIG_SAVE_DELAY_MS, self._do_save)
+    
+    def _do_save(self):
+        """Flush a debounced config write"""
+        self._save_after_id = None
+        if self._config_dirty:
+            self._config_dirty = False
+            self.config.save()
+    
     def _create_menu_bar(self):
         """Create application menu bar"""
         menu_bar = tk.Menu(self.root)
@@ -330,7 +590,7 @@ class GamingTranslatorApp:
             text="🌍 Languages",
             bg=UI_COLORS["CARD_BG"], 
             fg=UI_COLORS["TEXT_COLOR"],
-            font=("Segoe UI", 12, "bold"),
+            font=_HEADER_FONT,
             bd=2, 
             relief=tk.GROOVE
         )
@@ -343,25 +603,19 @@ class GamingTranslatorApp:
         tk.Label(
             lang_grid, 
             text="Your Language:", 
-            bg=UI_COLORS["CARD_BG"], 
-            fg=UI_COLORS["TEXT_COLOR"],
-            font=("Segoe UI", 11, "bold")
+            **_CARD_LABEL_KW
         ).grid(row=0, column=0, sticky=tk.W, padx=(0, 10))
         
-        my_lang_options = [
-            f"{info['flag']} {info['name']}" 
-            for code, info in GAMING_LANGUAGES.items()
-        ]
-        
-        my_lang_code = self.config.get("translation", "my_language", "en")
+        my_lang_code = self.cfg.my_lang
         my_lang_info = GAMING_LANGUAGES.get(my_lang_code, {"name": "English", "flag": "🇺🇸"})
         my_lang_display = f"{my_lang_info['flag']} {my_lang_info['name']}"
         
         self.my_lang_var = tk.StringVar(value=my_lang_display)
-        my_lang_combo = ttk.Combobox(
+        self.state.my_lang_code = _lookup_code(my_lang_display, "en")
+        self.my_lang_combo = my_lang_combo = ttk.Combobox(
             lang_grid, 
             textvariable=self.my_lang_var,
-            values=my_lang_options, 
+            values=_LANG_DISPLAY_OPTIONS,
             state="readonly", 
             width=25
         )
@@ -372,20 +626,19 @@ class GamingTranslatorApp:
         tk.Label(
             lang_grid, 
             text="Teammate's Language:", 
-            bg=UI_COLORS["CARD_BG"], 
-            fg=UI_COLORS["TEXT_COLOR"],
-            font=("Segoe UI", 11, "bold")
+            **_CARD_LABEL_KW
         ).grid(row=0, column=2, sticky=tk.W, padx=(0, 10))
         
-        target_lang_code = self.config.get("translation", "target_language", "es")
+        target_lang_code = self.cfg.target_lang
         target_lang_info = GAMING_LANGUAGES.get(target_lang_code, {"name": "Spanish", "flag": "🇪🇸"})
         target_lang_display = f"{target_lang_info['flag']} {target_lang_info['name']}"
         
         self.target_lang_var = tk.StringVar(value=target_lang_display)
-        target_lang_combo = ttk.Combobox(
+        self.state.target_lang_code = _lookup_code(target_lang_display, "es")
+        self.target_lang_combo = target_lang_combo = ttk.Combobox(
             lang_grid, 
             textvariable=self.target_lang_var,
-            values=my_lang_options, 
+            values=_LANG_DISPLAY_OPTIONS,
             state="readonly", 
             width=25
         )
@@ -397,8 +650,9 @@ class GamingTranslatorApp:
         auto_frame.pack(fill=tk.X, padx=10, pady=(5, 10))
         
         self.auto_detect_var = tk.BooleanVar(
-            value=self.config.get_bool("translation", "auto_detect", True)
+            value=self.cfg.auto_detect
         )
+        self.state.auto_detect = self.auto_detect_var.get()
         auto_cb = tk.Checkbutton(
             auto_frame, 
             text="🔍 Auto-detect teammate's language",
@@ -406,7 +660,7 @@ class GamingTranslatorApp:
             bg=UI_COLORS["CARD_BG"], 
             fg=UI_COLORS["TEXT_COLOR"],
             selectcolor=UI_COLORS["BG_COLOR"], 
-            font=("Segoe UI", 10),
+            font=_BODY_FONT,
             command=self._on_auto_detect_changed
         )
         auto_cb.pack(side=tk.LEFT)
@@ -426,7 +680,7 @@ class GamingTranslatorApp:
             command=self._toggle_listening,
             bg=UI_COLORS["SUCCESS_COLOR"], 
             fg="white",
-            font=("Segoe UI", 14, "bold"), 
+            font=_BUTTON_FONT,
             bd=0,
             padx=25, 
             pady=12, 
@@ -440,7 +694,7 @@ class GamingTranslatorApp:
             command=self.overlay.toggle_overlay,
             bg=UI_COLORS["ACCENT_COLOR"], 
             fg="white",
-            font=("Segoe UI", 14, "bold"), 
+            font=_BUTTON_FONT,
             bd=0,
             padx=25, 
             pady=12, 
@@ -455,7 +709,7 @@ class GamingTranslatorApp:
             command=self._test_output_volume,
             bg=UI_COLORS["WARNING_COLOR"],
             fg="white",
-            font=("Segoe UI", 12, "bold"),
+            font=_HEADER_FONT,
             bd=0,
             padx=15,
             pady=12
@@ -472,7 +726,7 @@ class GamingTranslatorApp:
             textvariable=self.recording_var,
             bg=UI_COLORS["BG_COLOR"], 
             fg=UI_COLORS["ERROR_COLOR"],
-            font=("Segoe UI", 12, "bold")
+            font=_HEADER_FONT
         )
         recording_label.pack()
         
@@ -483,10 +737,18 @@ class GamingTranslatorApp:
             textvariable=self.live_level_var,
             bg=UI_COLORS["BG_COLOR"],
             fg=UI_COLORS["ACCENT_COLOR"],
-            font=("Segoe UI", 10)
+            font=_BODY_FONT
         )
         live_level_label.pack()
     
+    def _apply_tts_volume(self, volume):
+        """Set the synthesizer volume, skipping the call when it is unchanged"""
+        if self._set_tts_volume is None or volume == self._last_tts_volume:
+            return
+        
+        self._set_tts_volume(volume)
+        self._last_tts_volume = volume
+    
     def _test_output_volume(self):
         """Test output volume with a sample sound"""
         try:
@@ -503,17 +765,18 @@ class GamingTranslatorApp:
                 
                 if self.voice_synthesizer:
                     # Temporarily set TTS volume
-                    if hasattr(self.voice_synthesizer, 'set_volume'):
-                        self.voice_synthesizer.set_volume(output_volume)
+                    self._apply_tts_volume(output_volume)
                     
-                    self.voice_synthesizer.speak_text(test_text, "en")
+                    self._enqueue_speech(test_text, "en")
                 
                 self._update_status(f"Output volume test: {int(output_volume * 100)}%")
             else:
                 # Fallback: system beep
-                import winsound
-                winsound.Beep(440, 500)
-                self._update_status("Output volume test (system beep)")
+                if winsound is not None:
+                    winsound.Beep(440, 500)
+                    self._update_status("Output volume test (system beep)")
+                else:
+                    self._update_status("Output volume test unavailable on this platform")
                 
         except Exception as e:
             self.logger.error(f"Error testing output volume: {e}")
@@ -526,7 +789,7 @@ class GamingTranslatorApp:
             text="💬 Conversation",
             bg=UI_COLORS["CARD_BG"], 
             fg=UI_COLORS["TEXT_COLOR"],
-            font=("Segoe UI", 12, "bold"),
+            font=_HEADER_FONT,
             bd=2, 
             relief=tk.GROOVE
         )
@@ -540,7 +803,7 @@ class GamingTranslatorApp:
             conv_display, 
             bg=UI_COLORS["BG_COLOR"], 
             fg=UI_COLORS["TEXT_COLOR"],
-            font=("Consolas", 10), 
+            font=_MONO_FONT,
             wrap=tk.WORD,
             state=tk.DISABLED, 
             padx=10, 
@@ -548,7 +811,15 @@ class GamingTranslatorApp:
         )
         
         scrollbar = tk.Scrollbar(conv_display, command=self.conversation_text.yview)
-        self.conversation_text.configure(yscrollcommand=scrollbar.set)
+        self._conversation_scrollbar = scrollbar
+        self.conversation_text.configure(yscrollcommand=self._on_conversation_scroll)
+        
+        # Message styles never change, configure the tags once
+        self.conversation_text.tag_configure("timestamp", foreground="#888888")
+        self.conversation_text.tag_configure(_SPEAKER_TAG_YOU, foreground=UI_COLORS["SUCCESS_COLOR"], font=_SPEAKER_FONT)
+        self.conversation_text.tag_configure(_SPEAKER_TAG_TEAM, foreground=UI_COLORS["ACCENT_COLOR"], font=_SPEAKER_FONT)
+        self.conversation_text.tag_configure("language", foreground="#888888", font=_SMALL_FONT)
+        self.conversation_text.tag_configure("translation", foreground=UI_COLORS["ACCENT_COLOR"])
         
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         self.conversation_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
@@ -560,9 +831,7 @@ class GamingTranslatorApp:
         tk.Label(
             response_frame, 
             text="💬 Your Response:", 
-            bg=UI_COLORS["CARD_BG"], 
-            fg=UI_COLORS["TEXT_COLOR"],
-            font=("Segoe UI", 11, "bold")
+            **_CARD_LABEL_KW
         ).pack(anchor=tk.W, pady=(0, 5))
         
         input_area = tk.Frame(response_frame, bg=UI_COLORS["CARD_BG"])
@@ -572,7 +841,7 @@ class GamingTranslatorApp:
             input_area, 
             bg=UI_COLORS["BG_COLOR"], 
             fg=UI_COLORS["TEXT_COLOR"],
-            font=("Segoe UI", 12), 
+            font=_ENTRY_FONT,
             relief=tk.FLAT, 
             bd=5
         )
@@ -585,7 +854,7 @@ class GamingTranslatorApp:
             command=self._speak_response_text,
             bg=UI_COLORS["ACCENT_COLOR"], 
             fg="white", 
-            font=("Segoe UI", 12, "bold"),
+            font=_HEADER_FONT,
             bd=0, 
             width=3, 
             height=1
@@ -598,7 +867,7 @@ class GamingTranslatorApp:
             command=self._translate_and_speak,
             bg=UI_COLORS["SUCCESS_COLOR"], 
             fg="white", 
-            font=("Segoe UI", 12, "bold"),
+            font=_HEADER_FONT,
             bd=0, 
             width=3, 
             height=1
@@ -616,7 +885,7 @@ class GamingTranslatorApp:
             textvariable=self.status_var,
             bg=UI_COLORS["CARD_BG"], 
             fg=UI_COLORS["TEXT_COLOR"], 
-            font=("Segoe UI", 10),
+            font=_BODY_FONT,
             anchor=tk.W, 
             padx=10, 
             pady=5, 
@@ -641,13 +910,18 @@ class GamingTranslatorApp:
     
     def _toggle_listening(self):
         """Toggle voice recognition on/off"""
-        if self.is_listening:
+        if self.state.is_listening:
             self._stop_listening()
+            self._stop_speech()
         else:
             self._start_listening()
     
     def _start_listening(self):
         """Enhanced start listening with volume monitoring"""
+        # Devices load in the background, pick up the default once it's known
+        if self.selected_device is None and self.audio_section:
+            self.selected_device = self.audio_section.get_selected_device_index()
+        
         if self.selected_device is None:
             self._update_status("Please select a microphone device first")
             return
@@ -660,12 +934,12 @@ class GamingTranslatorApp:
                 self._update_status("Input is muted - unmute to start listening")
                 return
         else:
-            input_sensitivity = self.input_volume
+            input_sensitivity = self.state.input_volume
         
         success = self.voice_recognizer.start_listening(self.selected_device, self._on_voice_recognized)
         
         if success:
-            self.is_listening = True
+            self.state.is_listening = True
             self.listen_btn.config(text="🛑 Stop Listening", bg=UI_COLORS["ERROR_COLOR"])
             self.recording_var.set("● Recording")
             self.live_level_var.set("Monitoring audio levels...")
@@ -674,12 +948,17 @@ class GamingTranslatorApp:
         else:
             self._update_status("Failed to start listening - check your microphone")
     
-    def _stop_listening(self):
-        """Enhanced stop listening"""
-        if hasattr(self, 'voice_recognizer'):
-            self.voice_recognizer.stop_listening()
+    def _stop_listening(self, on_stopped=None):
+        """Enhanced stop listening
         
-        self.is_listening = False
+        Args:
+            on_stopped: Optional function called from a worker thread once the
+                recognizer has fully stopped
+        """
+        if self.voice_recognizer is not None:
+            self.voice_recognizer.stop_listening(on_stopped=on_stopped)
+        
+        self.state.is_listening = False
         self.listen_btn.config(text="🎤 Start Listening", bg=UI_COLORS["SUCCESS_COLOR"])
         self.recording_var.set("")
         self.live_level_var.set("")
@@ -690,49 +969,139 @@ class GamingTranslatorApp:
         if not text:
             return
         
-        # Get language settings from config
-        my_language = None
-        for code, info in GAMING_LANGUAGES.items():
-            if f"{info['flag']} {info['name']}" == self.my_lang_var.get():
-                my_language = code
-                break
-        
-        target_language = None
-        for code, info in GAMING_LANGUAGES.items():
-            if f"{info['flag']} {info['name']}" == self.target_lang_var.get():
-                target_language = code
+        # Translation and TTS happen on the worker thread
+        self._voice_queue.put((text, True))
+    
+    def _worker_loop(self):
+        """Translate queued text off the Tk main thread"""
+        while True:
+            job = self._voice_queue.get()
+            if job is None:
                 break
+            
+            try:
+                self._dispatch_translation(*job)
+            except Exception as e:
+                self.logger.error(f"Error processing text: {e}")
+    
+    def _dispatch_translation(self, text, is_voice):
+        """Translate text and speak the result (worker thread)
+        
+        Args:
+            text: Recognized or typed text
+            is_voice: True for recognized speech, which may be auto-detected
+                and is not translated when already in the target language
+        """
+        state = self.state
+        source_language = state.my_lang_code
+        target_language = state.target_lang_code
         
         # Detect language if auto-detect is enabled
-        detected_lang = my_language
-        if self.auto_detect_var.get():
-            detected_lang = self.translator.detect_language(text)
+        if is_voice and state.auto_detect:
+            source_language = self.translator.detect_language(text)
         
-        # Translate text to target language
+        # Translate text to target language, same-language text needs no round-trip
         translation = None
-        if detected_lang != target_language:
-            translation = self.translator.translate_text(text, target_language, detected_lang)
+        if source_language != target_language:
+            translation = self.translator.translate_text(text, target_language, source_language)
+        elif not is_voice:
+            translation = text
         
         # Create voice message
-        message = VoiceMessage(text, detected_lang, is_outgoing=True, translation=translation)
-        
-        # Add to session
-        self.session_manager.add_message(message)
+        message = VoiceMessage(text, source_language, is_outgoing=True, translation=translation)
         
-        # Update conversation display
-        self._add_conversation_message(message)
-        
-        # Update overlay
-        self.overlay.add_message(message)
+        # Session and widgets are updated on the main thread
+        self._ui_queue.put(("add_msg", message))
         
         # Speak translated text with current output volume
         if translation and self.voice_synthesizer:
-            # Apply current output volume
-            if hasattr(self.voice_synthesizer, 'set_volume'):
-                output_volume = self.audio_section.get_output_volume() if self.audio_section else self.output_volume
-                self.voice_synthesizer.set_volume(output_volume)
+            self._enqueue_speech(translation, target_language)
+    
+    def _enqueue_speech(self, text, language):
+        """Hand text to the TTS worker"""
+        job = (text, language)
+        
+        try:
+            self._tts_q.put_nowait(job)
+        except queue.Full:
+            # Drop the oldest pending phrase rather than build up a backlog
+            try:
+                self._tts_q.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                self._tts_q.put_nowait(job)
+            except queue.Full:
+                self.logger.warning("TTS queue full, dropping speech")
+    
+    def _stop_speech(self):
+        """Cut off pending and playing speech right away"""
+        self._clear_tts_queue()
+        if self.voice_synthesizer is not None:
+            self.voice_synthesizer.stop()
+    
+    def _clear_tts_queue(self):
+        """Drop speech that has not started playing yet"""
+        while True:
+            try:
+                self._tts_q.get_nowait()
+            except queue.Empty:
+                break
+    
+    def _tts_worker_loop(self):
+        """Speak queued text off the Tk main thread"""
+        while True:
+            job = self._tts_q.get()
+            if job is None:
+                break
+            
+            # Block until playback ends so phrases never overlap
+            text, language = job
+            try:
+                self.voice_synthesizer.speak_blocking(text, language)
+            except Exception as e:
+                self.logger.error(f"Error speaking text: {e}")
+    
+    def _run_file_job(self, work, on_done):
+        """Run work() on the file worker, then on_done(result, error) on the Tk thread"""
+        self._file_jobs.put((work, on_done))
+    
+    def _file_worker_loop(self):
+        """Run queued session file operations off the Tk main thread"""
+        while True:
+            job = self._file_jobs.get()
+            if job is None:
+                break
             
-            self.voice_synthesizer.speak_text(translation, target_language)
+            work, on_done = job
+            try:
+                result, error = work(), None
+            except Exception as e:
+                result, error = None, e
+            self._ui_queue.put(("call", partial(on_done, result, error)))
+    
+    def _drain_ui_queue(self):
+        """Apply UI updates queued by the worker thread"""
+        try:
+            while True:
+                try:
+                    event, payload = self._ui_queue.get_nowait()
+                except queue.Empty:
+                    break
+                
+                if event == "add_msg":
+                    self.session_manager.add_message(payload)
+                    self._add_conversation_message(payload)
+                    self.overlay.add_message(payload)
+                elif event == "call":
+                    payload()
+                elif event == "restart_listening":
+                    if not self.state.is_listening:
+                        self._start_listening()
+        except Exception as e:
+            self.logger.error(f"Error updating UI from queue: {e}")
+        
+        self._ui_pump_after_id = self.root.after(30, self._drain_ui_queue)
     
     def _translate_and_speak(self, event=None):
         """Translate and speak text from main window entry"""
@@ -749,161 +1118,237 @@ class GamingTranslatorApp:
     
     def _translate_and_speak_text(self, text):
         """Common method for translating and speaking text"""
-        # Get language settings
-        my_language = None
-        for code, info in GAMING_LANGUAGES.items():
-            if f"{info['flag']} {info['name']}" == self.my_lang_var.get():
-                my_language = code
-                break
-        
-        target_language = None
-        for code, info in GAMING_LANGUAGES.items():
-            if f"{info['flag']} {info['name']}" == self.target_lang_var.get():
-                target_language = code
-                break
-        
-        # Translate text to target language
-        translation = self.translator.translate_text(text, target_language, my_language)
-        
-        # Create voice message
-        message = VoiceMessage(text, my_language, is_outgoing=True, translation=translation)
-        
-        # Add to session
-        self.session_manager.add_message(message)
-        
-        # Update conversation display
-        self._add_conversation_message(message)
-        
-        # Update overlay
-        self.overlay.add_message(message)
-        
-        # Speak translated text with current output volume
-        if translation and self.voice_synthesizer:
-            # Apply current output volume
-            if hasattr(self.voice_synthesizer, 'set_volume'):
-                output_volume = self.audio_section.get_output_volume() if self.audio_section else self.output_volume
-                self.voice_synthesizer.set_volume(output_volume)
-            
-            self.voice_synthesizer.speak_text(translation, target_language)
+        self._voice_queue.put((text, False))
     
     def _speak_response_text(self, event=None):
         """Speak response text without translation"""
         text = self.response_entry.get().strip()
         if text:
             # Get language settings
-            my_language = None
-            for code, info in GAMING_LANGUAGES.items():
-                if f"{info['flag']} {info['name']}" == self.my_lang_var.get():
-                    my_language = code
-                    break
-            
-            # Apply current output volume
-            if hasattr(self.voice_synthesizer, 'set_volume'):
-                output_volume = self.audio_section.get_output_volume() if self.audio_section else self.output_volume
-                self.voice_synthesizer.set_volume(output_volume)
+            my_language = self.state.my_lang_code
             
-            self.voice_synthesizer.speak_text(text, my_language)
+            self._enqueue_speech(text, my_language)
     
     def _speak_response_from_overlay(self, text):
         """Speak response text from overlay without translation"""
         if text:
             # Get language settings
-            my_language = None
-            for code, info in GAMING_LANGUAGES.items():
-                if f"{info['flag']} {info['name']}" == self.my_lang_var.get():
-                    my_language = code
-                    break
-            
-            # Apply current output volume
-            if hasattr(self.voice_synthesizer, 'set_volume'):
-                output_volume = self.audio_section.get_output_volume() if self.audio_section else self.output_volume
-                self.voice_synthesizer.set_volume(output_volume)
+            my_language = self.state.my_lang_code
             
-            self.voice_synthesizer.speak_text(text, my_language)
+            self._enqueue_speech(text, my_language)
     
     def _add_conversation_message(self, message):
-        """Add message to the conversation display"""
+        """Queue a message for the conversation display"""
+        self._pending_msgs.append(message)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.root.after_idle(self._flush_conversation)
+    
+    def _flush_conversation(self):
+        """Render all queued messages in a single widget update"""
+        self._flush_scheduled = False
+        if not self._pending_msgs:
+            return
+        
         try:
-            self.conversation_text.config(state=tk.NORMAL)
+            messages = list(self._pending_msgs)
+            self._pending_msgs.clear()
             
-            # Format timestamp
-            timestamp = message.timestamp.strftime("%H:%M:%S")
+            segments, line_counts = self._render_messages(messages)
+            self._message_store.extend(messages)
+            self._visible_line_counts.extend(line_counts)
             
-            # Determine speaker and colors
-            if message.is_outgoing:
-                speaker = "You"
-                speaker_color = UI_COLORS["SUCCESS_COLOR"]
-            else:
-                speaker = "Teammate"
-                speaker_color = UI_COLORS["ACCENT_COLOR"]
-            
-            # Insert timestamp and speaker
-            self.conversation_text.insert(tk.END, f"[{timestamp}] ", "timestamp")
-            self.conversation_text.insert(tk.END, f"{speaker}: ", "speaker")
+            with self._editable():
+                self.conversation_text.insert(tk.END, *segments)
+                
+                # Keep only the newest messages rendered
+                self._trim_conversation()
             
-            # Insert original text
-            lang_code = message.language
-            lang_name = GAMING_LANGUAGES.get(lang_code, {}).get('name', lang_code)
-            lang_flag = GAMING_LANGUAGES.get(lang_code, {}).get('flag', '🌐')
+            # Scroll to bottom once the burst has been laid out
+            if not self._scroll_pending:
+                self._scroll_pending = True
+                self.root.after_idle(self._do_autoscroll)
+        
+        except Exception as e:
+            self.logger.error(f"Error adding conversation message: {e}")
+    
+    def _do_autoscroll(self):
+        """Scroll the conversation to the newest message"""
+        self._scroll_pending = False
+        self.conversation_text.see(tk.END)
+    
+    def _message_segments(self, message):
+        """Build the alternating text/tag insert arguments for one message"""
+        # Format timestamp
+        t = message.timestamp
+        timestamp = f"{t.hour:02d}:{t.minute:02d}:{t.second:02d}"
+        speaker, speaker_tag = _SPEAKER_SEGMENTS[bool(message.is_outgoing)]
+        
+        # Original text
+        lang_code = message.language
+        lang_info = get_language_info(lang_code) or {}
+        lang_name = lang_info.get('name', lang_code)
+        lang_flag = lang_info.get('flag', '🌐')
+        
+        segments = [
+            f"[{timestamp}] ", "timestamp",
+            speaker, speaker_tag,
+            f"{message.text} ", (),
+            f"({lang_flag} {lang_name})\n", "language",
+        ]
+        
+        # Translation if available
+        if message.translation:
+            segments += [f"   → {message.translation}\n", "translation"]
+        else:
+            segments += ["\n", ()]
+        
+        return segments
+    
+    def _render_messages(self, messages):
+        """Return insert arguments for messages and the line count of each"""
+        segments = []
+        line_counts = []
+        for message in messages:
+            message_segments = self._message_segments(message)
+            segments += message_segments
+            line_counts.append(sum(chunk.count("\n") for chunk in message_segments[::2]))
+        return segments, line_counts
+    
+    def _trim_conversation(self):
+        """Drop the oldest rendered messages beyond MAX_VISIBLE_MESSAGES"""
+        excess = len(self._visible_line_counts) - self.MAX_VISIBLE_MESSAGES
+        if excess <= 0:
+            return
+        
+        lines = 0
+        for _ in range(excess):
+            lines += self._visible_line_counts.popleft()
+        self._visible_start_idx += excess
+        self.conversation_text.delete('1.0', f'{lines + 1}.0')
+    
+    def _on_conversation_scroll(self, first, last):
+        """Update the scrollbar and bring back older messages at the top"""
+        self._conversation_scrollbar.set(first, last)
+        
+        if float(first) <= 0.0 and self._visible_start_idx > 0 and not self._rehydrate_pending:
+            self._rehydrate_pending = True
+            self.root.after_idle(self._load_older_messages)
+    
+    def _load_older_messages(self):
+        """Re-insert a chunk of messages that were trimmed from the top"""
+        self._rehydrate_pending = False
+        start = self._visible_start_idx
+        if start <= 0:
+            return
+        
+        try:
+            new_start = max(0, start - self.REHYDRATE_CHUNK)
+            segments, line_counts = self._render_messages(self._message_store[new_start:start])
             
-            self.conversation_text.insert(tk.END, f"{message.text} ")
-            self.conversation_text.insert(tk.END, f"({lang_flag} {lang_name})\n", "language")
+            with self._editable():
+                self.conversation_text.insert('1.0', *segments)
             
-            # Insert translation if available
-            if message.translation:
-                self.conversation_text.insert(tk.END, f"   → {message.translation}\n", "translation")
-            else:
-                self.conversation_text.insert(tk.END, "\n")
+            self._visible_line_counts.extendleft(reversed(line_counts))
+            self._visible_start_idx = new_start
             
-            # Configure tags
-            self.conversation_text.tag_configure("timestamp", foreground="#888888")
-            self.conversation_text.tag_configure("speaker", foreground=speaker_color, font=("Segoe UI", 10, "bold"))
-            self.conversation_text.tag_configure("language", foreground="#888888", font=("Segoe UI", 8))
-            self.conversation_text.tag_configure("translation", foreground=UI_COLORS["ACCENT_COLOR"])
+            # Keep the line the user was looking at at the top of the view
+            self.conversation_text.yview(f"{sum(line_counts) + 1}.0")
+        
+        except Exception as e:
+            self.logger.error(f"Error loading older messages: {e}")
+    
+    @contextmanager
+    def _editable(self):
+        """Make the conversation widget editable for the duration of the block
+        
+        Nested blocks share the outer NORMAL/DISABLED pair, so a clear and
+        a refill cost two state changes in total.
+        """
+        if self._edit_depth == 0:
+            self.conversation_text.config(state=tk.NORMAL)
+        self._edit_depth += 1
+        try:
+            yield
+        finally:
+            self._edit_depth -= 1
+            if self._edit_depth == 0:
+                self.conversation_text.config(state=tk.DISABLED)
+    
+    def _clear_conversation(self):
+        """Remove every message from the conversation display"""
+        self._pending_msgs.clear()
+        self._message_store = []
+        self._visible_start_idx = 0
+        self._visible_line_counts.clear()
+        
+        with self._editable():
+            self.conversation_text.delete(1.0, tk.END)
+    
+    def _show_conversation(self, messages):
+        """Replace the display with messages, rendering only the newest window"""
+        with self._editable():
+            self._clear_conversation()
             
-            # Scroll to bottom
-            self.conversation_text.see(tk.END)
-            self.conversation_text.config(state=tk.DISABLED)
+            start = max(0, len(messages) - self.MAX_VISIBLE_MESSAGES)
+            self._message_store = list(messages[:start])
+            self._visible_start_idx = start
             
-        except Exception as e:
-            self.logger.error(f"Error adding conversation message: {e}")
+            self._pending_msgs.extend(messages[start:])
+            self._flush_conversation()
     
     def _update_status(self, message):
-        """Update status bar message"""
-        self.status_var.set(message)
-        self.logger.info(message)
+        """Update status bar message, coalescing bursts into one redraw"""
+        self._pending_status = message
+        if self._status_after_id is None:
+            self._status_after_id = self.root.after_idle(self._flush_status)
+    
+    def _flush_status(self):
+        """Show the most recent status message"""
+        self._status_after_id = None
+        message = self._pending_status
+        self._pending_status = None
+        
+        if message is not None:
+            self.status_var.set(message)
+            self.logger.info(message)
     
     def _on_my_language_changed(self, event=None):
         """Handle my language selection change"""
-        selection = self.my_lang_var.get()
-        for code, info in GAMING_LANGUAGES.items():
-            if f"{info['flag']} {info['name']}" == selection:
-                # Save to config
-                self.config.set("translation", "my_language", code)
-                self.config.save()
-                
-                self._update_status(f"Your language set to: {selection}")
-                break
+        index = self.my_lang_combo.current()
+        if index >= 0:
+            code = _LANG_CODES[index]
+            selection = _LANG_DISPLAY_OPTIONS[index]
+            self.state.my_lang_code = code
+            
+            # Save to config
+            self.config.set("translation", "my_language", code)
+            self._schedule_config_save()
+            
+            self._update_status(f"Your language set to: {selection}")
     
     def _on_target_language_changed(self, event=None):
         """Handle target language selection change"""
-        selection = self.target_lang_var.get()
-        for code, info in GAMING_LANGUAGES.items():
-            if f"{info['flag']} {info['name']}" == selection:
-                # Save to config
-                self.config.set("translation", "target_language", code)
-                self.config.save()
-                
-                self._update_status(f"Teammate's language set to: {selection}")
-                break
+        index = self.target_lang_combo.current()
+        if index >= 0:
+            code = _LANG_CODES[index]
+            selection = _LANG_DISPLAY_OPTIONS[index]
+            self.state.target_lang_code = code
+            
+            # Save to config
+            self.config.set("translation", "target_language", code)
+            self._schedule_config_save()
+            
+            self._update_status(f"Teammate's language set to: {selection}")
     
     def _on_auto_detect_changed(self):
         """Handle auto-detect checkbox change"""
         auto_detect = self.auto_detect_var.get()
+        self.state.auto_detect = auto_detect
         
         # Save to config
         self.config.set("translation", "auto_detect", str(auto_detect))
-        self.config.save()
+        self._schedule_config_save()
         
         self._update_status(f"Auto language detection: {'enabled' if auto_detect else 'disabled'}")
     
@@ -913,23 +1358,27 @@ class GamingTranslatorApp:
             "Save Current Session", 
             "Do you want to save the current session before starting a new one?"
         ):
-            self._save_session()
+            # Written before the session is cleared below
+            self._save_session(blocking=True)
         
         # Clear session
         self.session_manager.clear()
         
         # Clear conversation display
-        self.conversation_text.config(state=tk.NORMAL)
-        self.conversation_text.delete(1.0, tk.END)
-        self.conversation_text.config(state=tk.DISABLED)
+        self._clear_conversation()
         
         # Clear overlay
         self.overlay.clear_messages()
         
         self._update_status("New session started")
     
-    def _save_session(self, event=None):
-        """Save current session to file"""
+    def _save_session(self, event=None, blocking=False):
+        """Save current session to file
+        
+        Args:
+            blocking: Write the file before returning instead of on the
+                file worker, used when the session is about to go away
+        """
         if not self.session_manager.messages:
             messagebox.showinfo("No Conversation", "There's no conversation to save.")
             return
@@ -938,10 +1387,7 @@ class GamingTranslatorApp:
             # Ask for file location
             filename = filedialog.asksaveasfilename(
                 defaultextension=".json",
-                filetypes=[
-                    ("JSON files", "*.json"), 
-                    ("All files", "*.*")
-                ],
+                filetypes=_SESSION_FILETYPES,
                 title="Save Session"
             )
             
@@ -949,18 +1395,29 @@ class GamingTranslatorApp:
                 return
             
             # Save session
-            success = self.session_manager.save_session(filename)
-            
-            if success:
-                self._update_status(f"Session saved to {filename}")
-                messagebox.showinfo("Success", f"Session saved successfully to:\n{filename}")
+            self._update_status("Saving session...")
+            work = partial(self.session_manager.save_session, filename)
+            on_done = partial(self._on_session_saved, filename)
+            if blocking:
+                on_done(work(), None)
             else:
-                messagebox.showerror("Error", "Failed to save session")
+                self._run_file_job(work, on_done)
             
         except Exception as e:
             self.logger.error(f"Error saving session: {e}")
             messagebox.showerror("Error", f"Failed to save session: {str(e)}")
     
+    def _on_session_saved(self, filename, success, error):
+        """Report the result of a session save"""
+        if error is not None:
+            self.logger.error(f"Error saving session: {error}")
+            messagebox.showerror("Error", f"Failed to save session: {str(error)}")
+        elif success:
+            self._update_status(f"Session saved to {filename}")
+            messagebox.showinfo("Success", f"Session saved successfully to:\n{filename}")
+        else:
+            messagebox.showerror("Error", "Failed to save session")
+    
     def _load_session(self, event=None):
         """Load session from file"""
         try:
@@ -974,10 +1431,7 @@ class GamingTranslatorApp:
             # Ask for file location
             filename = filedialog.askopenfilename(
                 defaultextension=".json",
-                filetypes=[
-                    ("JSON files", "*.json"), 
-                    ("All files", "*.*")
-                ],
+                filetypes=_SESSION_FILETYPES,
                 title="Load Session"
             )
             
@@ -985,31 +1439,32 @@ class GamingTranslatorApp:
                 return
             
             # Load session
-            success = self.session_manager.load_session(filename)
-            
-            if success:
-                # Clear display
-                self.conversation_text.config(state=tk.NORMAL)
-                self.conversation_text.delete(1.0, tk.END)
-                self.conversation_text.config(state=tk.DISABLED)
-                
-                # Display loaded messages
-                for message in self.session_manager.messages:
-                    self._add_conversation_message(message)
-                
-                # Update overlay
-                self.overlay.clear_messages()
-                for message in self.session_manager.messages[-5:]:  # Only show last 5 messages
-                    self.overlay.add_message(message)
-                
-                self._update_status(f"Session loaded from {filename}")
-            else:
-                messagebox.showerror("Error", "Failed to load session")
+            self._update_status("Loading session...")
+            self._run_file_job(
+                partial(self.session_manager.load_session, filename),
+                partial(self._on_session_loaded, filename)
+            )
             
         except Exception as e:
             self.logger.error(f"Error loading session: {e}")
             messagebox.showerror("Error", f"Failed to load session: {str(e)}")
     
+    def _on_session_loaded(self, filename, success, error):
+        """Display a session once it has been loaded"""
+        if error is not None:
+            self.logger.error(f"Error loading session: {error}")
+            messagebox.showerror("Error", f"Failed to load session: {str(error)}")
+        elif success:
+            # Display loaded messages, older ones load on scroll
+            self._show_conversation(self.session_manager.messages)
+            
+            # Update overlay, only show last 5 messages
+            self.overlay.set_messages(self.session_manager.messages[-5:])
+            
+            self._update_status(f"Session loaded from {filename}")
+        else:
+            messagebox.showerror("Error", "Failed to load session")
+    
     def _export_session(self, format_type):
         """Export session in specified format"""
         if not self.session_manager.messages:
@@ -1018,156 +1473,122 @@ class GamingTranslatorApp:
         
         try:
             # Ask for file location
-            default_ext = EXPORT_FORMATS.get(format_type, {}).get("extension", ".txt")
+            default_ext, filetypes, title = _EXPORT_DIALOG_OPTIONS.get(
+                format_type, _DEFAULT_EXPORT_DIALOG_OPTIONS
+            )
             filename = filedialog.asksaveasfilename(
                 defaultextension=default_ext,
-                filetypes=[
-                    (f"{EXPORT_FORMATS.get(format_type, {}).get('name', 'Text')} files", f"*{default_ext}"),
-                    ("All files", "*.*")
-                ],
-                title=f"Export as {EXPORT_FORMATS.get(format_type, {}).get('name', 'Text')}"
+                filetypes=filetypes,
+                title=title
             )
             
             if not filename:
                 return
             
             # Export session
-            success = self.session_manager.export_session(format_type, filename)
-            
-            if success:
-                self._update_status(f"Session exported to {filename}")
-                messagebox.showinfo("Success", f"Session exported successfully to:\n{filename}")
-            else:
-                messagebox.showerror("Error", "Failed to export session")
+            self._update_status("Exporting session...")
+            self._run_file_job(
+                partial(self.session_manager.export_session, format_type, filename),
+                partial(self._on_session_exported, filename)
+            )
             
         except Exception as e:
             self.logger.error(f"Error exporting session: {e}")
             messagebox.showerror("Error", f"Failed to export session: {str(e)}")
     
+    def _on_session_exported(self, filename, success, error):
+        """Report the result of a session export"""
+        if error is not None:
+            self.logger.error(f"Error exporting session: {error}")
+            messagebox.showerror("Error", f"Failed to export session: {str(error)}")
+        elif success:
+            self._update_status(f"Session exported to {filename}")
+            messagebox.showinfo("Success", f"Session exported successfully to:\n{filename}")
+        else:
+            messagebox.showerror("Error", "Failed to export session")
+    
     def _show_settings(self):
         """Show settings dialog"""
         messagebox.showinfo("Settings", "Settings dialog not implemented yet")
     
     def _show_shortcuts(self):
         """Show keyboard shortcuts dialog"""
-        messagebox.showinfo(
-            "Keyboard Shortcuts",
-            "Toggle Listening: Ctrl+L\n"
-            "Toggle Game Overlay: Ctrl+O\n"
-            "Translate and Speak: Ctrl+T\n"
-            "Save Conversation: Ctrl+S\n"
-            "Hide Overlay: Escape\n"
-            "New Session: Ctrl+N\n"
-            "Load Session: Ctrl+O\n"
-            "Enter: Send Text in Text Box"
-        )
+        messagebox.showinfo("Keyboard Shortcuts", _SHORTCUTS_TEXT)
     
     def _check_dependencies(self):
         """Check for missing dependencies"""
-        missing = []
-        
-        # Check for audio libraries
-        try:
-            import pyaudio
-            import speech_recognition
-        except ImportError:
-            missing.append("Audio libraries (pyaudio, speech_recognition)")
-        
-        # Check for translation library
-        try:
-            from googletrans import Translator
-        except ImportError:
-            missing.append("Translation library (googletrans==4.0.0-rc1)")
-        
-        # Check for TTS libraries
-        try:
-            import pyttsx3
-        except ImportError:
-            try:
-                from gtts import gTTS
-                import pygame
-            except ImportError:
-                missing.append("Text-to-Speech libraries (pyttsx3 or gtts+pygame)")
-        
-        # Check for WhisperX
-        try:
-            import whisperx
-        except ImportError:
-            missing.append("WhisperX (optional for improved recognition)")
-        
-        # Check for reportlab (PDF export)
-        try:
-            from reportlab.lib.pagesizes import letter
-        except ImportError:
-            missing.append("reportlab (optional for PDF export)")
+        missing = _compute_missing_deps()
         
         # Display results
         if missing:
             message = "Missing dependencies:\n\n"
-            for m in missing:
-                message += f"- {m}\n"
+            message += "".join(f"- {m}\n" for m in missing)
+            message += _INSTALL_HINT_TEXT
             
-            message += "\nInstallation commands:\n"
-            message += "pip install pyaudio speechrecognition googletrans==4.0.0-rc1 pyttsx3\n"
-            message += "pip install gtts pygame reportlab\n"
-            message += "pip install git+https://github.com/m-bain/whisperx.git"
-            
-            messagebox.warning(self.root, "Missing Dependencies", message)
+            messagebox.showwarning("Missing Dependencies", message, parent=self.root)
         else:
             messagebox.showinfo("Dependencies", "All required dependencies are installed.")
     
     def _show_first_run_help(self):
         """Show help dialog on first run"""
-        messagebox.showinfo(
-            f"Welcome to {APP_NAME}",
-            f"Welcome to {APP_NAME} v{APP_VERSION}!\n\n"
-            "Quick Start Guide:\n"
-            "1. Select your microphone and test the audio levels\n"
-            "2. Adjust input/output volume as needed\n"
-            "3. Choose your language and your teammate's language\n"
-            "4. Click 'Start Listening' to begin voice recognition\n"
-            "5. Use the overlay during games with Ctrl+O\n\n"
-            "For more help, check the Help menu."
-        )
+        messagebox.showinfo(_FIRST_RUN_TITLE, _FIRST_RUN_TEXT)
     
     def _show_about(self):
         """Show about dialog"""
-        messagebox.showinfo(
-            f"About {APP_NAME}",
-            f"{APP_NAME} v{APP_VERSION}\n\n"
-            "A real-time voice translator for gaming.\n\n"
-            "Features:\n"
-            "- Real-time voice recognition with WhisperX\n"
-            "- Visual audio level monitoring\n"
-            "- Volume controls for input/output\n"
-            "- Automatic language detection\n"
-            "- Fast translation with LibreTranslate support\n"
-            "- In-game overlay\n"
-            "- Session export to multiple formats"
-        )
+        messagebox.showinfo(_ABOUT_TITLE, _ABOUT_TEXT)
     
     def _on_close(self):
         """Handle application close"""
         # Stop listening if active
-        if self.is_listening:
+        if self.state.is_listening:
             self._stop_listening()
         
         # Clean up audio section if it exists
         if self.audio_section:
             self.audio_section.cleanup()
         
+        # Stop the workers and UI pump
+        self._voice_queue.put(None)
+        try:
+            self._tts_q.put_nowait(None)
+        except queue.Full:
+            pass
+        if self._ui_pump_after_id is not None:
+            self.root.after_cancel(self._ui_pump_after_id)
+            self._ui_pump_after_id = None
+        
         # Ask to save session if there are messages
         if self.session_manager.messages and self.config.get_bool("session", "save_session_on_exit", True):
             if messagebox.askyesno(
                 "Save Conversation", 
                 "Do you want to save the conversation before exiting?"
             ):
-                self._save_session()
+                self._save_session(blocking=True)
+        
+        # Let a save or export that is still running finish writing
+        self._file_jobs.put(None)
+        if self._file_worker is not None:
+            self._file_worker.join(timeout=30)
+        
+        # A pending debounced write is folded into the final save below
+        if self._save_after_id is not None:
+            self.root.after_cancel(self._save_after_id)
+            self._save_after_id = None
         
         # Save window position and size
         geometry = self.root.geometry()
-        self.config.set("ui", "window_size", geometry)
-        self.config.save()
+        if geometry != self.config.get("ui", "window_size", ""):
+            self.config.set("ui", "window_size", geometry)
+            self._config_dirty = True
+        
+        # Don't lose an overlay drag that ended just before closing
+        if self.overlay is not None:
+            self.overlay.flush_pending()
+        
+        # Skip the write entirely on a clean shutdown
+        if self._config_dirty:
+            self.config.save()
+            self._config_dirty = False
         
         # Destroy main window
         self.root.destroy()
@@ -3,13 +3,22 @@ In-game overlay for the Gaming Voice Chat Translator
 """
 
 import logging
+import weakref
 import tkinter as tk
+from collections import deque
+from itertools import islice
 
 from gaming_translator.utils.constants import UI_COLORS
 
 class GamingOverlay:
     """Floating overlay for in-game translation"""
     
+    # Most recent messages kept for redraws
+    MAX_KEPT_MESSAGES = 10
+    
+    # Dragging only writes the final position after this quiet period
+    POSITION_SAVE_DELAY_MS = 500
+    
     def __init__(self, parent_app, config):
         """Initialize the overlay with parent application and configuration"""
         self.logger = logging.getLogger("gaming_translator.ui.overlay")
@@ -17,7 +26,25 @@ class GamingOverlay:
         self.config = config
         self.overlay = None
         self.is_visible = False
-        self.messages = []
+        self.is_minimized = False
+        self.mini_button = None
+        self.messages = deque(maxlen=self.MAX_KEPT_MESSAGES)
+        
+        # Set when messages changed while the overlay was hidden
+        self._display_stale = False
+        
+        # Line count of each message currently rendered, oldest first
+        self._rendered_lines = deque()
+        
+        # Formatted segments per message, so redraws don't format them again
+        self._segment_cache = weakref.WeakKeyDictionary()
+        
+        # Pending debounced position save
+        self._save_after_id = None
+        
+        # Messages waiting for the next idle render
+        self._pending_appends = []
+        self._update_pending = False
         
         # Load overlay settings
         self.opacity = config.get_float("overlay", "opacity", 0.9)
@@ -114,6 +141,7 @@ class GamingOverlay:
             height=8
         )
         self.messages_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self._configure_tags()
         
         # Input area
         input_frame = tk.Frame(main_frame, bg=UI_COLORS["CARD_BG"], height=35)
@@ -160,15 +188,34 @@ class GamingOverlay:
                 # Save position for next time
                 self.position_x = x
                 self.position_y = y
-                self.config.set("overlay", "position_x", str(x))
-                self.config.set("overlay", "position_y", str(y))
-                self.config.save()
+                self._schedule_position_save()
             except tk.TclError:
                 pass
         
         self.header.bind("<Button-1>", start_drag)
         self.header.bind("<B1-Motion>", on_drag)
     
+    def _schedule_position_save(self):
+        """Write the overlay position once dragging has paused"""
+        if self._save_after_id is not None:
+            self.overlay.after_cancel(self._save_after_id)
+        self._save_after_id = self.overlay.after(self.POSITION_SAVE_DELAY_MS, self._flush_position)
+    
+    def _flush_position(self):
+        """Save the current overlay position to config"""
+        self._save_after_id = None
+        self.config.set("overlay", "position_x", str(self.position_x))
+        self.config.set("overlay", "position_y", str(self.position_y))
+        self.config.save()
+    
+    def flush_pending(self):
+        """Write a position save that is still waiting on its timer"""
+        if self._save_after_id is None:
+            return
+        
+        self.overlay.after_cancel(self._save_after_id)
+        self._flush_position()
+    
     def show_overlay(self):
         """Show the overlay window"""
         if not self.overlay:
@@ -179,6 +226,9 @@ class GamingOverlay:
         self.overlay.lift()
         self.is_visible = True
         
+        if self._display_stale:
+            self._update_display()
+        
         self.logger.info("Overlay shown")
         return True
     
@@ -229,6 +279,7 @@ class GamingOverlay:
                 # Save position for both overlay and mini button
                 self.position_x = x
                 self.position_y = y
+                self._schedule_position_save()
             except tk.TclError:
                 pass
         
@@ -242,7 +293,7 @@ class GamingOverlay:
     
     def _restore_from_mini(self):
         """Restore overlay from minimized state"""
-        if hasattr(self, 'mini_button'):
+        if self.mini_button is not None:
             # Get position from mini button
             try:
                 x = self.mini_button.winfo_x()
@@ -254,7 +305,7 @@ class GamingOverlay:
             
             # Destroy mini button
             self.mini_button.destroy()
-            delattr(self, 'mini_button')
+            self.mini_button = None
         
         # Show overlay in the same position
         if not self.overlay:
@@ -266,11 +317,14 @@ class GamingOverlay:
         self.is_visible = True
         self.is_minimized = False
         
+        if self._display_stale:
+            self._update_display()
+        
         self.logger.info("Overlay restored from minimized state")
     
     def toggle_overlay(self):
         """Toggle visibility of the overlay window"""
-        if hasattr(self, 'is_minimized') and self.is_minimized:
+        if self.is_minimized:
             self._restore_from_mini()
         elif self.is_visible:
             self.hide_overlay()
@@ -279,51 +333,108 @@ class GamingOverlay:
     
     def add_message(self, message):
         """Add a message to the overlay display"""
-        if not self.overlay and not self.show_overlay():
+        self.messages.append(message)  # The deque drops the oldest past its maxlen
+        
+        # No widgets until the overlay is first shown, create_overlay renders the backlog
+        if not self.overlay:
             return
         
-        self.messages.append(message)
-        if len(self.messages) > 10:  # Keep last 10 messages max
-            self.messages = self.messages[-10:]
+        # Bursts are rendered together on the next idle tick
+        self._pending_appends.append(message)
+        if not self._update_pending:
+            self._update_pending = True
+            self.overlay.after_idle(self._do_update)
+    
+    def _do_update(self):
+        """Render the messages added since the last idle tick"""
+        self._update_pending = False
+        messages = self._pending_appends
+        self._pending_appends = []
         
-        self._update_display()
+        if self._display_stale or not self.is_visible:
+            self._update_display()
+        else:
+            self._append_messages(messages)
     
     def clear_messages(self):
         """Clear all messages from the overlay"""
-        self.messages = []
-        self._update_display()
+        self.set_messages([])
+    
+    def set_messages(self, messages):
+        """Replace the overlay messages, redrawing only if something changed
+        
+        Args:
+            messages: Messages to show, oldest first
+        """
+        messages = deque(messages, maxlen=self.MAX_KEPT_MESSAGES)
+        if [id(m) for m in messages] == [id(m) for m in self.messages]:
+            return
+        
+        self.messages = messages
+        
+        # A hidden overlay is redrawn the next time it is shown
+        if self.overlay and self.is_visible:
+            self._update_display()
+        else:
+            self._display_stale = True
     
     def _update_display(self):
         """Update the messages display"""
         if not self.overlay:
             return
-            
+        
+        # A withdrawn overlay is redrawn once when it is shown again
+        if not self.is_visible:
+            self._display_stale = True
+            self._pending_appends = []
+            return
+        
+        self._display_stale = False
+        
+        # A full redraw already covers any messages waiting to be appended
+        self._pending_appends = []
+        
         try:
             self.messages_text.configure(state=tk.NORMAL)
             self.messages_text.delete(1.0, tk.END)
+            self._rendered_lines.clear()
             
             # Display only the last few messages based on config
-            display_messages = self.messages[-self.max_messages:] if len(self.messages) > self.max_messages else self.messages
+            display_messages = islice(self.messages, max(0, len(self.messages) - self.max_messages), None)
             
+            segments = []
             for msg in display_messages:
-                timestamp = msg.timestamp.strftime("%H:%M")
-                speaker = "You" if msg.is_outgoing else "Teammate"
-                
-                # Format with colors using tags
-                self.messages_text.insert(tk.END, f"[{timestamp}] ", "timestamp")
-                self.messages_text.insert(tk.END, f"{speaker}: ", "speaker")
-                self.messages_text.insert(tk.END, f"{msg.text}\n", "original")
-                
-                if msg.translation:
-                    self.messages_text.insert(tk.END, f"         → ", "arrow")
-                    self.messages_text.insert(tk.END, f"{msg.translation}\n", "translation")
+                msg_segments, line_count = self._message_segments(msg)
+                segments += msg_segments
+                self._rendered_lines.append(line_count)
+            
+            if segments:
+                self.messages_text.insert(tk.END, *segments)
+            
+            self.messages_text.configure(state=tk.DISABLED)
+            self.messages_text.see(tk.END)
+        
+        except Exception as e:
+            self.logger.error(f"Error updating overlay: {e}")
+    
+    def _append_messages(self, messages):
+        """Render new messages and drop the oldest ones past max_messages"""
+        if not self.overlay or not messages:
+            return
+        
+        try:
+            segments = []
+            for msg in messages[-self.max_messages:]:
+                msg_segments, line_count = self._message_segments(msg)
+                segments += msg_segments
+                self._rendered_lines.append(line_count)
+            
+            self.messages_text.configure(state=tk.NORMAL)
+            self.messages_text.insert(tk.END, *segments)
             
-            # Configure tags for styling
-            self.messages_text.tag_configure("timestamp", foreground="#888888")
-            self.messages_text.tag_configure("speaker", foreground=UI_COLORS["ACCENT_COLOR"], font=("Consolas", self.font_size, "bold"))
-            self.messages_text.tag_configure("original", foreground=UI_COLORS["TEXT_COLOR"])
-            self.messages_text.tag_configure("arrow", foreground="#888888")
-            self.messages_text.tag_configure("translation", foreground=UI_COLORS["SUCCESS_COLOR"])
+            while len(self._rendered_lines) > self.max_messages:
+                oldest = self._rendered_lines.popleft()
+                self.messages_text.delete("1.0", f"{oldest + 1}.0")
             
             self.messages_text.configure(state=tk.DISABLED)
             self.messages_text.see(tk.END)
@@ -331,6 +442,45 @@ class GamingOverlay:
         except Exception as e:
             self.logger.error(f"Error updating overlay: {e}")
     
+    def _message_segments(self, msg):
+        """Return the alternating text/tag insert arguments and line count for a message"""
+        cached = self._segment_cache.get(msg)
+        if cached is not None:
+            return cached
+        
+        t = msg.timestamp
+        timestamp = f"{t.hour:02d}:{t.minute:02d}"
+        speaker = "You" if msg.is_outgoing else "Teammate"
+        
+        # Format with colors using tags
+        segments = [
+            f"[{timestamp}] ", "timestamp",
+            f"{speaker}: ", "speaker",
+            f"{msg.text}\n", "original",
+        ]
+        
+        if msg.translation:
+            segments += [
+                "         → ", "arrow",
+                f"{msg.translation}\n", "translation",
+            ]
+        
+        line_count = sum(text.count("\n") for text in segments[::2])
+        self._segment_cache[msg] = (segments, line_count)
+        return segments, line_count
+    
+    def _configure_speaker_tag(self):
+        """Configure the speaker tag, the only tag that depends on the font size"""
+        self.messages_text.tag_configure("speaker", foreground=UI_COLORS["ACCENT_COLOR"], font=("Consolas", self.font_size, "bold"))
+    
+    def _configure_tags(self):
+        """Configure tags for styling once, when the widget is built"""
+        self.messages_text.tag_configure("timestamp", foreground="#888888")
+        self._configure_speaker_tag()
+        self.messages_text.tag_configure("original", foreground=UI_COLORS["TEXT_COLOR"])
+        self.messages_text.tag_configure("arrow", foreground="#888888")
+        self.messages_text.tag_configure("translation", foreground=UI_COLORS["SUCCESS_COLOR"])
+    
     def _send_response(self, event=None):
         """Send response text to parent application for translation"""
         text = self.response_entry.get().strip()
@@ -354,13 +504,30 @@ class GamingOverlay:
         self.config.set("overlay", "opacity", str(self.opacity))
         self.config.save()
     
-    def set_size(self, width, height):
-        """Set the size of the overlay"""
+    def _flush(self):
+        """Apply pending geometry and redraws now
+        
+        Uses update_idletasks rather than update, which would also run
+        queued events and can redraw and resize the whole overlay.
+        """
+        if self.overlay:
+            self.overlay.update_idletasks()
+    
+    def set_size(self, width, height, sync=False):
+        """Set the size of the overlay
+        
+        Args:
+            width: Overlay width in pixels
+            height: Overlay height in pixels
+            sync: Apply the new geometry before returning
+        """
         self.width = int(width)
         self.height = int(height)
         
         if self.overlay:
             self.overlay.geometry(f"{self.width}x{self.height}+{self.position_x}+{self.position_y}")
+            if sync:
+                self._flush()
         
         # Save to config
         self.config.set("overlay", "width", str(self.width))
@@ -373,6 +540,7 @@ class GamingOverlay:
         
         if self.overlay and hasattr(self, 'messages_text'):
             self.messages_text.configure(font=("Consolas", self.font_size))
+            self._configure_speaker_tag()
             self._update_display()  # Refresh display to apply new font
         
         # Save to config
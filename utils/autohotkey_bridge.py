@@ -4,12 +4,370 @@ AutoHotkey integration for sending translated text to in-game chat
 
 import os
 import time
+import atexit
 import logging
+import shutil
+import string
 import subprocess
 import tempfile
 import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
+# In-process keyboard input on Windows, AutoHotkey is the fallback elsewhere
+try:
+    import ctypes
+    from ctypes import wintypes
+    _user32 = ctypes.WinDLL("user32", use_last_error=True)
+    _user32.VkKeyScanW.argtypes = (wintypes.WCHAR,)
+    _user32.VkKeyScanW.restype = ctypes.c_short
+    _user32.MapVirtualKeyW.argtypes = (wintypes.UINT, wintypes.UINT)
+    _user32.MapVirtualKeyW.restype = wintypes.UINT
+except (ImportError, AttributeError, OSError):
+    _user32 = None
+
+# Script files left behind by crashed runs are removed after this long
+_STALE_SCRIPT_AGE = 24 * 60 * 60
+
+# Keep AutoHotkey from flashing a console window, the flag only exists on Windows
+_CREATE_NO_WINDOW = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+
+# Optional Aho-Corasick matcher for game names, the linear scan is the fallback
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Field separator for commands sent to the AutoHotkey server
+_FIELD_SEP = "\x1f"
+
+# Long-lived script that reads one command per stdin line, so sends don't
+# pay for an AutoHotkey process start and a temp file each time
+_SERVER_SCRIPT = """
+; Gaming Voice Chat Translator - AutoHotkey Server
+; Generated automatically - DO NOT EDIT
+
+#NoEnv
+#NoTrayIcon
+#SingleInstance off
+SendMode Input
+SetWorkingDir %A_ScriptDir%
+
+; Each line is a command with fields separated by Chr(31),
+; an empty read means the translator closed the pipe
+stdin := FileOpen("*", "r", "UTF-8")
+Loop
+{
+    line := RTrim(stdin.ReadLine(), "`r`n")
+    if (line = "")
+        ExitApp
+    
+    fields := StrSplit(line, Chr(31))
+    if (fields[1] = "text")
+    {
+        ; Wait for a moment to ensure the game is in focus
+        Sleep 200
+        
+        ; Press chat key
+        Send % "{" fields[2] "}"
+        
+        ; Wait for chat to open
+        Sleep % fields[3]
+        
+        ; Type the text
+        SendRaw % fields[4]
+        
+        ; Wait before sending
+        Sleep % fields[5]
+        
+        ; Press send key
+        Send % "{" fields[6] "}"
+    }
+    else if (fields[1] = "hotkey")
+    {
+        ; Wait for a moment
+        Sleep 200
+        
+        ; Send hotkey
+        Send % fields[2]
+    }
+}
+"""
+
+# One-shot scripts used when the server can't be started
+_SEND_TEXT_TEMPLATE = string.Template("""
+; Gaming Voice Chat Translator - AutoHotkey Script
+; Generated automatically - DO NOT EDIT
+
+#NoEnv
+#SingleInstance force
+SendMode Input
+SetWorkingDir %A_ScriptDir%
+
+; Wait for a moment to ensure the game is in focus
+Sleep 200
+
+; Press chat key
+Send, {${chat_key}}
+
+; Wait for chat to open
+Sleep ${pre_ms}
+
+; Type the text
+SendRaw, ${text}
+
+; Wait before sending
+Sleep ${post_ms}
+
+; Press send key
+Send, {${send_key}}
+
+ExitApp
+""")
+
+_HOTKEY_TEMPLATE = string.Template("""
+; Gaming Voice Chat Translator - AutoHotkey Script
+; Generated automatically - DO NOT EDIT
+
+#NoEnv
+#SingleInstance force
+SendMode Input
+
+; Wait for a moment
+Sleep 200
+
+; Send hotkey
+Send, ${key_combination}
+
+ExitApp
+""")
+
+# Suggested key settings for common games, matched by substring of the game name
+_GAME_SETTINGS = {
+    "valorant": {
+        "team_chat_key": "y",
+        "all_chat_key": "shift+y",
+        "send_key": "Enter",
+        "pre_type_delay": 0.1,
+        "post_type_delay": 0.1
+    },
+    "league of legends": {
+        "team_chat_key": "Enter",
+        "all_chat_key": "shift+Enter",
+        "send_key": "Enter",
+        "pre_type_delay": 0.1,
+        "post_type_delay": 0.1
+    },
+    "counter-strike": {
+        "team_chat_key": "u",
+        "all_chat_key": "y",
+        "send_key": "Enter",
+        "pre_type_delay": 0.15,
+        "post_type_delay": 0.1
+    },
+    "fortnite": {
+        "team_chat_key": "Enter",
+        "all_chat_key": "Enter",
+        "send_key": "Enter",
+        "pre_type_delay": 0.2,
+        "post_type_delay": 0.1
+    },
+    "minecraft": {
+        "team_chat_key": "t",
+        "all_chat_key": "t",
+        "send_key": "Enter",
+        "pre_type_delay": 0.1,
+        "post_type_delay": 0.1
+    },
+    "dota 2": {
+        "team_chat_key": "Enter",
+        "all_chat_key": "shift+Enter",
+        "send_key": "Enter",
+        "pre_type_delay": 0.15,
+        "post_type_delay": 0.1
+    },
+    "apex legends": {
+        "team_chat_key": "Enter",
+        "all_chat_key": "Enter",
+        "send_key": "Enter",
+        "pre_type_delay": 0.2,
+        "post_type_delay": 0.1
+    },
+    "overwatch": {
+        "team_chat_key": "Enter",
+        "all_chat_key": "shift+Enter",
+        "send_key": "Enter",
+        "pre_type_delay": 0.15,
+        "post_type_delay": 0.1
+    }
+}
+
+# Longest names first so the most specific entry wins a substring match
+_GAME_SETTINGS_BY_LENGTH = tuple(
+    sorted(_GAME_SETTINGS.items(), key=lambda item: len(item[0]), reverse=True)
+)
+
+_DEFAULT_GAME_SETTINGS = {
+    "team_chat_key": "Enter",
+    "all_chat_key": "t",
+    "send_key": "Enter",
+    "pre_type_delay": 0.15,
+    "post_type_delay": 0.1
+}
+
+INPUT_KEYBOARD = 1
+KEYEVENTF_EXTENDEDKEY = 0x0001
+KEYEVENTF_KEYUP = 0x0002
+KEYEVENTF_UNICODE = 0x0004
+MAPVK_VK_TO_VSC = 0
+
+# Modifier keys for the shift-state byte returned by VkKeyScanW
+_SHIFT_STATE_KEYS = ((0x01, 0x10), (0x02, 0x11), (0x04, 0x12))
+
+# Keys whose scancode needs the extended flag
+_EXTENDED_KEYS = frozenset((0x21, 0x22, 0x23, 0x24, 0x25, 0x26, 0x27, 0x28, 0x2D, 0x2E, 0x5B, 0x5C))
+
+# Virtual key codes for key names used in the chat settings and hotkeys
+_VK_NAMES = {
+    "enter": 0x0D, "return": 0x0D, "tab": 0x09, "space": 0x20,
+    "escape": 0x1B, "esc": 0x1B, "backspace": 0x08,
+    "shift": 0x10, "ctrl": 0x11, "control": 0x11, "alt": 0x12, "win": 0x5B,
+    **{f"f{n}": 0x6F + n for n in range(1, 25)},
+}
+
+if _user32 is not None:
+    class _KEYBDINPUT(ctypes.Structure):
+        _fields_ = (
+            ("wVk", wintypes.WORD),
+            ("wScan", wintypes.WORD),
+            ("dwFlags", wintypes.DWORD),
+            ("time", wintypes.DWORD),
+            ("dwExtraInfo", wintypes.WPARAM),
+        )
+    
+    class _MOUSEINPUT(ctypes.Structure):
+        # Only here so the union has the size SendInput expects
+        _fields_ = (
+            ("dx", wintypes.LONG),
+            ("dy", wintypes.LONG),
+            ("mouseData", wintypes.DWORD),
+            ("dwFlags", wintypes.DWORD),
+            ("time", wintypes.DWORD),
+            ("dwExtraInfo", wintypes.WPARAM),
+        )
+    
+    class _INPUTUNION(ctypes.Union):
+        _fields_ = (("ki", _KEYBDINPUT), ("mi", _MOUSEINPUT))
+    
+    class _INPUT(ctypes.Structure):
+        _fields_ = (("type", wintypes.DWORD), ("u", _INPUTUNION))
+
+@lru_cache(maxsize=64)
+def _parse_key_combination(key_combination):
+    """
+    Turn a key setting such as "Enter", "y" or "Ctrl+Shift+A" into virtual key codes
+    
+    Returns:
+        tuple: Virtual key codes in press order, or None if a key is unknown
+    """
+    if _user32 is None or not key_combination:
+        return None
+    
+    codes = []
+    for name in key_combination.split("+"):
+        name = name.strip()
+        code = _VK_NAMES.get(name.lower())
+        if code is None and len(name) == 1:
+            scan = _user32.VkKeyScanW(name)
+            if scan == -1:
+                return None
+            
+            # Hold the modifiers the layout needs for this character, e.g. Shift for "?"
+            shift_state = (scan >> 8) & 0xFF
+            for bit, modifier in _SHIFT_STATE_KEYS:
+                if shift_state & bit and modifier not in codes:
+                    codes.append(modifier)
+            code = scan & 0xFF
+        if code is None:
+            return None
+        codes.append(code)
+    
+    return tuple(codes)
+
+def _key_input(vk=0, scan=0, flags=0):
+    """Build one keyboard INPUT record"""
+    return _INPUT(type=INPUT_KEYBOARD, u=_INPUTUNION(ki=_KEYBDINPUT(wVk=vk, wScan=scan, dwFlags=flags)))
+
+@lru_cache(maxsize=None)
+def _vk_scan(vk):
+    """Return the (scancode, flags) pair for a virtual key on the current layout"""
+    flags = KEYEVENTF_EXTENDEDKEY if vk in _EXTENDED_KEYS else 0
+    return _user32.MapVirtualKeyW(vk, MAPVK_VK_TO_VSC), flags
+
+def _vk_input(vk, flags=0):
+    """Build a key event with both the virtual key and its scancode, like AutoHotkey does"""
+    scan, extra_flags = _vk_scan(vk)
+    return _key_input(vk=vk, scan=scan, flags=flags | extra_flags)
+
+def _send_inputs(inputs):
+    """Send all INPUT records in one SendInput call, returns the number injected"""
+    if not inputs:
+        return 0
+    array = (_INPUT * len(inputs))(*inputs)
+    return _user32.SendInput(len(inputs), array, ctypes.sizeof(_INPUT))
+
+def _combination_inputs(codes):
+    """Press the keys in order, then release them in reverse"""
+    return ([_vk_input(code) for code in codes] +
+            [_vk_input(code, KEYEVENTF_KEYUP) for code in reversed(codes)])
+
+def _single_line(text):
+    """Turn line breaks into spaces so a typed message is not sent early"""
+    return text.replace("\r", " ").replace("\n", " ")
+
+def _utf16_units(text):
+    """Split text into UTF-16 code units, characters outside the BMP become surrogate pairs"""
+    data = text.encode("utf-16-le")
+    return [int.from_bytes(data[i:i + 2], "little") for i in range(0, len(data), 2)]
+
+def _text_inputs(text):
+    """Type text as unicode key events, one UTF-16 unit per event pair"""
+    inputs = []
+    for unit in _utf16_units(text):
+        inputs.append(_key_input(scan=unit, flags=KEYEVENTF_UNICODE))
+        inputs.append(_key_input(scan=unit, flags=KEYEVENTF_UNICODE | KEYEVENTF_KEYUP))
+    return inputs
+
+def _build_game_matcher():
+    """Build an automaton over the game names, or None without pyahocorasick"""
+    if ahocorasick is None:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for game_key, settings in _GAME_SETTINGS.items():
+        automaton.add_word(game_key, (game_key, settings))
+    automaton.make_automaton()
+    return automaton
+
+_GAME_MATCHER = _build_game_matcher()
+
+@lru_cache(maxsize=64)
+def _lookup_game_settings(game_name):
+    """Return the settings entry for a lowercased game name"""
+    if _GAME_MATCHER is not None:
+        # One pass over the name, the longest matching game wins as in the scan
+        matches = [match for _, match in _GAME_MATCHER.iter(game_name)]
+        if matches:
+            return max(matches, key=lambda match: len(match[0]))[1]
+    else:
+        for game_key, settings in _GAME_SETTINGS_BY_LENGTH:
+            if game_key in game_name:
+                return settings
+    
+    # Default settings if game not found
+    return _DEFAULT_GAME_SETTINGS
+
 class AutoHotkeyBridge:
     """Bridge to AutoHotkey for sending keystrokes to games"""
     
@@ -22,6 +380,22 @@ class AutoHotkeyBridge:
         self.ahk_path = None
         self._find_autohotkey()
         
+        # Persistent AutoHotkey process, started on first use
+        self._ahk_proc = None
+        self._server_path = None
+        self._server_lock = threading.Lock()
+        
+        # One reused path for fallback one-shot scripts, guarded by a lock
+        self._ahk_temp = os.path.join(tempfile.gettempdir(), f"gvct_{os.getpid()}.ahk")
+        self._script_lock = threading.Lock()
+        
+        # Single worker so chat messages are typed one after another, never interleaved
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ahk-send")
+        
+        # Don't leave scripts in the temp directory, now or from earlier runs
+        atexit.register(self.close)
+        self._remove_stale_scripts()
+        
         # Default key settings
         self.chat_key = config.get("autohotkey", "chat_key", "Enter")
         self.team_chat_key = config.get("autohotkey", "team_chat_key", "y")
@@ -31,11 +405,19 @@ class AutoHotkeyBridge:
         # Delay settings
         self.pre_type_delay = config.get_float("autohotkey", "pre_type_delay", 0.1)
         self.post_type_delay = config.get_float("autohotkey", "post_type_delay", 0.1)
+        self._update_delay_ms()
         
         self.logger.info(f"AutoHotkey bridge initialized, AHK found: {self.ahk_path is not None}")
     
     def _find_autohotkey(self):
         """Find the AutoHotkey executable"""
+        # Reuse the path found on a previous run while it still exists
+        cached_path = self.config.get("autohotkey", "exe_path", "")
+        if cached_path and os.path.exists(cached_path):
+            self.ahk_path = cached_path
+            self.logger.info(f"Found AutoHotkey at: {cached_path}")
+            return
+        
         # Common paths for AutoHotkey
         paths_to_check = [
             # Windows program files
@@ -45,29 +427,140 @@ class AutoHotkeyBridge:
             os.path.expanduser("~/Downloads/AutoHotkey/AutoHotkey.exe"),
         ]
         
-        # Check if AHK is in PATH
-        try:
-            result = subprocess.run(["where", "AutoHotkey"], 
-                                  stdout=subprocess.PIPE, 
-                                  stderr=subprocess.PIPE, 
-                                  text=True)
-            if result.returncode == 0:
-                paths_to_check.insert(0, result.stdout.strip())
-        except:
-            pass
+        # Check if AHK is in PATH, without spawning where.exe
+        path_hit = shutil.which("AutoHotkey.exe") or shutil.which("AutoHotkey")
+        if path_hit:
+            paths_to_check.insert(0, path_hit)
         
         # Check each path
         for path in paths_to_check:
             if os.path.exists(path):
                 self.ahk_path = path
                 self.logger.info(f"Found AutoHotkey at: {path}")
+                
+                # Remember it so the next start skips the search
+                self.config.set("autohotkey", "exe_path", path)
+                self.config.save()
                 return
         
         self.logger.warning("AutoHotkey not found, functionality will be limited")
     
     def is_available(self):
-        """Check if AutoHotkey is available"""
-        return self.ahk_path is not None
+        """Check if keystrokes can be sent, through SendInput or AutoHotkey"""
+        return _user32 is not None or self.ahk_path is not None
+    
+    def _ensure_server(self):
+        """Start the AutoHotkey server if it is not running, caller holds _server_lock"""
+        if self.ahk_path is None:
+            return False
+        
+        if self._ahk_proc is not None and self._ahk_proc.poll() is None:
+            return True
+        
+        try:
+            if self._server_path is None:
+                self._server_path = os.path.join(tempfile.gettempdir(), f"gvct_ahk_server_{os.getpid()}.ahk")
+                with open(self._server_path, 'w', encoding='utf-8') as f:
+                    f.write(_SERVER_SCRIPT)
+            
+            self._ahk_proc = subprocess.Popen(
+                [self.ahk_path, self._server_path],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                creationflags=_CREATE_NO_WINDOW
+            )
+            self.logger.info("AutoHotkey server started")
+            return True
+        
+        except Exception as e:
+            self.logger.error(f"Failed to start AutoHotkey server: {e}")
+            self._ahk_proc = None
+            return False
+    
+    def _send_to_server(self, *fields):
+        """
+        Send one command line to the AutoHotkey server
+        
+        Returns:
+            bool: False if the server could not be reached
+        """
+        # Newlines end a command and the separator splits fields
+        line = _FIELD_SEP.join(
+            _single_line(str(field).replace(_FIELD_SEP, " "))
+            for field in fields
+        ) + "\n"
+        data = line.encode('utf-8')
+        
+        with self._server_lock:
+            # Retry once in case the server exited since the last send
+            for _ in range(2):
+                if not self._ensure_server():
+                    return False
+                
+                try:
+                    self._ahk_proc.stdin.write(data)
+                    self._ahk_proc.stdin.flush()
+                    return True
+                except OSError:
+                    self.logger.warning("AutoHotkey server pipe closed, restarting")
+                    self._ahk_proc = None
+        
+        return False
+    
+    def close(self):
+        """Stop the send worker and AutoHotkey server and remove the scripts"""
+        self._pool.shutdown(wait=False)
+        
+        with self._server_lock:
+            if self._ahk_proc is not None:
+                try:
+                    # Closing stdin makes the server exit on its own
+                    self._ahk_proc.stdin.close()
+                except OSError:
+                    pass
+                self._ahk_proc = None
+            
+            if self._server_path is not None:
+                try:
+                    os.unlink(self._server_path)
+                except OSError:
+                    pass
+                self._server_path = None
+        
+        with self._script_lock:
+            try:
+                os.unlink(self._ahk_temp)
+            except OSError:
+                pass
+    
+    def _update_delay_ms(self):
+        """Precompute the delays in milliseconds for AutoHotkey's Sleep"""
+        self._pre_ms = int(self.pre_type_delay * 1000)
+        self._post_ms = int(self.post_type_delay * 1000)
+    
+    def _remove_stale_scripts(self):
+        """Delete gvct_*.ahk files older than a day, left by runs that were killed"""
+        cutoff = time.time() - _STALE_SCRIPT_AGE
+        try:
+            for path in Path(tempfile.gettempdir()).glob("gvct_*.ahk"):
+                try:
+                    if path.stat().st_mtime < cutoff:
+                        path.unlink()
+                        self.logger.debug(f"Removed stale AutoHotkey script: {path}")
+                except OSError:
+                    pass
+        except OSError as e:
+            self.logger.warning(f"Could not clean up old AutoHotkey scripts: {e}")
+    
+    def _get_chat_key(self, chat_type):
+        """Return the key that opens the given chat type"""
+        if chat_type == "team":
+            return self.team_chat_key
+        elif chat_type == "all":
+            return self.all_chat_key
+        else:  # custom or unknown
+            return self.chat_key
     
     def send_text_to_chat(self, text, chat_type="team"):
         """
@@ -85,82 +578,105 @@ class AutoHotkeyBridge:
         if not text or not text.strip():
             return False
         
-        # Create and run AHK script in a separate thread
-        threading.Thread(
-            target=self._run_send_text_script,
-            args=(text, chat_type),
-            daemon=True
-        ).start()
+        chat_key = self._get_chat_key(chat_type)
+        
+        # Type in-process when every key in the settings is understood
+        chat_codes = _parse_key_combination(chat_key)
+        send_codes = _parse_key_combination(self.send_key)
+        if chat_codes is not None and send_codes is not None:
+            self._pool.submit(self._send_via_sendinput, text, chat_type, chat_codes, send_codes)
+            return True
+        
+        if self.ahk_path is None:
+            self.logger.warning(f"Cannot send chat keys {chat_key!r}/{self.send_key!r} without AutoHotkey")
+            return False
+        
+        # Hand the text to the running server, AutoHotkey does the waiting
+        if self._send_to_server(
+            "text",
+            chat_key,
+            self._pre_ms,
+            text,
+            self._post_ms,
+            self.send_key
+        ):
+            self.logger.info(f"Sent text to {chat_type} chat: {text[:30]}...")
+            return True
+        
+        # Fall back to a one-shot script on the send worker
+        self._pool.submit(self._run_send_text_script, text, chat_type)
         
         return True
     
-    def _run_send_text_script(self, text, chat_type):
-        """Run AutoHotkey script to send text to chat"""
+    def _send_via_sendinput(self, text, chat_type, chat_codes, send_codes):
+        """Open chat, type the text and send it with user32.SendInput"""
         try:
-            # Create temporary AHK script
-            script_content = self._create_send_text_script(text, chat_type)
+            # Wait for a moment to ensure the game is in focus
+            time.sleep(0.2)
             
-            with tempfile.NamedTemporaryFile(suffix='.ahk', delete=False, mode='w') as temp_file:
-                temp_filename = temp_file.name
-                temp_file.write(script_content)
+            # Press chat key and wait for chat to open
+            _send_inputs(_combination_inputs(chat_codes))
+            time.sleep(self.pre_type_delay)
             
-            # Run the script
-            subprocess.run([self.ahk_path, temp_filename], 
-                          stdout=subprocess.PIPE, 
-                          stderr=subprocess.PIPE)
+            # Type the text in one batch, on one line like the AutoHotkey path
+            inputs = _text_inputs(_single_line(text))
+            injected = _send_inputs(inputs)
+            if injected != len(inputs):
+                self.logger.warning(f"SendInput injected {injected} of {len(inputs)} key events")
             
-            # Clean up
-            try:
-                os.unlink(temp_filename)
-            except:
-                pass
+            # Wait before sending, then press send key
+            time.sleep(self.post_type_delay)
+            _send_inputs(_combination_inputs(send_codes))
+            
+            self.logger.info(f"Sent text to {chat_type} chat: {text[:30]}...")
+        
+        except Exception as e:
+            self.logger.error(f"Error sending text to chat: {e}")
+    
+    def _send_hotkey_via_sendinput(self, key_combination, codes):
+        """Press a key combination with user32.SendInput once the game has focus"""
+        try:
+            # Wait for a moment to ensure the game is in focus
+            time.sleep(0.2)
+            
+            _send_inputs(_combination_inputs(codes))
+            self.logger.info(f"Simulated hotkey: {key_combination}")
+        except Exception as e:
+            self.logger.error(f"Error simulating hotkey: {e}")
+    
+    def _run_send_text_script(self, text, chat_type):
+        """Run AutoHotkey script to send text to chat"""
+        try:
+            # Create and run AHK script
+            script_content = self._create_send_text_script(text, chat_type)
+            self._run_script(script_content)
             
             self.logger.info(f"Sent text to {chat_type} chat: {text[:30]}...")
             
         except Exception as e:
             self.logger.error(f"Error sending text to chat: {e}")
     
+    def _run_script(self, script):
+        """Write a one-shot script over the reused temp path and run it to completion"""
+        with self._script_lock:
+            with open(self._ahk_temp, 'w') as f:
+                f.write(script)
+            
+            # Wait so the next script doesn't overwrite this one before it is read
+            subprocess.run([self.ahk_path, self._ahk_temp],
+                          stdout=subprocess.DEVNULL,
+                          stderr=subprocess.DEVNULL,
+                          creationflags=_CREATE_NO_WINDOW)
+    
     def _create_send_text_script(self, text, chat_type):
         """Create AutoHotkey script for sending text to chat"""
-        # Set chat key based on type
-        if chat_type == "team":
-            chat_key = self.team_chat_key
-        elif chat_type == "all":
-            chat_key = self.all_chat_key
-        else:  # custom or unknown
-            chat_key = self.chat_key
-        
-        # Create script
-        script = f"""
-; Gaming Voice Chat Translator - AutoHotkey Script
-; Generated automatically - DO NOT EDIT
-
-#NoEnv
-#SingleInstance force
-SendMode Input
-SetWorkingDir %A_ScriptDir%
-
-; Wait for a moment to ensure the game is in focus
-Sleep 200
-
-; Press chat key
-Send, {{{chat_key}}}
-
-; Wait for chat to open
-Sleep {int(self.pre_type_delay * 1000)}
-
-; Type the text
-SendRaw, {text}
-
-; Wait before sending
-Sleep {int(self.post_type_delay * 1000)}
-
-; Press send key
-Send, {{{self.send_key}}}
-
-ExitApp
-"""
-        return script
+        return _SEND_TEXT_TEMPLATE.substitute(
+            chat_key=self._get_chat_key(chat_type),
+            pre_ms=self._pre_ms,
+            text=_single_line(text),
+            post_ms=self._post_ms,
+            send_key=self.send_key
+        )
     
     def simulate_hotkey(self, key_combination):
         """
@@ -173,39 +689,25 @@ ExitApp
             self.logger.warning("AutoHotkey not available, cannot simulate hotkey")
             return False
         
+        codes = _parse_key_combination(key_combination)
+        if codes is not None:
+            self._pool.submit(self._send_hotkey_via_sendinput, key_combination, codes)
+            return True
+        
+        if self.ahk_path is None:
+            self.logger.warning(f"Cannot simulate hotkey {key_combination!r} without AutoHotkey")
+            return False
+        
+        if self._send_to_server("hotkey", key_combination):
+            self.logger.info(f"Simulated hotkey: {key_combination}")
+            return True
+        
         try:
             # Create temporary AHK script
-            script = f"""
-; Gaming Voice Chat Translator - AutoHotkey Script
-; Generated automatically - DO NOT EDIT
-
-#NoEnv
-#SingleInstance force
-SendMode Input
-
-; Wait for a moment
-Sleep 200
-
-; Send hotkey
-Send, {key_combination}
-
-ExitApp
-"""
-            
-            with tempfile.NamedTemporaryFile(suffix='.ahk', delete=False, mode='w') as temp_file:
-                temp_filename = temp_file.name
-                temp_file.write(script)
+            script = _HOTKEY_TEMPLATE.substitute(key_combination=key_combination)
             
             # Run the script
-            subprocess.run([self.ahk_path, temp_filename], 
-                          stdout=subprocess.PIPE, 
-                          stderr=subprocess.PIPE)
-            
-            # Clean up
-            try:
-                os.unlink(temp_filename)
-            except:
-                pass
+            self._run_script(script)
             
             self.logger.info(f"Simulated hotkey: {key_combination}")
             return True
@@ -241,6 +743,8 @@ ExitApp
             self.post_type_delay = float(post_type_delay)
             self.config.set("autohotkey", "post_type_delay", str(post_type_delay))
         
+        self._update_delay_ms()
+        
         # Save settings
         self.config.save()
         
@@ -256,81 +760,8 @@ ExitApp
         Returns:
             dict: Suggested settings for the game
         """
-        game_name = game_name.lower()
-        
-        # Common game settings
-        game_settings = {
-            "valorant": {
-                "team_chat_key": "y",
-                "all_chat_key": "shift+y",
-                "send_key": "Enter",
-                "pre_type_delay": 0.1,
-                "post_type_delay": 0.1
-            },
-            "league of legends": {
-                "team_chat_key": "Enter",
-                "all_chat_key": "shift+Enter",
-                "send_key": "Enter",
-                "pre_type_delay": 0.1,
-                "post_type_delay": 0.1
-            },
-            "counter-strike": {
-                "team_chat_key": "u",
-                "all_chat_key": "y",
-                "send_key": "Enter",
-                "pre_type_delay": 0.15,
-                "post_type_delay": 0.1
-            },
-            "fortnite": {
-                "team_chat_key": "Enter",
-                "all_chat_key": "Enter",
-                "send_key": "Enter",
-                "pre_type_delay": 0.2,
-                "post_type_delay": 0.1
-            },
-            "minecraft": {
-                "team_chat_key": "t",
-                "all_chat_key": "t",
-                "send_key": "Enter",
-                "pre_type_delay": 0.1,
-                "post_type_delay": 0.1
-            },
-            "dota 2": {
-                "team_chat_key": "Enter",
-                "all_chat_key": "shift+Enter",
-                "send_key": "Enter",
-                "pre_type_delay": 0.15,
-                "post_type_delay": 0.1
-            },
-            "apex legends": {
-                "team_chat_key": "Enter",
-                "all_chat_key": "Enter",
-                "send_key": "Enter",
-                "pre_type_delay": 0.2,
-                "post_type_delay": 0.1
-            },
-            "overwatch": {
-                "team_chat_key": "Enter",
-                "all_chat_key": "shift+Enter",
-                "send_key": "Enter",
-                "pre_type_delay": 0.15,
-                "post_type_delay": 0.1
-            }
-        }
-        
-        # Try to find the game in our database
-        for game_key, settings in game_settings.items():
-            if game_key in game_name:
-                return settings
-        
-        # Default settings if game not found
-        return {
-            "team_chat_key": "Enter",
-            "all_chat_key": "t",
-            "send_key": "Enter",
-            "pre_type_delay": 0.15,
-            "post_type_delay": 0.1
-        }
+        # Copy so callers can't modify the shared table
+        return dict(_lookup_game_settings(game_name.lower()))
     
     @staticmethod
     def install_info():
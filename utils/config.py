@@ -4,15 +4,145 @@ Handles loading, saving, and managing application settings
 """
 
 import os
+import sys
 import configparser
+import importlib.util
 import logging
+import threading
+import types
+from datetime import datetime
+from functools import cached_property
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Mapping, Optional
+
+# Marks a cache miss, None is a valid cached value
+_MISS = object()
+
+# Stand-in for a missing section in snapshot reads
+_EMPTY_SECTION = {}
+_EMPTY_SECTION_VIEW = types.MappingProxyType(_EMPTY_SECTION)
+
+# Same spellings ConfigParser.getboolean accepts
+_BOOL_MAP = {
+    "1": True, "yes": True, "true": True, "on": True,
+    "0": False, "no": False, "false": False, "off": False,
+}
+
+# Default configuration, built once at import
+_DEFAULTS = {
+    # UI Settings
+    "ui": {
+        "window_size": "900x700",
+        "theme": "dark",
+        "font_size": "10",
+        "always_on_top": "false",
+        "minimize_to_tray": "true"
+    },
+    
+    # Audio Settings
+    "audio": {
+        "input_volume": "0.8",
+        "output_volume": "0.7",
+        "input_device": "",
+        "output_device": "",
+        "noise_suppression": "true",
+        "echo_cancellation": "true"
+    },
+    
+    # Recognition Settings
+    "recognition": {
+        "engine": "whisper",  # whisper, google, azure, etc.
+        "model_size": "base",  # tiny, base, small, medium, large
+        "language": "auto",
+        "device_index": "",
+        "sample_rate": "16000",
+        "chunk_duration": "1.0",
+        "energy_threshold": "300",
+        "dynamic_energy_threshold": "true",
+        "pause_threshold": "0.8",
+        "timeout": "5.0"
+    },
+    
+    # Translation Settings
+    "translation": {
+        "service": "google",  # google, libre, azure, etc.
+        "my_language": "en",
+        "target_language": "es",
+        "auto_detect": "true",
+        "cache_translations": "true",
+        "api_key": "",
+        "custom_endpoint": ""
+    },
+    
+    # TTS Settings
+    "tts": {
+        "engine": "pyttsx3",  # pyttsx3, gtts, azure, etc.
+        "voice": "default",
+        "rate": "150",
+        "volume": "0.8",
+        "language": "auto",
+        "buffer_size": "4096",
+        "audio_cache_size": "32"
+    },
+    
+    # Session Settings
+    "session": {
+        "auto_save": "true",
+        "save_interval": "300",  # seconds
+        "max_history": "100",
+        "export_format": "json",
+        "save_session_on_exit": "true"
+    },
+    
+    # Overlay Settings
+    "overlay": {
+        "enabled": "false",
+        "position_x": "100",
+        "position_y": "100",
+        "width": "400",
+        "height": "300",
+        "opacity": "0.9",
+        "auto_hide": "false",
+        "hide_delay": "5.0"
+    },
+    
+    # Hotkeys Settings
+    "hotkeys": {
+        "toggle_listening": "ctrl+l",
+        "toggle_overlay": "ctrl+o",
+        "translate_and_speak": "ctrl+t",
+        "push_to_talk": "",
+        "mute_toggle": "ctrl+m"
+    },
+    
+    # Logging Settings
+    "logging": {
+        "level": "INFO",
+        "file_logging": "true",
+        "console_logging": "true",
+        "max_log_size": "10485760",  # 10MB
+        "backup_count": "5"
+    },
+    
+    # First run flag
+    "internal": {
+        "first_run": "true",
+        "version": "2.0.0",
+        "last_updated": ""
+    }
+}
 
 
 class Config:
     """Configuration manager for the Gaming Voice Chat Translator"""
     
+    # Backends whose config is just the engine name, as (section, key, fallback)
+    _BACKEND_DISPATCH = {
+        "recognition": ("recognition", "engine", "google"),
+        "translation": ("translation", "service", "google"),
+        "tts": ("tts", "engine", "pyttsx3"),
+    }
+    
     def __init__(self, config_file: Optional[Path] = None):
         """Initialize configuration manager
         
@@ -27,11 +157,27 @@ class Config:
         else:
             # Default config location
             config_dir = Path.home() / ".gaming_translator"
-            config_dir.mkdir(parents=True, exist_ok=True)
+            if not config_dir.is_dir():
+                config_dir.mkdir(parents=True, exist_ok=True)
             self.config_file = config_dir / "config.ini"
         
-        # Initialize ConfigParser
-        self.config = configparser.ConfigParser()
+        # Initialize ConfigParser, values never use %(name)s interpolation
+        self.config = configparser.RawConfigParser()
+        
+        # Plain dict copy of every section, reads are served from here and
+        # ConfigParser is only written to
+        self._snapshot = {}
+        
+        # Unsaved changes, the first save always writes the file
+        self._dirty = True
+        
+        # (mtime, size) of the file when memory last matched it, None after any change
+        self._load_key = None
+        
+        # Memoized typed getter results keyed by (section, key, fallback), cleared on every write
+        self._bool_cache = {}
+        self._int_cache = {}
+        self._float_cache = {}
         
         # Set up default configuration
         self._setup_defaults()
@@ -39,13 +185,19 @@ class Config:
         # Load existing config if it exists
         self.load()
         
-        # Add GPU detection
-        self.has_gpu = self._detect_gpu()
-        
         self.logger.info(f"Configuration initialized: {self.config_file}")
     
+    @cached_property
+    def has_gpu(self) -> bool:
+        """Whether a CUDA-capable GPU is available, detected on first access"""
+        return self._detect_gpu()
+    
     def _detect_gpu(self) -> bool:
         """Detect if CUDA-capable GPU is available"""
+        # Skip the expensive import attempt when torch isn't installed at all
+        if importlib.util.find_spec("torch") is None:
+            return False
+        
         try:
             import torch
             return torch.cuda.is_available()
@@ -54,129 +206,80 @@ class Config:
     
     def _setup_defaults(self):
         """Set up default configuration values"""
-        # UI Settings
-        self.config["ui"] = {
-            "window_size": "900x700",
-            "theme": "dark",
-            "font_size": "10",
-            "always_on_top": "false",
-            "minimize_to_tray": "true"
-        }
-        
-        # Audio Settings
-        self.config["audio"] = {
-            "input_volume": "0.8",
-            "output_volume": "0.7",
-            "input_device": "",
-            "output_device": "",
-            "noise_suppression": "true",
-            "echo_cancellation": "true"
-        }
-        
-        # Recognition Settings
-        self.config["recognition"] = {
-            "engine": "whisper",  # whisper, google, azure, etc.
-            "model_size": "base",  # tiny, base, small, medium, large
-            "language": "auto",
-            "device_index": "",
-            "sample_rate": "16000",
-            "chunk_duration": "1.0",
-            "energy_threshold": "300",
-            "dynamic_energy_threshold": "true",
-            "pause_threshold": "0.8",
-            "timeout": "5.0"
-        }
-        
-        # Translation Settings
-        self.config["translation"] = {
-            "service": "google",  # google, libre, azure, etc.
-            "my_language": "en",
-            "target_language": "es",
-            "auto_detect": "true",
-            "cache_translations": "true",
-            "api_key": "",
-            "custom_endpoint": ""
-        }
-        
-        # TTS Settings
-        self.config["tts"] = {
-            "engine": "pyttsx3",  # pyttsx3, gtts, azure, etc.
-            "voice": "default",
-            "rate": "150",
-            "volume": "0.8",
-            "language": "auto"
-        }
-        
-        # Session Settings
-        self.config["session"] = {
-            "auto_save": "true",
-            "save_interval": "300",  # seconds
-            "max_history": "100",
-            "export_format": "json",
-            "save_session_on_exit": "true"
-        }
-        
-        # Overlay Settings
-        self.config["overlay"] = {
-            "enabled": "false",
-            "position_x": "100",
-            "position_y": "100",
-            "width": "400",
-            "height": "300",
-            "opacity": "0.9",
-            "auto_hide": "false",
-            "hide_delay": "5.0"
-        }
-        
-        # Hotkeys Settings
-        self.config["hotkeys"] = {
-            "toggle_listening": "ctrl+l",
-            "toggle_overlay": "ctrl+o",
-            "translate_and_speak": "ctrl+t",
-            "push_to_talk": "",
-            "mute_toggle": "ctrl+m"
-        }
-        
-        # Logging Settings
-        self.config["logging"] = {
-            "level": "INFO",
-            "file_logging": "true",
-            "console_logging": "true",
-            "max_log_size": "10485760",  # 10MB
-            "backup_count": "5"
-        }
+        self.config.read_dict(_DEFAULTS)
+    
+    def _invalidate_cache(self):
+        """Forget memoized getter results after the configuration changed"""
+        self._bool_cache.clear()
+        self._int_cache.clear()
+        self._float_cache.clear()
+        self._load_key = None
+    
+    def _rebuild_snapshot(self):
+        """Copy every ConfigParser section into the read snapshot
         
-        # First run flag
-        self.config["internal"] = {
-            "first_run": "true",
-            "version": "2.0.0",
-            "last_updated": ""
+        Names read from the file are interned so they are the same objects
+        as the string literals callers pass in, and dict lookups hit on
+        identity without comparing characters.
+        """
+        self._snapshot = {
+            sys.intern(section): {
+                sys.intern(option): value
+                for option, value in self.config.items(section, raw=True)
+            }
+            for section in self.config.sections()
         }
+        self._invalidate_cache()
+    
+    def _file_key(self):
+        """Return (mtime_ns, size) of the config file, or None if it can't be read"""
+        try:
+            st = self.config_file.stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
     
     def load(self):
-        """Load configuration from file"""
-        if self.config_file.exists():
+        """Load configuration from file, skipped when it is unchanged since the last load or save"""
+        file_key = self._file_key()
+        if file_key is not None and file_key == self._load_key:
+            return
+        
+        if file_key is not None:
             try:
                 self.config.read(self.config_file)
                 self.logger.info(f"Configuration loaded from {self.config_file}")
-            except Exception as e:
+            except (OSError, UnicodeDecodeError, configparser.Error) as e:
                 self.logger.error(f"Error loading config: {e}")
                 self.logger.info("Using default configuration")
+                file_key = None
         else:
             self.logger.info("No existing config found, using defaults")
+        
+        self._rebuild_snapshot()
+        self._load_key = file_key
     
     def save(self):
-        """Save configuration to file"""
+        """Save configuration to file, skipped when nothing changed since the last save"""
+        if not self._dirty:
+            return True
+        
         try:
             # Ensure parent directory exists
-            self.config_file.parent.mkdir(parents=True, exist_ok=True)
+            if not self.config_file.parent.is_dir():
+                self.config_file.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(self.config_file, 'w') as f:
+            # Write next to the target and swap it in, so a crash never leaves half a file
+            tmp_file = self.config_file.with_name(self.config_file.name + ".tmp")
+            with open(tmp_file, 'w') as f:
                 self.config.write(f)
+            os.replace(tmp_file, self.config_file)
             
+            self._dirty = False
+            self._load_key = self._file_key()
             self.logger.info(f"Configuration saved to {self.config_file}")
             return True
-        except Exception as e:
+        except OSError as e:
             self.logger.error(f"Error saving config: {e}")
             return False
     
@@ -191,10 +294,13 @@ class Config:
         Returns:
             Configuration value as string
         """
-        try:
-            return self.config.get(section, key, fallback=fallback)
-        except (configparser.NoSectionError, configparser.NoOptionError):
-            return fallback
+        values = self._snapshot.get(section, _EMPTY_SECTION)
+        
+        # Callers pass lowercase keys, only normalize when the direct lookup misses
+        value = values.get(key, _MISS)
+        if value is _MISS:
+            value = values.get(self.config.optionxform(key), fallback)
+        return value
     
     def get_bool(self, section: str, key: str, fallback: bool = False) -> bool:
         """Get configuration value as boolean
@@ -207,10 +313,13 @@ class Config:
         Returns:
             Configuration value as boolean
         """
-        try:
-            return self.config.getboolean(section, key, fallback=fallback)
-        except (configparser.NoSectionError, configparser.NoOptionError):
-            return fallback
+        cache_key = (section, key, fallback)
+        value = self._bool_cache.get(cache_key, _MISS)
+        if value is _MISS:
+            raw = self.get(section, key)
+            value = fallback if raw is None else _BOOL_MAP.get(raw.lower(), fallback)
+            self._bool_cache[cache_key] = value
+        return value
     
     def get_int(self, section: str, key: str, fallback: int = 0) -> int:
         """Get configuration value as integer
@@ -223,10 +332,15 @@ class Config:
         Returns:
             Configuration value as integer
         """
-        try:
-            return self.config.getint(section, key, fallback=fallback)
-        except (configparser.NoSectionError, configparser.NoOptionError, ValueError):
-            return fallback
+        cache_key = (section, key, fallback)
+        value = self._int_cache.get(cache_key, _MISS)
+        if value is _MISS:
+            try:
+                value = int(self.get(section, key))
+            except (TypeError, ValueError):
+                value = fallback
+            self._int_cache[cache_key] = value
+        return value
     
     def get_float(self, section: str, key: str, fallback: float = 0.0) -> float:
         """Get configuration value as float
@@ -239,10 +353,15 @@ class Config:
         Returns:
             Configuration value as float
         """
-        try:
-            return self.config.getfloat(section, key, fallback=fallback)
-        except (configparser.NoSectionError, configparser.NoOptionError, ValueError):
-            return fallback
+        cache_key = (section, key, fallback)
+        value = self._float_cache.get(cache_key, _MISS)
+        if value is _MISS:
+            try:
+                value = float(self.get(section, key))
+            except (TypeError, ValueError):
+                value = fallback
+            self._float_cache[cache_key] = value
+        return value
     
     def set(self, section: str, key: str, value: Any):
         """Set configuration value
@@ -252,10 +371,36 @@ class Config:
             key: Configuration key
             value: Value to set
         """
+        value = str(value)
+        option = sys.intern(self.config.optionxform(key))
+        if self._snapshot.get(section, _EMPTY_SECTION).get(option) == value:
+            return
+        
+        self._invalidate_cache()
+        self._dirty = True
+        try:
+            self.config.set(section, key, value)
+        except configparser.NoSectionError:
+            self.config.add_section(section)
+            self.config.set(section, key, value)
+        self._snapshot.setdefault(sys.intern(section), {})[option] = value
+    
+    def _set_many(self, section: str, values: dict):
+        """Set several values in one section, invalidating caches once
+        
+        Args:
+            section: Configuration section
+            values: Key-value pairs to set
+        """
         if not self.config.has_section(section):
             self.config.add_section(section)
         
-        self.config.set(section, key, str(value))
+        options = {sys.intern(self.config.optionxform(key)): str(value) for key, value in values.items()}
+        self.config[section].update(options)
+        self._snapshot.setdefault(sys.intern(section), {}).update(options)
+        
+        self._invalidate_cache()
+        self._dirty = True
     
     def remove(self, section: str, key: Optional[str] = None):
         """Remove configuration section or key
@@ -264,19 +409,28 @@ class Config:
             section: Configuration section
             key: Configuration key (if None, removes entire section)
         """
+        self._invalidate_cache()
+        self._dirty = True
         if key is None:
             # Remove entire section
             if self.config.has_section(section):
                 self.config.remove_section(section)
+            self._snapshot.pop(section, None)
         else:
             # Remove specific key
             if self.config.has_section(section):
                 self.config.remove_option(section, key)
+            self._snapshot.get(section, {}).pop(self.config.optionxform(key), None)
     
     def reset_to_defaults(self):
         """Reset configuration to default values"""
         self.config.clear()
         self._setup_defaults()
+        
+        # The defaults are already plain dicts, copy them instead of reading ConfigParser back
+        self._snapshot = {section: dict(values) for section, values in _DEFAULTS.items()}
+        self._invalidate_cache()
+        self._dirty = True
         self.logger.info("Configuration reset to defaults")
     
     def is_first_run(self) -> bool:
@@ -285,23 +439,37 @@ class Config:
     
     def mark_first_run_complete(self):
         """Mark the first run as complete"""
-        self.set("internal", "first_run", "false")
-        from datetime import datetime
-        self.set("internal", "last_updated", datetime.now().isoformat())
+        self._set_many("internal", {
+            "first_run": "false",
+            "last_updated": datetime.now().isoformat()
+        })
         self.save()
     
-    def get_section(self, section: str) -> dict:
+    def get_section(self, section: str) -> Mapping[str, str]:
         """Get all values from a configuration section
         
+        Args:
+            section: Configuration section name
+        
+        Returns:
+            Read-only view of the key-value pairs in the section, use
+            get_section_copy for a dictionary that can be modified
+        """
+        values = self._snapshot.get(section)
+        if values is None:
+            return _EMPTY_SECTION_VIEW
+        return types.MappingProxyType(values)
+    
+    def get_section_copy(self, section: str) -> dict:
+        """Get a modifiable copy of all values from a configuration section
+        
         Args:
             section: Configuration section name
             
         Returns:
             Dictionary of key-value pairs from the section
         """
-        if self.config.has_section(section):
-            return dict(self.config.items(section))
-        return {}
+        return dict(self._snapshot.get(section, _EMPTY_SECTION))
     
     def has_section(self, section: str) -> bool:
         """Check if configuration section exists
@@ -312,7 +480,7 @@ class Config:
         Returns:
             True if section exists, False otherwise
         """
-        return self.config.has_section(section)
+        return section in self._snapshot
     
     def has_option(self, section: str, key: str) -> bool:
         """Check if configuration option exists
@@ -324,7 +492,8 @@ class Config:
         Returns:
             True if option exists, False otherwise
         """
-        return self.config.has_option(section, key)
+        values = self._snapshot.get(section, _EMPTY_SECTION)
+        return key in values or self.config.optionxform(key) in values
     
     def update_from_dict(self, config_dict: dict):
         """Update configuration from dictionary
@@ -332,12 +501,15 @@ class Config:
         Args:
             config_dict: Dictionary with section->key->value structure
         """
+        self._invalidate_cache()
+        self._dirty = True
         for section, values in config_dict.items():
-            if not self.config.has_section(section):
-                self.config.add_section(section)
+            values = {key: str(value) for key, value in values.items()}
+            self.config.read_dict({section: values})
             
+            snapshot_section = self._snapshot.setdefault(sys.intern(section), {})
             for key, value in values.items():
-                self.config.set(section, key, str(value))
+                snapshot_section[sys.intern(self.config.optionxform(key))] = value
     
     def to_dict(self) -> dict:
         """Convert configuration to dictionary
@@ -345,10 +517,7 @@ class Config:
         Returns:
             Dictionary representation of configuration
         """
-        result = {}
-        for section in self.config.sections():
-            result[section] = dict(self.config.items(section))
-        return result
+        return {section: dict(values) for section, values in self._snapshot.items()}
     
     def __str__(self) -> str:
         """String representation of configuration"""
@@ -368,15 +537,12 @@ class Config:
             Backend type string or configuration dictionary
         """
         # For compatibility with existing code that expects strings
-        if backend_type == "recognition":
-            return self.get("recognition", "engine", "google")
-        elif backend_type == "translation":
-            return self.get("translation", "service", "google")
-        elif backend_type == "tts":
-            return self.get("tts", "engine", "pyttsx3")
-        else:
-            # Return full section for other types
-            return self.get_section(backend_type)
+        entry = self._BACKEND_DISPATCH.get(backend_type)
+        if entry is not None:
+            return self.get(*entry)
+        
+        # Return full section for other types
+        return self.get_section(backend_type)
     
     def get_recognition_config(self) -> dict:
         """Get voice recognition configuration"""
@@ -409,6 +575,7 @@ class Config:
 
 # Convenience function for creating a global config instance
 _global_config = None
+_global_config_lock = threading.Lock()
 
 def get_config(config_file: Optional[Path] = None) -> Config:
     """Get global configuration instance
@@ -420,12 +587,19 @@ def get_config(config_file: Optional[Path] = None) -> Config:
         Global Config instance
     """
     global _global_config
-    if _global_config is None:
-        _global_config = Config(config_file)
-    return _global_config
+    config = _global_config
+    if config is not None:
+        return config
+    
+    # Only the first callers take the lock, and only one of them builds the instance
+    with _global_config_lock:
+        if _global_config is None:
+            _global_config = Config(config_file)
+        return _global_config
 
 
 def reset_global_config():
     """Reset the global configuration instance"""
     global _global_config
-    _global_config = None
\ No newline at end of file
+    with _global_config_lock:
+        _global_config = None
\ No newline at end of file
@@ -3,6 +3,17 @@ Constants and configuration values for the Gaming Voice Chat Translator
 Contains application metadata, UI colors, supported languages, and export formats
 """
 
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Optional
+
+
+def _interned(table: dict) -> dict:
+    """Return a copy of a lookup table with its keys interned"""
+    return {sys.intern(key): value for key, value in table.items()}
+
+
 # Application Information
 APP_NAME = "Gaming Voice Chat Translator"
 APP_VERSION = "2.0.0"
@@ -11,7 +22,7 @@ APP_AUTHOR = "Gaming Translator Team"
 APP_URL = "https://github.com/gaming-translator/gaming-voice-chat-translator"
 
 # UI Color Scheme (Dark Theme)
-UI_COLORS = {
+UI_COLORS = MappingProxyType({
     "BG_COLOR": "#2b2b2b",           # Main background
     "CARD_BG": "#3c3c3c",           # Card/panel background
     "TEXT_COLOR": "#ffffff",         # Primary text
@@ -24,10 +35,10 @@ UI_COLORS = {
     "HOVER_COLOR": "#484848",        # Hover states
     "SELECTED_COLOR": "#1976d2",     # Selected states
     "DISABLED_COLOR": "#666666",     # Disabled elements
-}
+})
 
 # Supported Gaming Languages with flags and language codes
-GAMING_LANGUAGES = {
+GAMING_LANGUAGES = _interned({
     # Major gaming languages
     "en": {"name": "English", "flag": "🇺🇸", "tts_available": True},
     "es": {"name": "Spanish", "flag": "🇪🇸", "tts_available": True},
@@ -90,10 +101,44 @@ GAMING_LANGUAGES = {
     "ga": {"name": "Irish", "flag": "🇮🇪", "tts_available": True},
     "cy": {"name": "Welsh", "flag": "🏴󠁧󠁢󠁷󠁬󠁳󠁿", "tts_available": True},
     "mt": {"name": "Maltese", "flag": "🇲🇹", "tts_available": False},
-}
+})
+
+# Every supported language code, shared by the services below
+_ALL_LANG_CODES = tuple(GAMING_LANGUAGES)
+
+# Reverse lookups from display name or flag back to a language code
+LANG_CODE_BY_NAME = MappingProxyType({info["name"]: code for code, info in GAMING_LANGUAGES.items()})
+LANG_CODE_BY_FLAG = MappingProxyType({info["flag"]: code for code, info in GAMING_LANGUAGES.items()})
+TTS_CAPABLE_CODES = frozenset(code for code, info in GAMING_LANGUAGES.items() if info["tts_available"])
+
+
+@lru_cache(maxsize=256)
+def get_language_info(code: str) -> Optional[dict]:
+    """Look up a language, falling back from a regional variant to its base
+    
+    Prefer this over GAMING_LANGUAGES.get() for codes that come from
+    recognizers or saved sessions, e.g. "fr-ca" resolves to French.
+    
+    Args:
+        code: Language code such as "en" or "pt-br"
+    
+    Returns:
+        Language info dict, or None if neither the code nor its base is known
+    """
+    info = GAMING_LANGUAGES.get(code)
+    if info is None and code:
+        info = GAMING_LANGUAGES.get(code.split("-", 1)[0])
+    return info
+
+
+@lru_cache(maxsize=256)
+def tts_supported(code: str) -> bool:
+    """Check whether text-to-speech is available for a language code"""
+    info = get_language_info(code)
+    return bool(info and info["tts_available"])
 
 # Export formats for conversation sessions
-EXPORT_FORMATS = {
+EXPORT_FORMATS = _interned({
     "json": {
         "name": "JSON",
         "extension": ".json",
@@ -124,10 +169,10 @@ EXPORT_FORMATS = {
         "extension": ".pdf",
         "description": "Portable Document Format (requires reportlab)"
     }
-}
+})
 
 # Audio Configuration
-AUDIO_CONFIG = {
+AUDIO_CONFIG = MappingProxyType({
     "SAMPLE_RATE": 16000,
     "CHUNK_SIZE": 1024,
     "CHANNELS": 1,
@@ -135,114 +180,148 @@ AUDIO_CONFIG = {
     "MAX_RECORDING_TIME": 30,  # seconds
     "SILENCE_THRESHOLD": 300,
     "PAUSE_THRESHOLD": 0.8,
-}
+})
+
 
 # Recognition Engines
-RECOGNITION_ENGINES = {
-    "whisper": {
-        "name": "OpenAI Whisper",
-        "description": "High-quality offline speech recognition",
-        "requires_internet": False,
-        "supported_languages": list(GAMING_LANGUAGES.keys()),
-        "models": ["tiny", "base", "small", "medium", "large"]
-    },
-    "whisperx": {
-        "name": "WhisperX",
-        "description": "Enhanced Whisper with faster processing",
-        "requires_internet": False,
-        "supported_languages": list(GAMING_LANGUAGES.keys()),
-        "models": ["tiny", "base", "small", "medium", "large"]
-    },
-    "google": {
-        "name": "Google Speech Recognition",
-        "description": "Google's cloud-based speech recognition",
-        "requires_internet": True,
-        "supported_languages": list(GAMING_LANGUAGES.keys()),
-        "models": ["default"]
-    },
-    "azure": {
-        "name": "Azure Speech Services",
-        "description": "Microsoft's cloud speech recognition",
-        "requires_internet": True,
-        "supported_languages": list(GAMING_LANGUAGES.keys()),
-        "models": ["default"]
-    }
-}
+def _build_recognition_engines():
+    """Speech recognition engine metadata, built on first access to RECOGNITION_ENGINES"""
+    return _interned({
+        "whisper": {
+            "name": "OpenAI Whisper",
+            "description": "High-quality offline speech recognition",
+            "requires_internet": False,
+            "supported_languages": _ALL_LANG_CODES,
+            "models": ["tiny", "base", "small", "medium", "large"]
+        },
+        "whisperx": {
+            "name": "WhisperX",
+            "description": "Enhanced Whisper with faster processing",
+            "requires_internet": False,
+            "supported_languages": _ALL_LANG_CODES,
+            "models": ["tiny", "base", "small", "medium", "large"]
+        },
+        "google": {
+            "name": "Google Speech Recognition",
+            "description": "Google's cloud-based speech recognition",
+            "requires_internet": True,
+            "supported_languages": _ALL_LANG_CODES,
+            "models": ["default"]
+        },
+        "azure": {
+            "name": "Azure Speech Services",
+            "description": "Microsoft's cloud speech recognition",
+            "requires_internet": True,
+            "supported_languages": _ALL_LANG_CODES,
+            "models": ["default"]
+        }
+    })
+
 
 # Translation Services
-TRANSLATION_SERVICES = {
-    "google": {
-        "name": "Google Translate",
-        "description": "Google's translation service",
-        "requires_api_key": False,
-        "requires_internet": True,
-        "supported_languages": list(GAMING_LANGUAGES.keys()),
-        "rate_limit": "100/day (free)"
-    },
-    "libre": {
-        "name": "LibreTranslate",
-        "description": "Open-source translation service",
-        "requires_api_key": False,
-        "requires_internet": True,
-        "supported_languages": list(GAMING_LANGUAGES.keys()),
-        "rate_limit": "5/minute (free)"
-    },
-    "azure": {
-        "name": "Azure Translator",
-        "description": "Microsoft's translation service",
-        "requires_api_key": True,
-        "requires_internet": True,
-        "supported_languages": list(GAMING_LANGUAGES.keys()),
-        "rate_limit": "2M chars/month (free tier)"
-    },
-    "openai": {
-        "name": "OpenAI GPT Translation",
-        "description": "AI-powered contextual translation",
-        "requires_api_key": True,
-        "requires_internet": True,
-        "supported_languages": list(GAMING_LANGUAGES.keys()),
-        "rate_limit": "Varies by plan"
-    }
-}
+def _build_translation_services():
+    """Translation service metadata, built on first access to TRANSLATION_SERVICES"""
+    return _interned({
+        "google": {
+            "name": "Google Translate",
+            "description": "Google's translation service",
+            "requires_api_key": False,
+            "requires_internet": True,
+            "supported_languages": _ALL_LANG_CODES,
+            "rate_limit": "100/day (free)"
+        },
+        "libre": {
+            "name": "LibreTranslate",
+            "description": "Open-source translation service",
+            "requires_api_key": False,
+            "requires_internet": True,
+            "supported_languages": _ALL_LANG_CODES,
+            "rate_limit": "5/minute (free)"
+        },
+        "azure": {
+            "name": "Azure Translator",
+            "description": "Microsoft's translation service",
+            "requires_api_key": True,
+            "requires_internet": True,
+            "supported_languages": _ALL_LANG_CODES,
+            "rate_limit": "2M chars/month (free tier)"
+        },
+        "openai": {
+            "name": "OpenAI GPT Translation",
+            "description": "AI-powered contextual translation",
+            "requires_api_key": True,
+            "requires_internet": True,
+            "supported_languages": _ALL_LANG_CODES,
+            "rate_limit": "Varies by plan"
+        }
+    })
+
 
 # Text-to-Speech Engines
-TTS_ENGINES = {
-    "pyttsx3": {
-        "name": "PyTTSx3",
-        "description": "Offline text-to-speech engine",
-        "requires_internet": False,
-        "supported_languages": ["en", "es", "fr", "de", "it", "pt", "ru"],
-        "quality": "medium",
-        "speed": "fast"
-    },
-    "gtts": {
-        "name": "Google Text-to-Speech",
-        "description": "Google's cloud TTS service",
-        "requires_internet": True,
-        "supported_languages": list(GAMING_LANGUAGES.keys()),
-        "quality": "high",
-        "speed": "medium"
-    },
-    "azure": {
-        "name": "Azure Speech Services",
-        "description": "Microsoft's cloud TTS service",
-        "requires_internet": True,
-        "supported_languages": list(GAMING_LANGUAGES.keys()),
-        "quality": "high",
-        "speed": "fast"
-    },
-    "elevenlabs": {
-        "name": "ElevenLabs",
-        "description": "AI voice synthesis service",
-        "requires_internet": True,
-        "supported_languages": ["en", "es", "fr", "de", "it", "pt", "pl", "hi"],
-        "quality": "very_high",
-        "speed": "medium"
-    }
+def _build_tts_engines():
+    """Text-to-speech engine metadata, built on first access to TTS_ENGINES"""
+    return _interned({
+        "pyttsx3": {
+            "name": "PyTTSx3",
+            "description": "Offline text-to-speech engine",
+            "requires_internet": False,
+            "supported_languages": ["en", "es", "fr", "de", "it", "pt", "ru"],
+            "quality": "medium",
+            "speed": "fast"
+        },
+        "gtts": {
+            "name": "Google Text-to-Speech",
+            "description": "Google's cloud TTS service",
+            "requires_internet": True,
+            "supported_languages": _ALL_LANG_CODES,
+            "quality": "high",
+            "speed": "medium"
+        },
+        "azure": {
+            "name": "Azure Speech Services",
+            "description": "Microsoft's cloud TTS service",
+            "requires_internet": True,
+            "supported_languages": _ALL_LANG_CODES,
+            "quality": "high",
+            "speed": "fast"
+        },
+        "elevenlabs": {
+            "name": "ElevenLabs",
+            "description": "AI voice synthesis service",
+            "requires_internet": True,
+            "supported_languages": ["en", "es", "fr", "de", "it", "pt", "pl", "hi"],
+            "quality": "very_high",
+            "speed": "medium"
+        }
+    })
+
+
+# Service tables a run only looks at once an engine is picked
+_LAZY_TABLES = {
+    "RECOGNITION_ENGINES": _build_recognition_engines,
+    "TRANSLATION_SERVICES": _build_translation_services,
+    "TTS_ENGINES": _build_tts_engines,
 }
 
+
+def __getattr__(name):
+    """Build a lazily constructed service table on first access"""
+    builder = _LAZY_TABLES.get(name)
+    if builder is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    # Cache as a real module global so later lookups skip this hook
+    table = globals().setdefault(name, builder())
+    return table
+
+
+def __dir__():
+    """Include the lazy service tables in dir()"""
+    return sorted(set(globals()) | set(_LAZY_TABLES))
+
+
 # Default Hotkeys
-DEFAULT_HOTKEYS = {
+DEFAULT_HOTKEYS = _interned({
     "toggle_listening": "ctrl+l",
     "toggle_overlay": "ctrl+o",
     "translate_and_speak": "ctrl+t",
@@ -252,10 +331,10 @@ DEFAULT_HOTKEYS = {
     "save_session": "ctrl+s",
     "load_session": "ctrl+shift+o",
     "hide_overlay": "escape"
-}
+})
 
 # File Paths and Directories
-PATHS = {
+PATHS = MappingProxyType({
     "USER_DATA_DIR": "~/.gaming_translator",
     "CONFIG_DIR": "~/.gaming_translator",
     "LOGS_DIR": "~/.gaming_translator/logs",
@@ -263,29 +342,29 @@ PATHS = {
     "CACHE_DIR": "~/.gaming_translator/cache",
     "MODELS_DIR": "~/.gaming_translator/models",
     "TEMP_DIR": "~/.gaming_translator/temp"
-}
+})
 
 # Network Configuration
-NETWORK_CONFIG = {
+NETWORK_CONFIG = MappingProxyType({
     "REQUEST_TIMEOUT": 10,  # seconds
     "MAX_RETRIES": 3,
     "RETRY_DELAY": 1,  # seconds
     "USER_AGENT": f"{APP_NAME}/{APP_VERSION}",
     "LIBRE_TRANSLATE_URL": "https://libretranslate.de/translate",
-    "BACKUP_LIBRE_URLS": [
+    "BACKUP_LIBRE_URLS": (
         "https://translate.argosopentech.com/translate",
         "https://libretranslate.com/translate"
-    ]
-}
+    )
+})
 
 # Performance Thresholds
-PERFORMANCE_THRESHOLDS = {
+PERFORMANCE_THRESHOLDS = MappingProxyType({
     "RECOGNITION_WARNING_TIME": 5.0,  # seconds
     "TRANSLATION_WARNING_TIME": 3.0,  # seconds
     "TTS_WARNING_TIME": 2.0,  # seconds
     "MAX_MEMORY_USAGE": 512,  # MB
     "MAX_CACHE_SIZE": 100,  # MB
-}
+})
 
 # Gaming-specific Terms and Phrases
 GAMING_PHRASES = {
@@ -312,8 +391,15 @@ GAMING_PHRASES = {
     ]
 }
 
+# Frozen views of GAMING_PHRASES, prefer these for "in" checks
+GAMING_PHRASES_SETS = {
+    category: frozenset(sys.intern(phrase) for phrase in phrases)
+    for category, phrases in GAMING_PHRASES.items()
+}
+ALL_GAMING_PHRASES = frozenset().union(*GAMING_PHRASES_SETS.values())
+
 # Error Messages
-ERROR_MESSAGES = {
+ERROR_MESSAGES = _interned({
     "NO_MICROPHONE": "No microphone detected. Please check your audio devices.",
     "RECOGNITION_FAILED": "Speech recognition failed. Please try again.",
     "TRANSLATION_FAILED": "Translation service unavailable. Check internet connection.",
@@ -329,10 +415,10 @@ ERROR_MESSAGES = {
     "UNSUPPORTED_LANGUAGE": "Language not supported by selected service.",
     "AUDIO_DEVICE_ERROR": "Audio device error. Please check connections.",
     "DEPENDENCY_MISSING": "Required dependency missing. Check installation.",
-}
+})
 
 # Success Messages
-SUCCESS_MESSAGES = {
+SUCCESS_MESSAGES = _interned({
     "SESSION_SAVED": "Session saved successfully.",
     "SESSION_LOADED": "Session loaded successfully.",
     "SESSION_EXPORTED": "Session exported successfully.",
@@ -344,10 +430,10 @@ SUCCESS_MESSAGES = {
     "TTS_SUCCESS": "Text-to-speech completed.",
     "OVERLAY_SHOWN": "Game overlay activated.",
     "OVERLAY_HIDDEN": "Game overlay hidden.",
-}
+})
 
 # Window and UI Configuration
-UI_CONFIG = {
+UI_CONFIG = MappingProxyType({
     "MIN_WINDOW_WIDTH": 800,
     "MIN_WINDOW_HEIGHT": 600,
     "DEFAULT_WINDOW_WIDTH": 900,
@@ -356,51 +442,51 @@ UI_CONFIG = {
     "OVERLAY_MIN_HEIGHT": 200,
     "OVERLAY_DEFAULT_WIDTH": 400,
     "OVERLAY_DEFAULT_HEIGHT": 300,
-    "FONT_SIZES": {
+    "FONT_SIZES": MappingProxyType({
         "small": 8,
         "normal": 10,
         "large": 12,
         "xlarge": 14,
         "title": 18
-    },
-    "MARGINS": {
+    }),
+    "MARGINS": MappingProxyType({
         "small": 5,
         "normal": 10,
         "large": 15,
         "xlarge": 20
-    }
-}
+    })
+})
 
 # Session Configuration
-SESSION_CONFIG = {
+SESSION_CONFIG = MappingProxyType({
     "MAX_MESSAGES": 1000,
     "AUTO_SAVE_INTERVAL": 300,  # seconds
     "MESSAGE_FADE_TIME": 10,  # seconds for overlay
     "MAX_OVERLAY_MESSAGES": 5,
     "CONVERSATION_HISTORY_LIMIT": 100
-}
+})
 
 # Cache Configuration
-CACHE_CONFIG = {
+CACHE_CONFIG = MappingProxyType({
     "TRANSLATION_CACHE_SIZE": 1000,
     "TTS_CACHE_SIZE": 100,
     "CACHE_EXPIRY_DAYS": 30,
     "ENABLE_DISK_CACHE": True,
     "CACHE_COMPRESSION": True
-}
+})
 
 # Development and Debug
-DEBUG_CONFIG = {
+DEBUG_CONFIG = MappingProxyType({
     "ENABLE_DEBUG_MODE": False,
     "LOG_AUDIO_LEVELS": False,
     "LOG_NETWORK_REQUESTS": False,
     "SAVE_RAW_AUDIO": False,
     "PERFORMANCE_MONITORING": True,
     "MEMORY_MONITORING": False
-}
+})
 
 # Version Information
-VERSION_INFO = {
+VERSION_INFO = MappingProxyType({
     "MAJOR": 2,
     "MINOR": 0,
     "PATCH": 0,
@@ -408,10 +494,10 @@ VERSION_INFO = {
     "RELEASE_DATE": "2024-12-19",
     "PYTHON_MIN_VERSION": "3.8",
     "PYTHON_RECOMMENDED": "3.11"
-}
+})
 
 # Feature Flags
-FEATURES = {
+FEATURES = MappingProxyType({
     "WHISPER_SUPPORT": True,
     "AZURE_SUPPORT": True,
     "LIBRE_TRANSLATE": True,
@@ -424,4 +510,4 @@ FEATURES = {
     "ECHO_CANCELLATION": False,  # Experimental
     "REAL_TIME_TRANSLATION": True,
     "CONVERSATION_HISTORY": True
-}
\ No newline at end of file
+})
\ No newline at end of file
@@ -5,20 +5,60 @@ Provides centralized logging configuration with file and console output
 
 import os
 import sys
+import time
+import queue
+import atexit
 import logging
 import logging.handlers
+from functools import lru_cache
 from pathlib import Path
-from datetime import datetime
 from typing import Optional
 
 
+_LOGGER_PREFIX = sys.intern("gaming_translator.")
+_BANNER = "=" * 50
+
+# Background thread that writes queued records to the real handlers
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _stop_listener():
+    """Flush and stop the background log writer, if one is running"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+atexit.register(_stop_listener)
+
+# Set logging level for third-party libraries to reduce noise
+logging.getLogger("urllib3").setLevel(logging.WARNING)
+logging.getLogger("requests").setLevel(logging.WARNING)
+logging.getLogger("matplotlib").setLevel(logging.WARNING)
+logging.getLogger("PIL").setLevel(logging.WARNING)
+
+# Record field switches as they were at import, fast_path=False puts them back
+_RECORD_FLAGS = {
+    "logThreads": logging.logThreads,
+    "logProcesses": logging.logProcesses,
+    "logMultiprocessing": logging.logMultiprocessing,
+}
+
+# Whether setup_logging has already written the startup banner
+_banner_logged = False
+
+
 def setup_logging(
     log_level: int = logging.INFO,
     log_file: Optional[Path] = None,
     console_logging: bool = True,
     file_logging: bool = True,
     max_bytes: int = 10 * 1024 * 1024,  # 10MB
-    backup_count: int = 5
+    backup_count: int = 5,
+    fast_path: bool = True
 ):
     """Setup application logging configuration
     
@@ -29,14 +69,18 @@ def setup_logging(
         file_logging: Enable file output
         max_bytes: Maximum log file size before rotation
         backup_count: Number of backup files to keep
+        fast_path: Skip collecting thread and process fields the formatter never uses
     """
+    global _listener, _banner_logged
     
     # Create root logger
     root_logger = logging.getLogger("gaming_translator")
     root_logger.setLevel(log_level)
     
     # Clear existing handlers
+    _stop_listener()
     root_logger.handlers.clear()
+    handlers = []
     
     # Create formatter
     formatter = logging.Formatter(
@@ -49,7 +93,7 @@ def setup_logging(
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(log_level)
         console_handler.setFormatter(formatter)
-        root_logger.addHandler(console_handler)
+        handlers.append(console_handler)
     
     # File handler
     if file_logging:
@@ -71,26 +115,36 @@ def setup_logging(
         )
         file_handler.setLevel(log_level)
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
     
-    # Set logging level for third-party libraries to reduce noise
-    logging.getLogger("urllib3").setLevel(logging.WARNING)
-    logging.getLogger("requests").setLevel(logging.WARNING)
-    logging.getLogger("matplotlib").setLevel(logging.WARNING)
-    logging.getLogger("PIL").setLevel(logging.WARNING)
+    # Hand records to a background thread so callers never wait on I/O
+    if handlers:
+        log_queue = queue.SimpleQueue()
+        root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        _listener = logging.handlers.QueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        _listener.start()
     
-    # Log startup message
+    # The format string only uses time, name, level and message
+    for flag, default in _RECORD_FLAGS.items():
+        setattr(logging, flag, False if fast_path else default)
+    
+    # Log startup message once, not on every reconfiguration
+    if _banner_logged:
+        return
+    _banner_logged = True
     logger = logging.getLogger("gaming_translator.logger")
-    logger.info("=" * 50)
-    logger.info("Gaming Voice Chat Translator - Logging Started")
-    logger.info(f"Log Level: {logging.getLevelName(log_level)}")
-    if file_logging and log_file:
-        logger.info(f"Log File: {log_file}")
-    logger.info(f"Python Version: {sys.version}")
-    logger.info(f"Platform: {sys.platform}")
-    logger.info("=" * 50)
+    logger.info(
+        "%s\nGaming Voice Chat Translator - Logging Started\nLog Level: %s\n"
+        "Log File: %s\nPython Version: %s\nPlatform: %s\n%s",
+        _BANNER, logging.getLevelName(log_level),
+        log_file if file_logging and log_file else "<none>",
+        sys.version, sys.platform, _BANNER
+    )
 
 
+@lru_cache(maxsize=None)
 def get_logger(name: str) -> logging.Logger:
     """Get a logger instance for a specific module
     
@@ -100,7 +154,7 @@ def get_logger(name: str) -> logging.Logger:
     Returns:
         Logger instance
     """
-    return logging.getLogger(f"gaming_translator.{name}")
+    return logging.getLogger(_LOGGER_PREFIX + name)
 
 
 def log_exception(logger: logging.Logger, message: str = "An exception occurred"):
@@ -122,27 +176,28 @@ def log_performance(logger: logging.Logger, operation: str, duration: float):
         duration: Duration in seconds
     """
     if duration > 1.0:
-        logger.warning(f"Slow operation: {operation} took {duration:.2f}s")
+        logger.warning("Slow operation: %s took %.2fs", operation, duration)
     else:
-        logger.debug(f"Performance: {operation} took {duration:.3f}s")
+        logger.debug("Performance: %s took %.3fs", operation, duration)
 
 
 class PerformanceTimer:
     """Context manager for timing operations"""
     
+    __slots__ = ("logger", "operation", "start_ns")
+    
     def __init__(self, logger: logging.Logger, operation: str):
         self.logger = logger
         self.operation = operation
-        self.start_time = None
+        self.start_ns = 0
     
     def __enter__(self):
-        self.start_time = datetime.now()
+        self.start_ns = time.perf_counter_ns()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if self.start_time:
-            duration = (datetime.now() - self.start_time).total_seconds()
-            log_performance(self.logger, self.operation, duration)
+        duration = (time.perf_counter_ns() - self.start_ns) / 1e9
+        log_performance(self.logger, self.operation, duration)
 
 
 def setup_debug_logging():